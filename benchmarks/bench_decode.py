@@ -0,0 +1,56 @@
+"""
+Compare TeliumResponse.decode against the lazy TeliumResponseView and the columnar paths.
+Usage: python -m benchmarks.bench_decode [number_of_frames]
+"""
+import sys
+from timeit import default_timer
+
+from telium import *
+from telium.columnar import decode_columns, numpy
+
+
+def archived_frames(number_of_frames):
+    """
+    Build a replay set mixing complete and limited answers.
+    """
+    frames = [
+        TeliumResponse('1', TERMINAL_PAYMENT_SUCCESS, 12.5, TERMINAL_MODE_PAYMENT_DEBIT, '4' * 16 + ' ' * 39,
+                       TERMINAL_NUMERIC_CURRENCY_EUR, '0' * 10).encode().encode(TERMINAL_DATA_ENCODING),
+        TeliumResponse('2', TERMINAL_PAYMENT_REJECTED, 91.1, TERMINAL_MODE_PAYMENT_DEBIT, None,
+                       TERMINAL_NUMERIC_CURRENCY_EUR, '0' * 10).encode().encode(TERMINAL_DATA_ENCODING)
+    ]
+    return [frames[i % 2] for i in range(number_of_frames)]
+
+
+def measure(label, function, frames):
+    start = default_timer()
+    function(frames)
+    elapsed = default_timer() - start
+    print('{0:<40} {1:>10.3f} s {2:>12.0f} frames/s'.format(label, elapsed, len(frames) / elapsed))
+    return elapsed
+
+
+def main(number_of_frames=100000):
+    frames = archived_frames(number_of_frames)
+
+    print('Decoding {0} archived frames'.format(number_of_frames))
+
+    measure('TeliumResponse.decode', lambda f: [TeliumResponse.decode(d) for d in f], frames)
+    measure('decode_many (lazy, has_succeeded only)',
+            lambda f: [v.has_succeeded for v in TeliumResponse.decode_many(f)], frames)
+    measure('decode_many (lazy, every field)',
+            lambda f: [(v.pos_number, v.transaction_result, v.amount, v.payment_mode, v.repport,
+                        v.currency_numeric, v.private) for v in TeliumResponse.decode_many(f)], frames)
+
+    if numpy is not None:
+        complete_frames = [frame for frame in frames if len(frame) == TERMINAL_ANSWER_COMPLETE_SIZE]
+        limited_frames = [frame for frame in frames if len(frame) == TERMINAL_ANSWER_LIMITED_SIZE]
+        buffers = b''.join(complete_frames), b''.join(limited_frames)
+
+        measure('decode_columns (numpy, contiguous)',
+                lambda f: (decode_columns(buffers[0]), decode_columns(buffers[1], TERMINAL_ANSWER_LIMITED_SIZE)),
+                frames)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,76 @@
+"""
+Measure "import telium" time in fresh interpreters, using python -X importtime.
+Usage: python -m benchmarks.bench_import [number_of_runs]
+"""
+import subprocess
+import sys
+
+IMPORT_TIME_TOP = 10
+
+
+def import_times(module='telium'):
+    """
+    Import module in a fresh interpreter.
+    :return: Cumulative import time in microseconds of every module imported, by module name.
+    :rtype: dict
+    """
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', 'import {0}'.format(module)],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    _, importtime_report = process.communicate()
+
+    if process.returncode != 0:
+        raise RuntimeError('Cannot import {0}: {1}'.format(module, importtime_report))
+
+    times = dict()
+
+    for line in importtime_report.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:  # Header line
+            continue
+
+    return times
+
+
+def import_benchmark(number_of_runs=10, module='telium'):
+    """
+    :return: Best and median cumulative import time in milliseconds, and heaviest dependencies of the best run.
+    :rtype: dict
+    """
+    if sys.version_info < (3, 7):
+        raise RuntimeError('python -X importtime require Python 3.7 or later.')
+
+    runs = sorted((import_times(module) for _ in range(number_of_runs)), key=lambda times: times[module])
+
+    best = runs[0]
+
+    return {
+        'runs': number_of_runs,
+        'best_ms': best[module] / 1e3,
+        'median_ms': runs[len(runs) // 2][module] / 1e3,
+        'heaviest_ms': dict(
+            (name, cumulative / 1e3) for name, cumulative in sorted(
+                best.items(), key=lambda item: item[1], reverse=True
+            )[1:IMPORT_TIME_TOP + 1]
+        )
+    }
+
+
+def main(number_of_runs=10):
+    report = import_benchmark(number_of_runs)
+
+    print('import telium, best of {0} runs: {1:.1f} ms (median {2:.1f} ms)'.format(
+        number_of_runs, report['best_ms'], report['median_ms']))
+
+    for name, cumulative in sorted(report['heaviest_ms'].items(), key=lambda item: item[1], reverse=True):
+        print('    {0:<40} {1:>8.1f} ms'.format(name, cumulative))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,48 @@
+"""
+Compare byte by byte LRC against word-wide folding, running checksum and bulk verification.
+Usage: python -m benchmarks.bench_lrc [number_of_frames]
+"""
+import sys
+from functools import reduce
+from operator import xor
+from timeit import default_timer
+
+from telium import *
+from telium.columnar import numpy
+from telium.lrc import lrc, lrc_check_many, LrcAccumulator
+
+
+def measure(label, function, number_of_frames):
+    start = default_timer()
+    function()
+    elapsed = default_timer() - start
+    print('{0:<40} {1:>10.3f} s {2:>12.0f} frames/s'.format(label, elapsed, number_of_frames / elapsed))
+    return elapsed
+
+
+def main(number_of_frames=100000):
+    frame = TeliumResponse('1', TERMINAL_PAYMENT_SUCCESS, 12.5, TERMINAL_MODE_PAYMENT_DEBIT, '4' * 16 + ' ' * 39,
+                           TERMINAL_NUMERIC_CURRENCY_EUR, '0' * 10).encode().encode(TERMINAL_DATA_ENCODING)
+    frames = [frame] * number_of_frames
+    buffer = frame * number_of_frames
+
+    print('Verifying LRC of {0} frames of {1} octets'.format(number_of_frames, len(frame)))
+
+    measure('reduce(xor, ...) byte by byte',
+            lambda: [reduce(xor, bytearray(f[1:-1])) == bytearray(f)[-1] for f in frames], number_of_frames)
+    measure('lrc word-wide folding', lambda: [lrc(memoryview(f)[1:]) == 0 for f in frames], number_of_frames)
+
+    def running():
+        my_accumulator = LrcAccumulator()
+        for f in frames:
+            my_accumulator.reset()
+            my_accumulator.update(f[1:41])
+            my_accumulator.update(f[41:])
+
+    measure('LrcAccumulator, two chunks per frame', running, number_of_frames)
+    measure('lrc_check_many ({0})'.format('numpy' if numpy is not None else 'pure python'),
+            lambda: lrc_check_many(buffer, len(frame)), number_of_frames)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
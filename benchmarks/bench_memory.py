@@ -0,0 +1,53 @@
+"""
+Compare memory footprint and attribute access of TeliumResponse against FrozenTeliumResponse.
+Usage: python -m benchmarks.bench_memory [number_of_objects]
+"""
+import gc
+import sys
+import tracemalloc
+from timeit import default_timer
+
+from telium import *
+
+
+def build(number_of_objects, frozen):
+    """
+    Keep number_of_objects responses alive, like an end-of-day settlement would.
+    """
+    # Field values are shared between objects so that only the per object overhead is measured.
+    fields = TeliumResponse('1', TERMINAL_PAYMENT_SUCCESS, 12.5, TERMINAL_MODE_PAYMENT_DEBIT, '0' * 55,
+                            TERMINAL_NUMERIC_CURRENCY_EUR, '0' * 10).freeze()
+
+    if frozen:
+        return [FrozenTeliumResponse(*fields) for _ in range(number_of_objects)]
+
+    return [fields.thaw() for _ in range(number_of_objects)]
+
+
+def measure(label, number_of_objects, frozen):
+    gc.collect()
+    tracemalloc.start()
+
+    answers = build(number_of_objects, frozen)
+    current, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    start = default_timer()
+    for answer in answers:
+        answer.amount, answer.private, answer.transaction_result
+    elapsed = default_timer() - start
+
+    print('{0:<24} {1:>10.1f} MiB {2:>8.1f} B/object {3:>8.3f} s attribute access'.format(
+        label, current / 1048576.0, current / float(number_of_objects), elapsed))
+
+
+def main(number_of_objects=1000000):
+    print('Keeping {0} responses in memory'.format(number_of_objects))
+
+    measure('TeliumResponse', number_of_objects, frozen=False)
+    measure('FrozenTeliumResponse', number_of_objects, frozen=True)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,186 @@
+"""
+Benchmark suite of encode, decode, LRC, import time and full ask/verify round-trip over a simulated terminal.
+Results are written as JSON so that releases can be compared against each other.
+Usage: python -m benchmarks.suite [--output results.json] [--compare previous.json] [--transactions 500]
+"""
+import argparse
+import json
+import platform
+import sys
+from time import time
+from timeit import default_timer, repeat
+
+from benchmarks.bench_import import import_benchmark
+from telium import *
+from telium.encoder import AskEncoder, encode_ask
+from telium.payment import TeliumData
+from telium.tracing import ByteRing
+from telium.version import __version__
+
+BENCHMARK_REPEAT = 5
+
+
+def _payment():
+    return TeliumAsk.new_payment(12.5, target_currency='EUR', collect_payment_source_info=True)
+
+
+def _answer():
+    return TeliumResponse('1', TERMINAL_PAYMENT_SUCCESS, 12.5, TERMINAL_MODE_PAYMENT_DEBIT, '4' * 16 + ' ' * 39,
+                          TERMINAL_NUMERIC_CURRENCY_EUR, '0' * 10)
+
+
+def micro_benchmarks(number):
+    """
+    Time every micro path, best of BENCHMARK_REPEAT runs of number calls.
+    :param int number: Calls per run
+    :return: Nanoseconds per call by benchmark name
+    :rtype: dict
+    """
+    my_payment, my_answer = _payment(), _answer()
+    encoded_answer = my_answer.encode().encode(TERMINAL_DATA_ENCODING)
+    lrc_payload = encoded_answer[1:-1]
+    my_encoder = AskEncoder.from_ask(my_payment)
+    my_ring = ByteRing()
+
+    paths = [
+        ('TeliumAsk.encode', my_payment.encode),
+        ('encode_ask', lambda: encode_ask(my_payment)),
+        ('AskEncoder.encode', lambda: my_encoder.encode(12.5, '1')),
+        ('TeliumResponse.encode', my_answer.encode),
+        ('TeliumResponse.decode', lambda: TeliumResponse.decode(encoded_answer)),
+        ('TeliumResponse.decode_view', lambda: TeliumResponse.decode_view(encoded_answer).has_succeeded),
+        ('TeliumData.lrc', lambda: TeliumData.lrc(lrc_payload)),
+        ('TeliumData.lrc_check', lambda: TeliumData.lrc_check(encoded_answer)),
+        ('ByteRing.append', lambda: my_ring.append(JOURNAL_DIRECTION_IN, encoded_answer)),
+    ]
+
+    results = dict()
+
+    for name, function in paths:
+        best = min(repeat(function, number=number, repeat=BENCHMARK_REPEAT))
+        results[name] = {'ns_per_call': best / number * 1e9, 'calls': number}
+
+    return results
+
+
+def _percentile(sorted_values, ratio):
+    return sorted_values[min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))]
+
+
+def round_trip_benchmark(transactions):
+    """
+    Run transactions ask then verify exchanges against a simulated terminal over a pseudo-terminal.
+    :param int transactions: Number of exchanges
+    :return: Latency percentiles in milliseconds and throughput in transactions per second
+    :rtype: dict
+    """
+    from telium.simulator import TerminalSimulator
+
+    latencies = []
+
+    with TerminalSimulator(1) as my_simulator:
+        my_telium_instance = Telium(my_simulator.paths[0], timeout=1)
+        my_payment = _payment()
+
+        start = default_timer()
+
+        for _ in range(transactions):
+            exchange_start = default_timer()
+
+            if not my_telium_instance.ask(my_payment) or my_telium_instance.verify(my_payment, 5) is None:
+                raise IOError('Simulated terminal did not complete exchange.')
+
+            latencies.append(default_timer() - exchange_start)
+
+        elapsed = default_timer() - start
+
+        my_telium_instance.close()
+
+    latencies.sort()
+
+    return {
+        'transactions': transactions,
+        'throughput_tps': transactions / elapsed,
+        'latency_ms': {
+            'min': latencies[0] * 1e3,
+            'p50': _percentile(latencies, 0.50) * 1e3,
+            'p90': _percentile(latencies, 0.90) * 1e3,
+            'p99': _percentile(latencies, 0.99) * 1e3,
+            'max': latencies[-1] * 1e3
+        }
+    }
+
+
+def run(number=20000, transactions=500):
+    """
+    Run the whole suite.
+    :rtype: dict
+    """
+    report = {
+        'version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': time(),
+        'micro': micro_benchmarks(number),
+    }
+
+    if transactions > 0:
+        report['round_trip'] = round_trip_benchmark(transactions)
+
+    if sys.version_info >= (3, 7):
+        report['import'] = import_benchmark()
+
+    return report
+
+
+def compare(report, previous):
+    """
+    Print ratio of every measure against a previous report, above 1.0 means slower than before.
+    """
+    print('Comparing {0} against {1}'.format(report['version'], previous['version']))
+
+    for name, result in sorted(report['micro'].items()):
+        if name in previous.get('micro', dict()):
+            print('{0:<32} {1:>10.0f} ns {2:>8.2f}x'.format(
+                name, result['ns_per_call'], result['ns_per_call'] / previous['micro'][name]['ns_per_call']))
+
+    if 'import' in report and 'import' in previous:
+        print('{0:<32} {1:>10.1f} ms {2:>8.2f}x'.format(
+            'import telium', report['import']['best_ms'], report['import']['best_ms'] / previous['import']['best_ms']))
+
+    if 'round_trip' in report and 'round_trip' in previous:
+        for key in ('p50', 'p99'):
+            print('{0:<32} {1:>10.3f} ms {2:>8.2f}x'.format(
+                'round_trip ' + key, report['round_trip']['latency_ms'][key],
+                report['round_trip']['latency_ms'][key] / previous['round_trip']['latency_ms'][key]))
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='pyTeliumManager benchmark suite')
+    parser.add_argument('--output', help='Write JSON report to this file instead of stdout')
+    parser.add_argument('--compare', help='Previous JSON report to compare against')
+    parser.add_argument('--number', type=int, default=20000, help='Calls per micro benchmark run')
+    parser.add_argument('--transactions', type=int, default=500,
+                        help='Round-trip exchanges against simulated terminal, 0 to skip')
+
+    options = parser.parse_args(arguments)
+
+    report = run(options.number, options.transactions)
+
+    if options.output:
+        with open(options.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print('')
+
+    if options.compare:
+        with open(options.compare, 'r') as previous:
+            compare(report, json.load(previous))
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
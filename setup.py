@@ -38,8 +38,12 @@ setup(
         'pyserial>=3.3',
         'pycountry>=17.0,<18.5.20',
         'payment_card_identifier>=0.1.2',
-        'six'
+        'six',
+        'futures; python_version < "3.0"'
     ],
+    extras_require={
+        'columnar': ['numpy']
+    },
     tests_require=['Faker', 'pytest'],
     keywords=['ingenico', 'telium manager', 'telium', 'payment', 'credit card', 'debit card', 'visa', 'mastercard',
               'merchant', 'pos'],
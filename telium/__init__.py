@@ -1,4 +1,34 @@
 from telium.constant import *
-from telium.payment import TeliumAsk, TeliumResponse, LrcChecksumException, SequenceDoesNotMatchLengthException
+from telium.payment import TeliumAsk, TeliumResponse, TeliumResponseView, FrozenTeliumAsk, FrozenTeliumResponse, \
+    LrcChecksumException, SequenceDoesNotMatchLengthException
+from telium.decoder import FrameDecoder
+from telium.encoder import AskEncoder, encode_ask
+from telium.lrc import LrcAccumulator, lrc_check_many
+from telium.tracing import ProtocolTracer, TraceRecord, ByteRing
+from telium.cancellation import CancellationToken
+from telium.retry import RetryPolicy
+from telium.health import HealthMonitor, TerminalHealth
+from telium.discovery import discover, DiscoveredTerminal
+from telium.negotiation import negotiate, open_negotiated, LinkCache
+from telium.journal import TransactionJournal, JournalRecord, JournalCorruptedException, JOURNAL_DIRECTION_OUT, \
+    JOURNAL_DIRECTION_IN, JOURNAL_FRAME_SIZE
 from telium.manager import *
+from telium.pool import TerminalPool, PoolTerminal, TerminalPoolEmptyException
 from telium.version import __version__, VERSION
+
+import sys
+
+import six
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        # asyncio is only loaded by processes that actually use AsyncTelium.
+        if name == 'AsyncTelium':
+            from telium.aio import AsyncTelium
+            return AsyncTelium
+        raise AttributeError("module 'telium' has no attribute '{0}'".format(name))
+
+    # Same names as without __all__, plus AsyncTelium that is resolved on demand.
+    __all__ = [name for name in dir() if not name.startswith('_')] + ['AsyncTelium']
+elif six.PY3:
+    from telium.aio import AsyncTelium
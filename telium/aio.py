@@ -0,0 +1,401 @@
+import asyncio
+
+from serial import EIGHTBITS, PARITY_NONE, STOPBITS_ONE
+
+from telium.constant import *
+from telium.decoder import FrameDecoder
+from telium.encoder import encode_ask
+from telium.payment import LrcChecksumException, SequenceDoesNotMatchLengthException
+from telium.instrumentation import OPERATION_IS_OK, OPERATION_ASK, OPERATION_VERIFY, PHASE_HANDSHAKE, PHASE_WRITE, \
+    PHASE_WAIT, PHASE_READ, PHASE_EOT
+from telium.manager import Telium, TerminalSerialLinkClosedException, TerminalInitializationFailedException, \
+    TerminalUnexpectedAnswerException, TerminalBusyException
+
+
+class AsyncTelium(Telium):
+    """
+    Telium device driven from an asyncio event loop.
+    Reads never block the loop, they wait for the serial file descriptor to become readable.
+    Only available on POSIX platforms where pySerial expose a real file descriptor.
+    """
+
+    def __init__(self,
+                 path='/dev/ttyACM0',
+                 baudrate=9600,
+                 bytesize=EIGHTBITS,
+                 parity=PARITY_NONE,
+                 stopbits=STOPBITS_ONE,
+                 timeout=1,
+                 open_on_create=True,
+                 debugging=False,
+                 journal=None,
+                 observer=None,
+                 tracer=None,
+                 retry_policy=None):
+        """
+        Create asyncio Telium device instance
+        :param str path: str Path to serial emulated device
+        :param int baudrate: Set baud rate
+        :param int timeout: Maximum delai before hanging out when waiting for a signal.
+        :param bool open_on_create: Define if device has to be opened on instance creation
+        :param bool debugging: Enable print device <-> host com trace. (stdout)
+        :param telium.TransactionJournal journal: Record every payment frame sent and answer received if set.
+        :param telium.instrumentation.TeliumObserver observer: Notified of every protocol phase if set.
+        :param telium.tracing.ProtocolTracer tracer: Keep and log every byte exchanged if set, implied by debugging.
+        :param telium.RetryPolicy retry_policy: Retransmit frames refused with NAK and refuse corrupted answers if set.
+        """
+        super(AsyncTelium, self).__init__(
+            path,
+            baudrate=baudrate,
+            bytesize=bytesize,
+            parity=parity,
+            stopbits=stopbits,
+            timeout=0,
+            open_on_create=open_on_create,
+            debugging=debugging,
+            journal=journal,
+            observer=observer,
+            tracer=tracer,
+            retry_policy=retry_policy
+        )
+
+        # pySerial device stays in non-blocking mode, our own timeout is enforced on the event loop.
+        self._device_timeout = timeout
+        self._lock = None
+
+    @property
+    def timeout(self):
+        """
+        Get current timeout value used while waiting for a signal
+        :return: Current timeout setting
+        :rtype: float
+        """
+        return self._device_timeout
+
+    @timeout.setter
+    def timeout(self, new_timeout):
+        self._device_timeout = new_timeout
+
+    @property
+    def lock(self):
+        """
+        Lock held during a whole exchange so that two coroutines never interleave on the same link.
+        :rtype: asyncio.Lock
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _readable(self, timeout):
+        """
+        Wait until serial file descriptor has something to read.
+        :param float timeout: Maximum delay in seconds
+        :return: True if device became readable before timeout
+        :rtype: bool
+        """
+        loop = asyncio.get_event_loop()
+        readable = loop.create_future()
+        file_descriptor = self._device.fileno()
+
+        def on_readable():
+            if not readable.done():
+                readable.set_result(True)
+
+        loop.add_reader(file_descriptor, on_readable)
+
+        try:
+            await asyncio.wait_for(readable, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(file_descriptor)
+
+        return True
+
+    async def _read(self, size, timeout):
+        """
+        Read up to size bytes from device without blocking event loop.
+        :param int size: Number of bytes expected
+        :param float timeout: Maximum delay in seconds before returning what have been read so far
+        :return: Bytes read, could be shorter than requested size
+        :rtype: bytes
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        buffer = bytearray()
+
+        while len(buffer) < size:
+            chunk = self._device.read(size - len(buffer))
+
+            if chunk:
+                buffer.extend(chunk)
+                continue
+
+            remaining = deadline - loop.time()
+
+            if remaining <= 0 or not await self._readable(remaining):
+                break
+
+        return bytes(buffer)
+
+    async def _wait_signal(self, signal, timeout=None):
+        """
+        Read one byte from serial device and compare to expected.
+        :param str signal: Expected signal name
+        :param float timeout: Custom delay in seconds, use instance timeout if not set
+        :return: True if received signal match
+        :rtype: bool
+        """
+        return self._check_signal(await self._read(1, self._device_timeout if timeout is None else timeout), signal)
+
+    async def _read_answer(self):
+        """
+        Download raw answer and convert it to TeliumResponse as soon as a complete frame is received.
+        :return: TeliumResponse
+        :raise: TerminalUnexpectedAnswerException If terminal stop sending before a complete frame is received.
+        :rtype: telium.TeliumResponse
+        """
+        decoder = FrameDecoder()
+
+        while True:
+            raw_data = await self._read(self._device.in_waiting or 1, self._device_timeout)
+            answers = self._feed_answer(decoder, raw_data)
+
+            if answers:
+                return answers[0]
+
+    async def _read_valid_answer(self):
+        """
+        Same as _read_answer, a corrupted answer is refused with NAK and read again if retry policy allow it.
+        :rtype: telium.TeliumResponse
+        """
+        retry = 0
+
+        while True:
+            try:
+                return await self._read_answer()
+            except (LrcChecksumException, SequenceDoesNotMatchLengthException):
+                if not self._refuse_answer(retry):
+                    raise
+                retry += 1
+
+    async def _collect_abandoned_answer(self):
+        """
+        Receive the answer of a transaction whose verify was cancelled, terminal won't accept anything else before.
+        Lock must be held.
+        :return: True if link is free for a new exchange, False if terminal did not answer within instance timeout.
+        :rtype: bool
+        """
+        if not self._answer_abandoned:
+            return True
+
+        if not await self._wait_signal('ENQ'):
+            return False
+
+        # Whatever happens next, this answer is over for terminal.
+        self._answer_abandoned = False
+        self._in_transaction = False
+
+        self._send_signal('ACK')
+        self._abandoned_answer = await self._read_valid_answer()
+        self._send_signal('ACK')
+        await self._wait_signal('EOT')
+
+        return True
+
+    async def _flush_raspberry_pi(self, raspberry_pi):
+        if raspberry_pi:
+            await self._read(1, 0.3)
+
+    def _abort(self):
+        """
+        Drop any pending byte so that the next exchange start from a clean link.
+        """
+        if self._device.is_open:
+            self._device.reset_input_buffer()
+
+    async def is_ok(self, raspberry_pi=False):
+        """
+        Should in theory return True if your device is ready to receive order. False otherwise.
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :return: True if device appear to be OK, false otherwise.
+        :rtype: bool
+        """
+        async with self.lock:
+            try:
+                await self._flush_raspberry_pi(raspberry_pi)
+
+                if not await self._collect_abandoned_answer():
+                    return False
+
+                with self._instrument(OPERATION_IS_OK) as exchange:
+                    self._send_signal('ENQ')
+
+                    if not await self._wait_signal('ACK'):
+                        exchange.phase(PHASE_HANDSHAKE, succeeded=False)
+                        return False
+
+                    exchange.phase(PHASE_HANDSHAKE)
+
+                    return self._send_signal('EOT')
+            except asyncio.CancelledError:
+                self._abort()
+                raise
+
+    async def ask(self, telium_ask, raspberry_pi=False):
+        """
+        Initialize payment to terminal
+        :param telium.TeliumAsk telium_ask: Payment info
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :return: True if device has accepted to begin a new transaction.
+        :raise: TerminalBusyException If terminal did not send yet the answer of a transaction whose verify was cancelled.
+        :rtype: bool
+        """
+        if not self.is_open:
+            raise TerminalSerialLinkClosedException("Your device isn\'t opened yet.")
+
+        async with self.lock:
+            try:
+                await self._flush_raspberry_pi(raspberry_pi)
+
+                if not await self._collect_abandoned_answer():
+                    raise self._with_records(TerminalBusyException(
+                        'Terminal on "{0}" is still processing a transaction whose verify was cancelled.'
+                        .format(self._path)))
+
+                with self._instrument(OPERATION_ASK) as exchange:
+                    retry = 0
+                    self._send_signal('ENQ')
+
+                    while not await self._wait_signal('ACK'):
+                        if not self._can_retry(retry):
+                            exchange.phase(PHASE_HANDSHAKE, succeeded=False)
+                            raise self._with_records(TerminalInitializationFailedException(
+                                "Payment terminal isn't ready to accept data from host. "
+                                "Check if terminal is properly configured or not busy."))
+
+                        await asyncio.sleep(self._retry_policy.backoff(retry))
+                        retry += 1
+                        self._send_signal('ENQ')
+
+                    exchange.phase(PHASE_HANDSHAKE)
+
+                    frame, retry = encode_ask(telium_ask), 0
+                    self._send_frame(frame)
+
+                    while not await self._wait_signal('ACK'):
+                        if not self._can_retry(retry):
+                            exchange.phase(PHASE_WRITE, succeeded=False)
+                            return False
+
+                        await asyncio.sleep(self._retry_policy.backoff(retry))
+                        retry += 1
+                        self._send_frame(frame)
+
+                    exchange.phase(PHASE_WRITE)
+
+                    self._send_signal('EOT')
+                    self._in_transaction = True
+
+                    return True
+            except asyncio.CancelledError:
+                self._abort()
+                raise
+
+    async def try_ask(self, telium_ask, raspberry_pi=False):
+        """
+        Same as ask but give up immediately if another coroutine is using the link.
+        :return: None if link is busy, True if device has accepted to begin a new transaction.
+        :rtype: bool|None
+        """
+        if self.lock.locked():
+            return None
+
+        return await self.ask(telium_ask, raspberry_pi)
+
+    async def verify(self, telium_ask, waiting_timeout=DELAY_TERMINAL_ANSWER_TRANSACTION, raspberry_pi=False):
+        """
+        Wait for answer and convert it for you. The event loop remain free while the customer is typing its PIN.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :param float waiting_timeout: Custom waiting delay in seconds before giving up on waiting ENQ signal.
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :return: TeliumResponse, None or Exception
+        :raise: asyncio.CancelledError If cancelled, an answer not started yet is received by the next exchange,
+            see abandoned_answer, or by calling verify again.
+        :rtype: telium.TeliumResponse|None
+        """
+        if not self.is_open:
+            raise TerminalSerialLinkClosedException("Your device isn\'t opened yet.")
+
+        Telium._answer_size(telium_ask)  # Reject unknown answer flag before waiting for terminal.
+
+        async with self.lock:
+            answering = False
+            self._answer_abandoned = False  # Waiting again after a cancellation.
+
+            try:
+                with self._instrument(OPERATION_VERIFY) as exchange:
+                    if not await self._wait_signal('ENQ', waiting_timeout):
+                        exchange.phase(PHASE_WAIT, succeeded=False)
+                        return None
+
+                    answering = True
+                    exchange.phase(PHASE_WAIT)
+
+                    self._send_signal('ACK')
+
+                    answer = await self._read_valid_answer()
+
+                    exchange.phase(PHASE_READ)
+
+                    self._send_signal('ACK')
+
+                    if not await self._wait_signal('EOT'):
+                        exchange.phase(PHASE_EOT, succeeded=False)
+
+                        if not raspberry_pi:
+                            raise self._with_records(TerminalUnexpectedAnswerException(
+                                "Terminal should have ended the communication with 'EOT'. "
+                                "Something's obviously wrong."))
+                    else:
+                        exchange.phase(PHASE_EOT)
+
+                    return answer
+            except asyncio.CancelledError:
+                if answering:
+                    self._abort()
+                else:
+                    # Terminal did not start to answer yet, it will anyway. Answer is received by the next exchange.
+                    self._answer_abandoned = True
+                raise
+            finally:
+                # Terminal is still busy with a cancelled transaction until its answer is received.
+                self._in_transaction = self._answer_abandoned
+
+    async def transact(self, telium_ask, waiting_timeout=DELAY_TERMINAL_ANSWER_TRANSACTION, raspberry_pi=False,
+                       callback=None):
+        """
+        Initialize payment then return as soon as terminal has acknowledged it, answer is awaited in a task.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :param float waiting_timeout: Custom waiting delay in seconds before giving up on waiting terminal answer.
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :param callable callback: Called with the task once done.
+        :return: Task resolved with TeliumResponse, or None if terminal refused the transaction or did not answer.
+        :raise: TerminalBusyException If a previous transaction is still awaiting its answer.
+        :rtype: asyncio.Future
+        """
+        if self.pending_transaction is not None:
+            raise TerminalBusyException('Terminal on "{0}" is still processing previous transaction.'
+                                        .format(self._path))
+
+        if await self.ask(telium_ask, raspberry_pi):
+            transaction = asyncio.ensure_future(self.verify(telium_ask, waiting_timeout, raspberry_pi))
+            self._transaction = transaction
+        else:
+            transaction = asyncio.get_event_loop().create_future()
+            transaction.set_result(None)
+
+        if callback is not None:
+            transaction.add_done_callback(callback)
+
+        return transaction
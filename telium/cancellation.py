@@ -0,0 +1,61 @@
+"""
+Cancellation of a pending wait for terminal answer from another thread.
+"""
+import os
+from threading import Event, Lock
+
+
+class CancellationToken(object):
+    """
+    Give it to Telium.verify or Telium.transact, then call cancel from any thread to stop waiting for terminal answer.
+    On POSIX, waits also watch a pipe owned by the token so that cancel wake them up immediately.
+    """
+
+    def __init__(self):
+        self._event = Event()
+        self._lock = Lock()
+        self._pipe = None
+
+    @property
+    def cancelled(self):
+        """
+        :rtype: bool
+        """
+        return self._event.is_set()
+
+    def cancel(self):
+        """
+        Request cancellation, every wait bound to this token give up as soon as possible.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+
+            self._event.set()
+
+            if self._pipe is not None:
+                os.write(self._pipe[1], b'\0')
+
+    def fileno(self):
+        """
+        :return: File descriptor that become readable once cancelled
+        :rtype: int
+        """
+        with self._lock:
+            if self._pipe is None:
+                self._pipe = os.pipe()
+
+                if self._event.is_set():
+                    os.write(self._pipe[1], b'\0')
+
+            return self._pipe[0]
+
+    def close(self):
+        with self._lock:
+            if self._pipe is not None:
+                for file_descriptor in self._pipe:
+                    os.close(file_descriptor)
+                self._pipe = None
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+from threading import Lock
+
+CARD_BIN_LENGTH = 6
+CARD_BRAND_CACHE_SIZE = 1024
+
+
+def _card_module():
+    """
+    Import payment_card_identifier on first identification only, most processes never identify a card.
+    :return: payment_card_identifier.card module, with every card brand defined.
+    """
+    import payment_card_identifier.card
+    return payment_card_identifier.card
+
+
+class CardBrandCache(object):
+    """
+    Bounded LRU cache of card brands matching a BIN prefix.
+    Every brand regex only depends on the first six digits and on the length of the card numbers,
+    so the regex scan over every brand is done once per (BIN, length) instead of once per card.
+    Luhn checksum is still verified for every card numbers.
+    """
+
+    def __init__(self, maxsize=CARD_BRAND_CACHE_SIZE):
+        """
+        :param int maxsize: Maximum number of (BIN, length) entries kept
+        """
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @staticmethod
+    def _candidates(numbers):
+        """
+        List every card brand whose regex match given numbers, whatever the Luhn checksum is.
+        :param str numbers: Card numbers
+        :rtype: tuple[type]
+        """
+        card_module = _card_module()
+        candidates = []
+
+        for card_type in card_module.PaymentCard.__subclasses__():
+            try:
+                card_type(numbers)
+            except card_module.LuhnChecksumDoesNotMatchException:
+                pass
+            except card_module.IllegalPaymentCardNumbers:
+                continue
+            candidates.append(card_type)
+
+        return tuple(candidates)
+
+    def brands(self, numbers):
+        """
+        Get card brands matching BIN prefix and length of given numbers.
+        :param str numbers: Card numbers
+        :rtype: tuple[type]
+        """
+        key = (numbers[:CARD_BIN_LENGTH], len(numbers), numbers.isdigit())
+
+        with self._lock:
+            candidates = self._entries.get(key)
+
+            if candidates is not None:
+                self._entries[key] = self._entries.pop(key)
+                self._hits += 1
+                return candidates
+
+            self._misses += 1
+
+        candidates = CardBrandCache._candidates(numbers)
+
+        with self._lock:
+            self._entries[key] = candidates
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return candidates
+
+    def identify(self, numbers):
+        """
+        Same as payment_card_identifier.CardIdentifier.from_numbers, using cached brands.
+        :param str numbers: Card numbers
+        :return: An VISA, MasterCard, Amex, etc.. instance, List of match or None.
+        :rtype: payment_card_identifier.PaymentCard|list|None
+        """
+        illegal_card_numbers = _card_module().IllegalPaymentCardNumbers
+        matchs = []
+
+        for card_type in self.brands(numbers):
+            try:
+                matchs.append(card_type(numbers))
+            except illegal_card_numbers:
+                pass
+
+        nb_match = len(matchs)
+
+        return matchs.pop() if nb_match == 1 else matchs if nb_match > 1 else None
+
+
+CARD_BRAND_CACHE = CardBrandCache()
+
+
+def identify_card(numbers):
+    """
+    Identify payment card from its numbers using the process wide CARD_BRAND_CACHE.
+    :param str numbers: Card numbers
+    :rtype: payment_card_identifier.PaymentCard|list|None
+    """
+    return CARD_BRAND_CACHE.identify(numbers)
@@ -0,0 +1,88 @@
+"""
+Vectorized batch decoding of archived terminal answers. Require numpy.
+"""
+from collections import namedtuple
+
+from telium.constant import *
+from telium.lrc import lrc_check_many
+from telium.payment import SequenceDoesNotMatchLengthException
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class TeliumResponseColumns(namedtuple('TeliumResponseColumns', ['pos_number', 'transaction_result', 'amount_cents',
+                                                                 'payment_mode', 'currency_numeric', 'private',
+                                                                 'bad'])):
+    """
+    Column arrays of N decoded answers, row i of every array belong to frame i.
+    pos_number, transaction_result, amount_cents and currency_numeric are integer arrays,
+    payment_mode and private are fixed size bytes arrays.
+    bad is a boolean mask of frames with erroned LRC or framing, their other columns should be ignored.
+    """
+
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self.bad)
+
+
+def _columns_offsets(frame_size):
+    """
+    :return: (currency_numeric, private) offsets in a framed answer of given size
+    """
+    if frame_size == TERMINAL_ANSWER_COMPLETE_SIZE:
+        return (68, 71), (71, 81)
+    elif frame_size == TERMINAL_ANSWER_LIMITED_SIZE:
+        return (13, 16), (16, 26)
+    raise SequenceDoesNotMatchLengthException('Cannot decode frames with length = {0}, '
+                                              'should be {1} octet(s) or {2} octet(s) long.'
+                                              .format(frame_size, TERMINAL_ANSWER_COMPLETE_SIZE,
+                                                      TERMINAL_ANSWER_LIMITED_SIZE))
+
+
+def _digits(frames, start, stop, dtype):
+    """
+    Parse fixed width ASCII digits of every frame at once.
+    """
+    weights = 10 ** numpy.arange(stop - start - 1, -1, -1, dtype=dtype)
+    return (frames[:, start:stop].astype(dtype) - 48).dot(weights)
+
+
+def decode_columns(buffer, frame_size=TERMINAL_ANSWER_COMPLETE_SIZE):
+    """
+    Decode a contiguous buffer of N same sized answers into column arrays.
+    :param bytes|bytearray|memoryview buffer: N framed answers STX..ETX.LRC laid out back to back
+    :param int frame_size: TERMINAL_ANSWER_COMPLETE_SIZE or TERMINAL_ANSWER_LIMITED_SIZE
+    :return: Decoded columns
+    :rtype: telium.columnar.TeliumResponseColumns
+    :raise: SequenceDoesNotMatchLengthException If buffer does not hold a whole number of frames
+    """
+    if numpy is None:
+        raise ImportError('numpy is required to decode answers in columns. Install it with "pip install numpy".')
+
+    (currency_start, currency_stop), (private_start, private_stop) = _columns_offsets(frame_size)
+
+    raw = numpy.frombuffer(buffer, dtype=numpy.uint8)
+
+    if raw.size % frame_size != 0:
+        raise SequenceDoesNotMatchLengthException('Cannot split {0} octet(s) into frames of {1} octet(s).'
+                                                  .format(raw.size, frame_size))
+
+    frames = raw.reshape(-1, frame_size)
+
+    bad = ~lrc_check_many(raw, frame_size)
+    bad |= frames[:, 0] != CONTROL_NAMES.index('STX')
+    bad |= frames[:, -2] != CONTROL_NAMES.index('ETX')
+
+    return TeliumResponseColumns(
+        pos_number=_digits(frames, 1, 3, numpy.uint8),
+        transaction_result=frames[:, 3] - numpy.uint8(48),
+        amount_cents=_digits(frames, 4, 12, numpy.int64),
+        payment_mode=numpy.ascontiguousarray(frames[:, 12:13]).view('S1').ravel(),
+        currency_numeric=_digits(frames, currency_start, currency_stop, numpy.uint16),
+        private=numpy.ascontiguousarray(frames[:, private_start:private_stop]).view('S10').ravel(),
+        bad=bad
+    )
@@ -1,4 +1,5 @@
 DELAY_TERMINAL_ANSWER_TRANSACTION = 120
+DELAY_TERMINAL_ANSWER_POLL_INTERVAL = 0.1  # Slice of a cancellable wait for terminal answer, in seconds
 
 TERMINAL_DATA_ENCODING = 'ASCII'
 
@@ -44,6 +45,8 @@ TERMINAL_ASK_REQUIRED_SIZE = 34
 TERMINAL_MAXIMAL_AMOUNT_REQUESTABLE = 99999.99
 TERMINAL_MINIMAL_AMOUNT_REQUESTABLE = 1.00
 TERMINAL_DECIMALS_ALLOWED = 2
+TERMINAL_MAXIMAL_AMOUNT_CENTS = 9999999
+TERMINAL_MINIMAL_AMOUNT_CENTS = 100
 
 TERMINAL_TRANSACTION_TYPES = {
     'debit': TERMINAL_MODE_PAYMENT_DEBIT,
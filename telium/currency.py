@@ -0,0 +1,189 @@
+"""
+ISO 4217 currencies. Alpha-3 codes are resolved from a built-in table so that pycountry,
+and its databases, are only loaded for codes missing from it.
+"""
+from threading import Lock
+
+# Generated from pycountry 18.2.23 currencies database.
+ISO4217_NUMERIC = {
+    'AED': '784', 'AFN': '971', 'ALL': '008', 'AMD': '051', 'ANG': '532', 'AOA': '973', 'ARS': '032', 'AUD': '036',
+    'AWG': '533', 'AZN': '944', 'BAM': '977', 'BBD': '052', 'BDT': '050', 'BGN': '975', 'BHD': '048', 'BIF': '108',
+    'BMD': '060', 'BND': '096', 'BOB': '068', 'BRL': '986', 'BSD': '044', 'BTN': '064', 'BWP': '072', 'BYN': '933',
+    'BZD': '084', 'CAD': '124', 'CDF': '976', 'CHF': '756', 'CLP': '152', 'CNY': '156', 'COP': '170', 'CRC': '188',
+    'CUC': '931', 'CUP': '192', 'CVE': '132', 'CZK': '203', 'DJF': '262', 'DKK': '208', 'DOP': '214', 'DZD': '012',
+    'EGP': '818', 'ERN': '232', 'ETB': '230', 'EUR': '978', 'FJD': '242', 'FKP': '238', 'GBP': '826', 'GEL': '981',
+    'GHS': '936', 'GIP': '292', 'GMD': '270', 'GNF': '324', 'GTQ': '320', 'GYD': '328', 'HKD': '344', 'HNL': '340',
+    'HRK': '191', 'HTG': '332', 'HUF': '348', 'IDR': '360', 'ILS': '376', 'INR': '356', 'IQD': '368', 'IRR': '364',
+    'ISK': '352', 'JMD': '388', 'JOD': '400', 'JPY': '392', 'KES': '404', 'KGS': '417', 'KHR': '116', 'KMF': '174',
+    'KPW': '408', 'KRW': '410', 'KWD': '414', 'KYD': '136', 'KZT': '398', 'LAK': '418', 'LBP': '422', 'LKR': '144',
+    'LRD': '430', 'LSL': '426', 'LYD': '434', 'MAD': '504', 'MDL': '498', 'MGA': '969', 'MKD': '807', 'MMK': '104',
+    'MNT': '496', 'MOP': '446', 'MRO': '478', 'MUR': '480', 'MVR': '462', 'MWK': '454', 'MXN': '484', 'MYR': '458',
+    'MZN': '943', 'NAD': '516', 'NGN': '566', 'NIO': '558', 'NOK': '578', 'NPR': '524', 'NZD': '554', 'OMR': '512',
+    'PAB': '590', 'PEN': '604', 'PGK': '598', 'PHP': '608', 'PKR': '586', 'PLN': '985', 'PYG': '600', 'QAR': '634',
+    'RON': '946', 'RSD': '941', 'RUB': '643', 'RWF': '646', 'SAR': '682', 'SBD': '090', 'SCR': '690', 'SDG': '938',
+    'SEK': '752', 'SGD': '702', 'SHP': '654', 'SLL': '694', 'SOS': '706', 'SRD': '968', 'SSP': '728', 'STD': '678',
+    'SVC': '222', 'SYP': '760', 'SZL': '748', 'THB': '764', 'TJS': '972', 'TMT': '934', 'TND': '788', 'TOP': '776',
+    'TRY': '949', 'TTD': '780', 'TWD': '901', 'TZS': '834', 'UAH': '980', 'UGX': '800', 'USD': '840', 'UYU': '858',
+    'UZS': '860', 'VEF': '937', 'VND': '704', 'VUV': '548', 'WST': '882', 'XAF': '950', 'XAG': '961', 'XAU': '959',
+    'XBA': '955', 'XBB': '956', 'XBC': '957', 'XBD': '958', 'XCD': '951', 'XDR': '960', 'XOF': '952', 'XPD': '964',
+    'XPF': '953', 'XPT': '962', 'XSU': '994', 'XTS': '963', 'XUA': '965', 'XXX': '999', 'YER': '886', 'ZAR': '710',
+    'ZMW': '967', 'ZWL': '932'
+}
+
+
+def _pycountry_lookup(**criteria):
+    """
+    Look a currency up in pycountry database, imported on first call.
+    :return: (alpha_3, numeric) or None if currency does not exist.
+    :rtype: tuple|None
+    """
+    from pycountry import currencies
+
+    try:
+        currency = currencies.get(**criteria)
+    except KeyError:  # Older pycountry raise instead of returning None
+        currency = None
+
+    return (currency.alpha_3, str(currency.numeric).zfill(3)) if currency is not None else None
+
+
+class CurrencyResolver(object):
+    """
+    Memoized index of currencies, alpha-3 to numeric and numeric to alpha-3, both in O(1).
+    Seeded with ISO4217_NUMERIC, codes missing from it are looked up once in pycountry then kept.
+    Could be restricted to the currencies a business actually accept.
+    """
+
+    def __init__(self, table=None):
+        """
+        :param dict table: Initial alpha-3 to numeric index, ISO4217_NUMERIC if not set.
+        """
+        self._lock = Lock()
+        self._numerics = dict(table if table is not None else ISO4217_NUMERIC)
+        self._alphas = dict((numeric, alpha_3) for alpha_3, numeric in self._numerics.items())
+        self._unknown = set()
+        self._accepted = None
+
+    def __len__(self):
+        return len(self._numerics)
+
+    @property
+    def accepted(self):
+        """
+        :return: Alpha-3 codes accepted if resolver is restricted, None otherwise.
+        :rtype: frozenset|None
+        """
+        return self._accepted
+
+    def _learn(self, found, missing):
+        with self._lock:
+            if found is None:
+                self._unknown.add(missing)
+                return
+            alpha_3, numeric = found
+            self._numerics[alpha_3] = numeric
+            self._alphas[numeric] = alpha_3
+
+    def _numeric(self, alpha_3):
+        numeric = self._numerics.get(alpha_3)
+
+        if numeric is None and alpha_3 not in self._unknown:
+            self._learn(_pycountry_lookup(alpha_3=alpha_3), alpha_3)
+            numeric = self._numerics.get(alpha_3)
+
+        return numeric
+
+    def numeric(self, alpha_3):
+        """
+        Resolve an alpha-3 currency code to its ISO 4217 numeric code.
+        :param str alpha_3: Currency code, eg. 'EUR', case insensitive
+        :return: Numeric code on three digits, eg. '978', None if currency does not exist or is not accepted.
+        :rtype: str|None
+        """
+        alpha_3 = alpha_3.upper()
+
+        if self._accepted is not None and alpha_3 not in self._accepted:
+            return None
+
+        return self._numeric(alpha_3)
+
+    def alpha(self, numeric):
+        """
+        Resolve an ISO 4217 numeric currency code, as found in terminal answers, back to its alpha-3 code.
+        :param str|int numeric: Numeric code, eg. '978'
+        :return: Alpha-3 code, eg. 'EUR', None if currency does not exist or is not accepted.
+        :rtype: str|None
+        """
+        numeric = str(numeric).zfill(3)
+        alpha_3 = self._alphas.get(numeric)
+
+        if alpha_3 is None and numeric not in self._unknown:
+            self._learn(_pycountry_lookup(numeric=numeric), numeric)
+            alpha_3 = self._alphas.get(numeric)
+
+        if alpha_3 is not None and self._accepted is not None and alpha_3 not in self._accepted:
+            return None
+
+        return alpha_3
+
+    def prewarm(self, alpha_3_codes=None):
+        """
+        Resolve currencies ahead of time so that no lookup ever reach pycountry on the checkout path.
+        :param list[str] alpha_3_codes: Currencies to resolve, every currency known by pycountry if not set.
+        :raise: KeyError If one of the currencies does not exist.
+        :return: self
+        :rtype: telium.currency.CurrencyResolver
+        """
+        if alpha_3_codes is None:
+            from pycountry import currencies
+
+            for currency in currencies:
+                self._learn((currency.alpha_3, str(currency.numeric).zfill(3)), None)
+
+            return self
+
+        for alpha_3 in alpha_3_codes:
+            if self._numeric(alpha_3.upper()) is None:
+                raise KeyError('"{cur}" is not available in pyCountry currencies list.'.format(cur=alpha_3))
+
+        return self
+
+    def restrict(self, alpha_3_codes=None):
+        """
+        Only accept given currencies, every other currency is resolved as None.
+        :param list[str] alpha_3_codes: Accepted currencies, lift restriction if not set.
+        :raise: KeyError If one of the currencies does not exist.
+        :return: self
+        :rtype: telium.currency.CurrencyResolver
+        """
+        if alpha_3_codes is None:
+            self._accepted = None
+            return self
+
+        self.prewarm(alpha_3_codes)
+        self._accepted = frozenset(alpha_3.upper() for alpha_3 in alpha_3_codes)
+
+        return self
+
+
+CURRENCY_RESOLVER = CurrencyResolver()
+
+
+def alpha_to_numeric(alpha_3):
+    """
+    Resolve an alpha-3 currency code using the process wide CURRENCY_RESOLVER.
+    :param str alpha_3: Currency code, eg. 'EUR', case insensitive
+    :return: Numeric code on three digits, eg. '978', None if currency does not exist or is not accepted.
+    :rtype: str|None
+    """
+    return CURRENCY_RESOLVER.numeric(alpha_3)
+
+
+def numeric_to_alpha(numeric):
+    """
+    Resolve an ISO 4217 numeric code using the process wide CURRENCY_RESOLVER.
+    :param str|int numeric: Numeric code, eg. '978'
+    :return: Alpha-3 code, eg. 'EUR', None if currency does not exist or is not accepted.
+    :rtype: str|None
+    """
+    return CURRENCY_RESOLVER.alpha(numeric)
@@ -0,0 +1,127 @@
+from telium.constant import *
+from telium.lrc import LrcAccumulator
+from telium.payment import TeliumResponse, LrcChecksumException, SequenceDoesNotMatchLengthException
+
+_STX = CONTROL_NAMES.index('STX')
+_ETX = CONTROL_NAMES.index('ETX')
+
+_STX_MARKER = bytearray([_STX])
+_ETX_MARKER = bytearray([_ETX])
+
+_WAIT_STX, _IN_FRAME, _WAIT_LRC = range(3)
+
+
+class FrameDecoder(object):
+    """
+    Push-style decoder for STX..ETX.LRC framed sequences.
+    Accept chunks of any size, bytes before STX are discarded and LRC is computed as bytes arrive.
+    """
+
+    def __init__(self, factory=TeliumResponse.decode, max_size=TERMINAL_ANSWER_COMPLETE_SIZE):
+        """
+        :param callable factory: Called with every complete frame, eg. TeliumResponse.decode or TeliumAsk.decode
+        :param int max_size: Maximum frame size including STX, ETX and LRC before giving up on current frame.
+        """
+        self._factory = factory
+        self._max_size = max_size
+        self._buffer = bytearray()
+        self._lrc = LrcAccumulator()
+        self._state = _WAIT_STX
+        self._last_frame = None
+
+    @property
+    def last_frame(self):
+        """
+        :return: Raw bytes of the last completed or rejected frame, None if there was none yet.
+            A frame rejected for exceeding max_size is truncated to what was received.
+        :rtype: bytes|None
+        """
+        return self._last_frame
+
+    @property
+    def in_frame(self):
+        """
+        :return: True if a frame has started but is not complete yet.
+        :rtype: bool
+        """
+        return self._state != _WAIT_STX
+
+    @property
+    def buffered(self):
+        """
+        :return: Number of bytes kept for the frame being received.
+        :rtype: int
+        """
+        return len(self._buffer)
+
+    def reset(self):
+        """
+        Drop frame being received if any.
+        """
+        self._buffer = bytearray()
+        self._lrc.reset()
+        self._state = _WAIT_STX
+
+    def feed(self, chunk):
+        """
+        Push raw bytes from terminal.
+        :param bytes chunk: Raw bytes, could contain a partial frame or many frames.
+        :return: Every frame completed by this chunk, converted using factory.
+        :rtype: list
+        :raise: LrcChecksumException If a completed frame does not match its LRC. Rest of chunk is dropped.
+        :raise: SequenceDoesNotMatchLengthException If a frame exceed max_size. Rest of chunk is dropped.
+        """
+        chunk = bytearray(chunk)
+        chunk_len = len(chunk)
+        position = 0
+        frames = []
+
+        while position < chunk_len:
+
+            if self._state == _WAIT_STX:
+                start = chunk.find(_STX_MARKER, position)
+
+                if start == -1:
+                    break
+
+                self._buffer.append(_STX)
+                self._state = _IN_FRAME
+                position = start + 1
+
+            elif self._state == _IN_FRAME:
+                stop = chunk.find(_ETX_MARKER, position)
+                segment = chunk[position:stop + 1 if stop != -1 else chunk_len]
+
+                self._buffer.extend(segment)
+                self._lrc.update(segment)
+
+                # A frame without ETX yet still need ETX and LRC, otherwise only LRC is missing.
+                if len(self._buffer) + (2 if stop == -1 else 1) > self._max_size:
+                    buffered = len(self._buffer)
+                    self._last_frame = bytes(self._buffer)
+                    self.reset()
+                    raise SequenceDoesNotMatchLengthException('Frame exceed {0} octet(s), already got {1} octet(s).'
+                                                              .format(self._max_size, buffered))
+
+                if stop == -1:
+                    break
+
+                self._state = _WAIT_LRC
+                position = stop + 1
+
+            else:
+                lrc = chunk[position]
+                position += 1
+
+                self._buffer.append(lrc)
+                frame, expected_lrc = bytes(self._buffer), self._lrc.value
+                self.reset()
+                self._last_frame = frame
+
+                if lrc != expected_lrc:
+                    raise LrcChecksumException('Cannot decode frame with erroned LRC check. '
+                                               'Have {0:02x} and expect {1:02x}.'.format(lrc, expected_lrc))
+
+                frames.append(self._factory(frame))
+
+        return frames
@@ -0,0 +1,238 @@
+"""
+Concurrent discovery of attached terminals. Every candidate serial device is probed at once with a short
+handshake, under one overall deadline, with each supported link parameters.
+"""
+import os
+from collections import namedtuple
+from glob import glob
+from threading import Thread, Lock, Event
+
+from serial import EIGHTBITS, PARITY_NONE, STOPBITS_ONE, PARITY_EVEN, SEVENBITS
+
+from telium.constant import *
+
+try:
+    from time import monotonic
+except ImportError:  # pragma: no cover
+    from time import time as monotonic
+
+DISCOVERY_PATTERNS = ('/dev/serial/by-id/*', '/dev/ttyACM*', '/dev/ttyUSB*', '/dev/tty.usbmodem*')
+
+DISCOVERY_DEADLINE = 2.0  # Seconds, whole discovery never last longer
+DISCOVERY_PROBE_TIMEOUT = 0.3  # Seconds waited for ACK, per link parameters
+DISCOVERY_STOP_INTERVAL = 0.05  # Seconds, how often a probe waiting for an answer check if discovery is over
+DISCOVERY_STOP_TIMEOUT = 1.0  # Seconds waited for probes to give up once discovery is over
+
+LINK_8N1 = '8N1'  # Telium over USB, Telium class
+LINK_7E1 = '7E1'  # Native serial port, TeliumNativeSerial class
+
+# Corrupted frame, wrong LRC, that a terminal always refuse with NAK. ENQ and ACK have an even number of set bits and
+# go through whatever parity both ends use, STX and NAK have an odd one and only go through if both ends agree on it.
+PARITY_PROBE_FRAME = bytes(bytearray([CONTROL_NAMES.index('STX'), CONTROL_NAMES.index('ETX'), 0x00]))
+
+# Probed in this order on every device, first one to answer wins.
+LINK_PARAMETERS = (
+    (LINK_8N1, EIGHTBITS, PARITY_NONE, STOPBITS_ONE),
+    (LINK_7E1, SEVENBITS, PARITY_EVEN, STOPBITS_ONE),
+)
+
+
+class DiscoveredTerminal(namedtuple('DiscoveredTerminal', ['path', 'device', 'link', 'baudrate', 'bytesize', 'parity',
+                                                           'stopbits', 'latency'])):
+    """
+    Terminal that answered the handshake.
+    path is the most stable path to the device (/dev/serial/by-id/ if any), device the path it resolve to,
+    link is LINK_8N1 or LINK_7E1 and latency the ENQ/ACK round-trip in seconds.
+    """
+
+    __slots__ = ()
+
+    def open(self, device_class=None, **kwargs):
+        """
+        Create a Telium instance with discovered link parameters.
+        :param type device_class: Telium or a subclass accepting link parameters, Telium if not set.
+        :param kwargs: Extra arguments given to Telium, eg. timeout or journal
+        :rtype: telium.Telium
+        """
+        if device_class is None:
+            from telium.manager import Telium as device_class
+
+        return device_class(self.path, baudrate=self.baudrate, bytesize=self.bytesize, parity=self.parity,
+                            stopbits=self.stopbits, **kwargs)
+
+
+def candidate_paths(patterns=DISCOVERY_PATTERNS):
+    """
+    List every serial device that could be a terminal, once per actual device.
+    A /dev/serial/by-id/ path is kept over the device it resolve to, it survive reboots and re-plugging.
+    :param tuple[str] patterns: Glob patterns, most stable first
+    :return: Sorted (path, device) list
+    :rtype: list[tuple[str, str]]
+    """
+    candidates = dict()
+
+    for pattern in patterns:
+        for path in sorted(glob(pattern)):
+            candidates.setdefault(os.path.realpath(path), path)
+
+    return sorted((path, device) for device, path in candidates.items())
+
+
+def _wait_probe_signal(telium, signal, stop=None):
+    """
+    Same as Telium._wait_signal with instance timeout, but give up as soon as stop is set.
+    :param telium.Telium telium: Device being probed, link lock must be held
+    :param str signal: Expected signal name
+    :param threading.Event stop: Set once discovery is over
+    :return: True if received signal match
+    :rtype: bool
+    """
+    if stop is None:
+        return telium._wait_signal(signal)
+
+    expires = monotonic() + telium.timeout
+
+    while True:
+        remaining = expires - monotonic()
+        one_byte_read = telium._read_within(1, max(0.0, min(DISCOVERY_STOP_INTERVAL, remaining)))
+
+        if one_byte_read or remaining <= DISCOVERY_STOP_INTERVAL or stop.is_set():
+            return telium._check_signal(one_byte_read, signal)
+
+
+def _probe_parity(telium, stop=None):
+    """
+    Handshake then send PARITY_PROBE_FRAME, terminal should refuse it with NAK.
+    Unlike a bare ENQ/ACK handshake, it fail if host and terminal disagree on parity, eg. 8N1 versus 7E1.
+    :param telium.Telium telium: Device opened with link parameters to check
+    :param threading.Event stop: Nothing more is written to device once it is set.
+    :return: True if terminal answered the handshake and refused the frame with NAK
+    :rtype: bool
+    """
+    def stopped():
+        return stop is not None and stop.is_set()
+
+    with telium.link_lock:
+        if stopped():
+            return False
+
+        telium._send_signal('ENQ')
+
+        if not _wait_probe_signal(telium, 'ACK', stop) or stopped():
+            return False
+
+        telium._send(PARITY_PROBE_FRAME)
+        refused = _wait_probe_signal(telium, 'NAK', stop)
+
+        if stopped():
+            return False
+
+        telium._send_signal('EOT')
+
+        return refused
+
+
+def _probe(path, device, baudrates, link_parameters, probe_timeout, device_class=None, stop=None):
+    """
+    Handshake with one device using every link parameters in turn, until stop is set.
+    :return: First parameters that got an answer, None if device stayed silent.
+    :rtype: telium.discovery.DiscoveredTerminal|None
+    """
+    if device_class is None:
+        from telium.manager import Telium as device_class
+
+    if not os.path.exists(path):
+        return None
+
+    for baudrate in baudrates:
+        for link, bytesize, parity, stopbits in link_parameters:
+            if stop is not None and stop.is_set():
+                return None
+
+            try:
+                telium = device_class(path, baudrate=baudrate, bytesize=bytesize, parity=parity, stopbits=stopbits,
+                                      timeout=probe_timeout)
+            except Exception:
+                # Device does not support these parameters (termios.error is not an IOError), try next ones.
+                continue
+
+            try:
+                # Drop what could be left by a previous user of this port before judging the answer.
+                telium._device.reset_input_buffer()
+
+                started = monotonic()
+
+                if _probe_parity(telium, stop):
+                    return DiscoveredTerminal(path, device, link, baudrate, bytesize, parity, stopbits,
+                                              monotonic() - started)
+            except Exception:
+                pass  # Probing must never escape its thread, device is just not a terminal.
+            finally:
+                telium.close()
+
+    return None
+
+
+def discover(paths=None, deadline=DISCOVERY_DEADLINE, probe_timeout=DISCOVERY_PROBE_TIMEOUT, baudrates=(9600,),
+             link_parameters=LINK_PARAMETERS, device_class=None):
+    """
+    Probe every candidate device concurrently and list the ones that answered.
+    :param list[str] paths: Devices to probe, once per actual device, every candidate_paths if not set.
+    :param float deadline: Seconds after which devices that did not answer yet are left out.
+    :param float probe_timeout: Seconds waited for ACK with one link parameters
+    :param tuple[int] baudrates: Baud rates to try, most likely first
+    :param tuple link_parameters: (name, bytesize, parity, stopbits) to try, most likely first
+    :param type device_class: Telium or a subclass used to probe, Telium if not set.
+    :return: Responsive terminals, fastest handshake first
+    :rtype: list[telium.discovery.DiscoveredTerminal]
+    """
+    if paths is None:
+        candidates = candidate_paths()
+    else:
+        candidates, devices = [], set()
+
+        for path in paths:
+            device = os.path.realpath(path)
+
+            # Two probes on one device would read each other's answers.
+            if device not in devices:
+                devices.add(device)
+                candidates.append((path, device))
+
+    found, found_lock, stop = [], Lock(), Event()
+
+    def probe(path, device):
+        terminal = _probe(path, device, baudrates, link_parameters, probe_timeout, device_class, stop)
+
+        if terminal is not None:
+            with found_lock:
+                found.append(terminal)
+
+    expires = monotonic() + deadline
+    probes = [
+        Thread(target=probe, args=candidate, name='telium-discovery-{0}'.format(candidate[1]))
+        for candidate in candidates
+    ]
+
+    for probe_thread in probes:
+        # A device that hang on open must not hold the process at exit.
+        probe_thread.daemon = True
+        probe_thread.start()
+
+    for probe_thread in probes:
+        probe_thread.join(max(0.0, expires - monotonic()))
+
+    with found_lock:
+        ranked = list(found)
+
+    # Late probes stop writing at once and give up their device within DISCOVERY_STOP_INTERVAL.
+    stop.set()
+    expires = monotonic() + DISCOVERY_STOP_TIMEOUT
+
+    for probe_thread in probes:
+        probe_thread.join(max(0.0, expires - monotonic()))
+
+    link_rank = dict((parameters[0], rank) for rank, parameters in enumerate(link_parameters))
+    ranked.sort(key=lambda terminal: (terminal.latency, link_rank.get(terminal.link, 0), terminal.path))
+
+    return ranked
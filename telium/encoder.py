@@ -0,0 +1,130 @@
+"""
+Precompiled payment request frames. Constant fields are encoded once into a bytearray template,
+only POS number and amount are patched for every request.
+"""
+from threading import Lock
+
+from telium.constant import *
+from telium.lrc import lrc
+from telium.payment import TeliumData, SequenceDoesNotMatchLengthException, IllegalAmountException
+
+ASK_ENCODER_CACHE_SIZE = 64
+
+# Offsets into framed payment request, STX is at 0. POS number and amount are the ten patched octets.
+_CONSTANTS = slice(11, TERMINAL_ASK_REQUIRED_SIZE + 1)
+_PATCHED = slice(1, 11)
+
+_FRAME_SIZE = TERMINAL_ASK_REQUIRED_SIZE + 3
+
+
+class AskEncoder(object):
+    """
+    Reusable payment request encoder.
+    Every field but POS number and amount is encoded once, as is its LRC.
+    Encoding a request then only write ten digits and XOR them into the precomputed LRC.
+    """
+
+    def __init__(self, answer_flag, transaction_type, payment_mode, currency_numeric, delay, authorization,
+                 private=' ' * 10):
+        """
+        :param str answer_flag: TERMINAL_ANSWER_SET_FULLSIZED or TERMINAL_ANSWER_SET_SMALLSIZED
+        :param str transaction_type: Transaction type, see TERMINAL_TRANSACTION_TYPES
+        :param str payment_mode: Type of payment support
+        :param str currency_numeric: ISO 4217 numeric currency code, eg. '978'
+        :param str delay: TERMINAL_REQUEST_ANSWER_WAIT_FOR_TRANSACTION or TERMINAL_REQUEST_ANSWER_INSTANT
+        :param str authorization: TERMINAL_FORCE_AUTHORIZATION_ENABLE or TERMINAL_FORCE_AUTHORIZATION_DISABLE
+        :param str private: Terminal reserved, 10 octets
+        """
+        constants = (answer_flag + payment_mode + transaction_type + currency_numeric + private + delay +
+                     authorization).encode(TERMINAL_DATA_ENCODING)
+
+        if len(constants) != _CONSTANTS.stop - _CONSTANTS.start:
+            raise SequenceDoesNotMatchLengthException('Cannot create ask payment sequence with len != {0} octets. '
+                                                      'Currently have {1} octet(s).'.format
+                                                      (TERMINAL_ASK_REQUIRED_SIZE,
+                                                       len(constants) + _PATCHED.stop - _PATCHED.start))
+
+        self._template = bytearray(_FRAME_SIZE)
+        self._template[0] = CONTROL_NAMES.index('STX')
+        self._template[_CONSTANTS] = constants
+        self._template[-2] = CONTROL_NAMES.index('ETX')
+
+        # LRC of every constant byte, ETX included.
+        self._constants_lrc = lrc(memoryview(self._template)[_CONSTANTS.start:-1])
+
+        self._lock = Lock()
+
+    @staticmethod
+    def from_ask(telium_ask):
+        """
+        Create encoder sharing constant fields of given payment request.
+        :param telium.TeliumAsk telium_ask: Payment request
+        :rtype: telium.encoder.AskEncoder
+        """
+        return AskEncoder(telium_ask.answer_flag, telium_ask.transaction_type, telium_ask.payment_mode,
+                          telium_ask.currency_numeric, telium_ask.delay, telium_ask.authorization, telium_ask.private)
+
+    def encode(self, amount, pos_number='01'):
+        """
+        Build framed payment request, same as TeliumAsk.encode but already as bytes.
+        :param float|decimal.Decimal amount: Payment amount
+        :param str pos_number: Checkout ID
+        :return: Framed request STX..ETX.LRC, ready to write
+        :raise: IllegalAmountException If amount is out of terminal range.
+        :rtype: bytes
+        """
+        return self.encode_cents(TeliumData.amount_to_cents(amount), pos_number)
+
+    def encode_cents(self, amount_cents, pos_number='01'):
+        """
+        Build framed payment request from an amount in cents, no float involved.
+        :param int amount_cents: Payment amount in cents
+        :param str pos_number: Checkout ID
+        :return: Framed request STX..ETX.LRC, ready to write
+        :raise: IllegalAmountException If amount is not an integer or is out of terminal range.
+        :rtype: bytes
+        """
+        if not TeliumData.is_amount_cents_valid(amount_cents):
+            raise IllegalAmountException('Amount of "{0}" cents cannot be requested.'.format(amount_cents))
+
+        patched = (pos_number.zfill(2) + '%08d' % amount_cents).encode(TERMINAL_DATA_ENCODING)
+
+        if len(patched) != _PATCHED.stop - _PATCHED.start:
+            raise SequenceDoesNotMatchLengthException('Cannot create ask payment sequence with len != {0} octets. '
+                                                      'Currently have {1} octet(s).'.format
+                                                      (TERMINAL_ASK_REQUIRED_SIZE,
+                                                       len(patched) + _CONSTANTS.stop - _CONSTANTS.start))
+
+        with self._lock:
+            self._template[_PATCHED] = patched
+            self._template[-1] = lrc(patched, self._constants_lrc)
+            return bytes(self._template)
+
+
+_ENCODERS = dict()
+_ENCODERS_LOCK = Lock()
+
+
+def encode_ask(telium_ask):
+    """
+    Encode payment request to bytes through a shared encoder, built once for every set of constant fields.
+    :param telium.TeliumAsk telium_ask: Payment request
+    :return: Framed request STX..ETX.LRC, ready to write
+    :rtype: bytes
+    """
+    key = (telium_ask.answer_flag, telium_ask.transaction_type, telium_ask.payment_mode,
+           telium_ask.currency_numeric, telium_ask.delay, telium_ask.authorization, telium_ask.private)
+
+    encoder = _ENCODERS.get(key)
+
+    if encoder is None:
+        encoder = AskEncoder(*key)
+
+        with _ENCODERS_LOCK:
+            # Only a handful of combinations exist in practice, start over rather than tracking usage.
+            if len(_ENCODERS) >= ASK_ENCODER_CACHE_SIZE:
+                _ENCODERS.clear()
+
+            _ENCODERS[key] = encoder
+
+    return encoder.encode_cents(telium_ask.amount_cents, telium_ask.pos_number)
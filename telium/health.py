@@ -0,0 +1,141 @@
+"""
+Background readiness probing of terminals, so that checkout code read a cached state instead of touching serial links.
+"""
+from collections import namedtuple
+from threading import Thread, Event, Lock
+from time import time
+
+HEALTH_PROBE_INTERVAL = 5.0  # Seconds between two probes of the same terminal
+
+
+class TerminalHealth(namedtuple('TerminalHealth', ['ready', 'last_seen', 'last_probe', 'failures'])):
+    """
+    Cached readiness of one terminal.
+    last_seen is the UNIX timestamp of the last successful probe and last_probe the one of the last probe, both None
+    if never happened. failures is the number of probes failed in a row.
+    """
+
+    __slots__ = ()
+
+
+_UNKNOWN = TerminalHealth(False, None, None, 0)
+
+
+class HealthMonitor(object):
+    """
+    Probe idle terminals with is_ok on a schedule from a background thread.
+    A terminal whose link lock is held, eg. by a running transaction, is skipped and keep its previous state.
+    """
+
+    def __init__(self, devices, interval=HEALTH_PROBE_INTERVAL, raspberry_pi=False):
+        """
+        :param list[telium.Telium] devices: Terminals to watch, AsyncTelium is not supported.
+        :param float interval: Seconds between two probes of the same terminal
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        """
+        self._devices = list(devices)
+        self._interval = interval
+        self._raspberry_pi = raspberry_pi
+        self._states = dict((device.path, _UNKNOWN) for device in self._devices)
+        self._lock = Lock()
+        self._stopped = Event()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        """
+        :return: self
+        :rtype: telium.HealthMonitor
+        """
+        self._stopped.clear()
+        self._thread = Thread(target=self.__run, name='telium-health')
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def health(self, path):
+        """
+        :param str path: Device path
+        :rtype: telium.health.TerminalHealth
+        """
+        return self._states.get(path, _UNKNOWN)
+
+    def is_ready(self, path, max_age=None):
+        """
+        Cached readiness, never touch the serial link.
+        :param str path: Device path
+        :param float max_age: Consider terminal not ready if last successful probe is older than max_age seconds.
+        :rtype: bool
+        """
+        state = self._states.get(path, _UNKNOWN)
+
+        if max_age is not None and (state.last_seen is None or time() - state.last_seen > max_age):
+            return False
+
+        return state.ready
+
+    @property
+    def ready_paths(self):
+        """
+        :return: Path of every terminal ready as of last probe
+        :rtype: list[str]
+        """
+        return [path for path, state in self._states.items() if state.ready]
+
+    def probe(self, device):
+        """
+        Probe one terminal now unless its link is busy or a transaction is in progress, and update its cached state.
+        :param telium.Telium device: Terminal to probe
+        :return: True if terminal was probed, False if link was busy.
+        :rtype: bool
+        """
+        if not device.link_lock.acquire(False):
+            return False
+
+        if device.in_transaction:
+            # Terminal accepted a payment and wait for its customer, an ENQ now would break it.
+            device.link_lock.release()
+            return False
+
+        try:
+            ready = device.is_open and device._is_ok(self._raspberry_pi)
+        except Exception:
+            ready = False
+        finally:
+            device.link_lock.release()
+
+        now = time()
+
+        with self._lock:
+            previous = self._states.get(device.path, _UNKNOWN)
+            # States are replaced as a whole, readers always see a consistent tuple without locking.
+            self._states[device.path] = TerminalHealth(
+                ready,
+                now if ready else previous.last_seen,
+                now,
+                0 if ready else previous.failures + 1
+            )
+
+        return True
+
+    def __run(self):
+        while not self._stopped.is_set():
+            for device in self._devices:
+                if self._stopped.is_set():
+                    break
+                self.probe(device)
+
+            self._stopped.wait(self._interval)
@@ -1,26 +1,49 @@
-def hexdump(src, length=16, sep='.'):
+import six
+
+
+def _printable_filter(sep):
+    # Printable ASCII is kept as is, control and non-ASCII characters are replaced by sep.
+    return ''.join([(x <= 127 and len(repr(chr(x))) == 3) and chr(x) or sep for x in range(256)])
+
+
+FILTER = _printable_filter('.')
+
+
+def format_hexdump(src, length=16, sep='.'):
     """
-    function that help pretty print bytes content
-    thank to https://gist.github.com/7h3rAm/5603718
-    adapted to lib needs.
+    Render bytes content as hexdump lines, offset, hexadecimal octets then printable characters.
+    :param bytes|bytearray|str src: Content to render
+    :param int length: Octets per line
+    :param str sep: Replacement of non printable characters
+    :rtype: str
     """
-    FILTER = ''.join([(len(repr(chr(x))) == 3) and chr(x) or sep for x in range(256)])
+    printable_filter = FILTER if sep == '.' else _printable_filter(sep)
+
+    if isinstance(src, six.text_type):
+        src = src.encode('latin-1', 'replace')
+
+    src = bytearray(src)
     lines = []
 
     for c in range(0, len(src), length):
         chars = src[c:c + length]
 
-        hexstr = ' '.join(["%02x" % ord(x) for x in chars]) if isinstance(chars, str) else ' '.join(
-            ['{:02x}'.format(x) for x in chars])
+        hexstr = ' '.join(['%02x' % x for x in chars])
 
         if len(hexstr) > 24:
             hexstr = "%s %s" % (hexstr[:24], hexstr[24:])
 
-        printable = ''.join(
-            [
-                "%s" % ((ord(x) <= 127 and FILTER[ord(x)]) or sep) for x in chars
-            ]
-        ) if isinstance(chars, str) else ''.join(['{}'.format((x <= 127 and FILTER[x]) or sep) for x in chars])
+        printable = ''.join([printable_filter[x] for x in chars])
 
         lines.append("%08x:  %-*s  |%s|" % (c, length * 3, hexstr, printable))
-    print('\n'.join(lines))
+
+    return '\n'.join(lines)
+
+
+def hexdump(src, length=16, sep='.'):
+    """
+    function that help pretty print bytes content
+    thank to https://gist.github.com/7h3rAm/5603718
+    adapted to lib needs.
+    """
+    print(format_hexdump(src, length, sep))
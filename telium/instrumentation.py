@@ -0,0 +1,323 @@
+"""
+Protocol phase instrumentation. Give an observer to Telium to receive timing, byte counts and outcome
+of every phase of ask, verify and is_ok exchanges.
+"""
+import os
+from bisect import bisect_left
+from collections import namedtuple
+from threading import Thread, Lock, Event
+
+try:
+    from time import monotonic
+except ImportError:  # pragma: no cover
+    from time import time as monotonic
+
+OPERATION_IS_OK = 'is_ok'
+OPERATION_ASK = 'ask'
+OPERATION_VERIFY = 'verify'
+
+PHASE_HANDSHAKE = 'handshake'  # Host ENQ up to terminal ACK
+PHASE_WRITE = 'write'  # Payment request written up to terminal ACK
+PHASE_WAIT = 'wait'  # Waiting for terminal ENQ, the customer is dealing with terminal
+PHASE_READ = 'read'  # Host ACK up to a complete answer
+PHASE_EOT = 'eot'  # Host ACK up to terminal EOT
+PHASE_TOTAL = 'total'  # Whole exchange
+
+OUTCOME_OK = 'ok'
+OUTCOME_FAILED = 'failed'  # Terminal refused or did not answer in time
+OUTCOME_ERROR = 'error'  # An exception was raised
+
+# Latency buckets in seconds, from a fast signal round trip up to a customer typing its PIN.
+INSTRUMENTATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+                           60.0, 120.0)
+
+
+class PhaseEvent(namedtuple('PhaseEvent', ['path', 'operation', 'phase', 'started', 'ended', 'sent', 'received',
+                                           'outcome'])):
+    """
+    One protocol phase. started and ended are monotonic timestamps in seconds,
+    sent and received are byte counts on the serial link during this phase.
+    """
+
+    __slots__ = ()
+
+    @property
+    def duration(self):
+        return self.ended - self.started
+
+
+class TeliumObserver(object):
+    """
+    Base class of instrumentation observers, override on_phase.
+    Called synchronously from the thread or coroutine running the exchange, keep it short.
+    """
+
+    def on_phase(self, event):
+        """
+        :param telium.instrumentation.PhaseEvent event: Phase that just ended
+        """
+        pass
+
+
+class _Exchange(object):
+    """
+    Record phases of one exchange, used by Telium as a context manager.
+    """
+
+    __slots__ = ('_telium', '_observer', '_operation', '_started', '_sent', '_received', '_phase_started',
+                 '_phase_sent', '_phase_received', '_failed')
+
+    def __init__(self, telium, observer, operation):
+        self._telium = telium
+        self._observer = observer
+        self._operation = operation
+        self._failed = False
+
+    def __enter__(self):
+        self._started = self._phase_started = monotonic()
+        self._sent = self._phase_sent = self._telium.bytes_sent
+        self._received = self._phase_received = self._telium.bytes_received
+        return self
+
+    def _emit(self, phase, started, ended, sent, received, outcome):
+        self._observer.on_phase(PhaseEvent(self._telium.path, self._operation, phase, started, ended,
+                                           self._telium.bytes_sent - sent, self._telium.bytes_received - received,
+                                           outcome))
+
+    def phase(self, phase, succeeded=True):
+        """
+        End current phase, next one start now.
+        :param str phase: PHASE_* constant
+        :param bool succeeded: False if terminal refused or did not answer in time
+        """
+        ended = monotonic()
+
+        self._emit(phase, self._phase_started, ended, self._phase_sent, self._phase_received,
+                   OUTCOME_OK if succeeded else OUTCOME_FAILED)
+
+        self._phase_started, self._phase_sent, self._phase_received = \
+            ended, self._telium.bytes_sent, self._telium.bytes_received
+        self._failed = self._failed or not succeeded
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._emit(PHASE_TOTAL, self._started, monotonic(), self._sent, self._received,
+                   OUTCOME_ERROR if exc_type is not None else OUTCOME_FAILED if self._failed else OUTCOME_OK)
+        return False
+
+
+class _NullExchange(object):
+    """
+    Stand-in used when nobody observe a Telium instance.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def phase(self, phase, succeeded=True):
+        pass
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+NULL_EXCHANGE = _NullExchange()
+
+
+class HistogramCollector(TeliumObserver):
+    """
+    Aggregate phase durations into fixed buckets histograms, one per (path, operation, phase, outcome).
+    Recording a phase is a bisect and a few increments under a lock.
+    """
+
+    def __init__(self, buckets=INSTRUMENTATION_BUCKETS):
+        """
+        :param tuple[float] buckets: Sorted upper bounds in seconds, an implicit +Inf bucket is added.
+        """
+        self._buckets = tuple(buckets)
+        self._series = dict()
+        self._lock = Lock()
+
+    @property
+    def buckets(self):
+        return self._buckets
+
+    def on_phase(self, event):
+        key = (event.path, event.operation, event.phase, event.outcome)
+        duration = event.duration
+        index = bisect_left(self._buckets, duration)
+
+        with self._lock:
+            series = self._series.get(key)
+
+            if series is None:
+                # Counts per bucket, +Inf included, then duration sum, bytes sent and bytes received.
+                series = self._series[key] = [[0] * (len(self._buckets) + 1), 0.0, 0, 0]
+
+            series[0][index] += 1
+            series[1] += duration
+            series[2] += event.sent
+            series[3] += event.received
+
+    def snapshot(self):
+        """
+        Consistent copy of every histogram.
+        :return: (path, operation, phase, outcome) to (counts per bucket, duration sum, bytes sent, bytes received)
+        :rtype: dict
+        """
+        with self._lock:
+            return dict((key, (list(series[0]), series[1], series[2], series[3]))
+                        for key, series in self._series.items())
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+def _labels(path, operation, phase, outcome, **extra):
+    labels = [('device', path), ('operation', operation), ('phase', phase), ('outcome', outcome)]
+    labels.extend(sorted(extra.items()))
+    return '{' + ','.join('{0}="{1}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                          for name, value in labels) + '}'
+
+
+class PrometheusExporter(object):
+    """
+    Expose a HistogramCollector in Prometheus text format, into a file for node_exporter textfile collector
+    or over HTTP.
+    """
+
+    def __init__(self, collector, namespace='telium'):
+        """
+        :param telium.instrumentation.HistogramCollector collector: Histograms to expose
+        :param str namespace: Prefix of every metric name
+        """
+        self._collector = collector
+        self._namespace = namespace
+        self._server = None
+        self._writer = None
+        self._stopped = Event()
+
+    def render(self):
+        """
+        :return: Every metric in Prometheus text exposition format
+        :rtype: str
+        """
+        buckets = self._collector.buckets
+        snapshot = sorted(self._collector.snapshot().items())
+
+        duration, sent, received = ('{0}_phase_duration_seconds'.format(self._namespace),
+                                    '{0}_phase_bytes_sent_total'.format(self._namespace),
+                                    '{0}_phase_bytes_received_total'.format(self._namespace))
+
+        lines = [
+            '# HELP {0} Duration of Telium protocol phases.'.format(duration),
+            '# TYPE {0} histogram'.format(duration)
+        ]
+
+        for key, (counts, duration_sum, _, _) in snapshot:
+            cumulative = 0
+
+            for upper_bound, count in zip(buckets + ('+Inf',), counts):
+                cumulative += count
+                lines.append('{0}_bucket{1} {2}'.format(duration, _labels(*key, le=upper_bound), cumulative))
+
+            lines.append('{0}_sum{1} {2!r}'.format(duration, _labels(*key), duration_sum))
+            lines.append('{0}_count{1} {2}'.format(duration, _labels(*key), cumulative))
+
+        for name, position, description in ((sent, 2, 'Bytes sent to terminal'),
+                                            (received, 3, 'Bytes received from terminal')):
+            lines.append('# HELP {0} {1} during Telium protocol phases.'.format(name, description))
+            lines.append('# TYPE {0} counter'.format(name))
+
+            for key, series in snapshot:
+                lines.append('{0}{1} {2}'.format(name, _labels(*key), series[position]))
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """
+        Write metrics to file atomically, so that a reader never see a partial file.
+        :param str path: Destination, eg. /var/lib/node_exporter/textfile/telium.prom
+        """
+        temporary_path = '{0}.{1}.tmp'.format(path, os.getpid())
+
+        with open(temporary_path, 'w') as metrics_file:
+            metrics_file.write(self.render())
+
+        if hasattr(os, 'replace'):
+            os.replace(temporary_path, path)
+        else:  # pragma: no cover
+            os.rename(temporary_path, path)
+
+    def write_periodically(self, path, interval=15.0):
+        """
+        Write metrics to file every interval seconds from a background thread until close is called.
+        :return: self
+        :rtype: telium.instrumentation.PrometheusExporter
+        """
+        def write_until_closed():
+            while not self._stopped.wait(interval):
+                self.write(path)
+
+        self._writer = Thread(target=write_until_closed, name='telium-prometheus-writer')
+        self._writer.daemon = True
+        self._writer.start()
+
+        return self
+
+    def serve(self, port=9464, address='127.0.0.1'):
+        """
+        Serve metrics over HTTP from a background thread until close is called.
+        :param int port: TCP port, 0 to pick a free one
+        :param str address: Address to bind, local only by default
+        :return: self
+        :rtype: telium.instrumentation.PrometheusExporter
+        """
+        # Imported on demand, http.server alone weight more than the whole telium package at import time.
+        from six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                body = exporter.render().encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = HTTPServer((address, port), MetricsHandler)
+
+        server_thread = Thread(target=self._server.serve_forever, name='telium-prometheus-http')
+        server_thread.daemon = True
+        server_thread.start()
+
+        return self
+
+    @property
+    def port(self):
+        """
+        :return: TCP port metrics are served on, None if not serving.
+        :rtype: int|None
+        """
+        return self._server.server_address[1] if self._server is not None else None
+
+    def close(self):
+        self._stopped.set()
+
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,199 @@
+import mmap
+import os
+import struct
+from collections import namedtuple
+from threading import Thread, Lock, Event
+from time import time
+
+JOURNAL_MAGIC = b'TLMJ'
+JOURNAL_VERSION = 1
+
+JOURNAL_DIRECTION_OUT = 0  # Host to terminal
+JOURNAL_DIRECTION_IN = 1  # Terminal to host
+
+JOURNAL_HEADER = struct.Struct('<4sHHQ')  # magic, version, record size, record count
+JOURNAL_FRAME_SIZE = 84  # Longest frame a record can hold, a complete terminal answer is 83 octets
+# timestamp, direction, frame length, frame padded with NUL
+JOURNAL_RECORD = struct.Struct('<dBxH{0}s'.format(JOURNAL_FRAME_SIZE))
+
+JOURNAL_GROWTH = 4096  # Records added to file capacity each time it is full
+JOURNAL_FLUSH_INTERVAL = 1.0
+
+
+class JournalCorruptedException(IOError):
+    pass
+
+
+class JournalRecord(namedtuple('JournalRecord', ['timestamp', 'direction', 'data'])):
+    """
+    One frame exchanged with a terminal.
+    timestamp is a UNIX timestamp, direction is JOURNAL_DIRECTION_OUT or JOURNAL_DIRECTION_IN, data is the raw frame.
+    """
+
+    __slots__ = ()
+
+
+class TransactionJournal(object):
+    """
+    Append-only journal of raw frames exchanged with terminals.
+    Records are fixed-size and written into a memory mapped file, a background thread flush them
+    to disk periodically so that appending never wait on an fsync.
+    """
+
+    def __init__(self, path, flush_interval=JOURNAL_FLUSH_INTERVAL):
+        """
+        :param str path: Journal file, created if it does not exist yet.
+        :param float flush_interval: Delay in seconds between two flush to disk.
+        """
+        self._path = path
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._dirty = False
+        self._retired_maps = []
+        self._closed = Event()
+
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        self._file.seek(0, os.SEEK_END)
+
+        if self._file.tell() == 0:
+            self._file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, JOURNAL_RECORD.size, 0))
+            self._file.flush()
+
+        self._count = TransactionJournal._read_header(self._file)
+        self._capacity = 0
+        self._map = None
+        self._remap(self._count)
+
+        self._flusher = Thread(target=self.__flush_periodically, args=(flush_interval,),
+                               name='telium-journal-flush')
+        self._flusher.daemon = True
+        self._flusher.start()
+
+    @staticmethod
+    def _read_header(file_object):
+        file_object.seek(0)
+        magic, version, record_size, count = JOURNAL_HEADER.unpack(file_object.read(JOURNAL_HEADER.size))
+
+        if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION or record_size != JOURNAL_RECORD.size:
+            raise JournalCorruptedException('"{0}" is not a supported journal file.'.format(file_object.name))
+
+        return count
+
+    def _remap(self, minimal_capacity):
+        """
+        Grow journal file so that it can hold at least minimal_capacity records then map it.
+        """
+        capacity = max(self._capacity, minimal_capacity)
+        capacity += JOURNAL_GROWTH - capacity % JOURNAL_GROWTH
+
+        # Previous mapping is flushed and closed later by flush(), outside of the append path.
+        if self._map is not None:
+            self._retired_maps.append(self._map)
+
+        self._file.truncate(JOURNAL_HEADER.size + capacity * JOURNAL_RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = capacity
+
+    @property
+    def path(self):
+        return self._path
+
+    def __len__(self):
+        return self._count
+
+    def append(self, direction, data, timestamp=None):
+        """
+        Record a raw frame. Never wait for disk.
+        :param int direction: JOURNAL_DIRECTION_OUT or JOURNAL_DIRECTION_IN
+        :param bytes data: Raw frame, at most JOURNAL_FRAME_SIZE octets.
+        :param float timestamp: UNIX timestamp, now if not set.
+        :raise: ValueError If frame does not fit in a record.
+        """
+        if len(data) > JOURNAL_FRAME_SIZE:
+            raise ValueError('Cannot journal a frame of {0} octets, records hold at most {1} octets.'
+                             .format(len(data), JOURNAL_FRAME_SIZE))
+
+        with self._lock:
+            if self._map is None:
+                raise ValueError('Cannot append to a closed journal.')
+
+            if self._count == self._capacity:
+                self._remap(self._count + 1)
+
+            offset = JOURNAL_HEADER.size + self._count * JOURNAL_RECORD.size
+
+            JOURNAL_RECORD.pack_into(self._map, offset, time() if timestamp is None else timestamp, direction,
+                                     len(data), bytes(data))
+
+            self._count += 1
+            JOURNAL_HEADER.pack_into(self._map, 0, JOURNAL_MAGIC, JOURNAL_VERSION, JOURNAL_RECORD.size, self._count)
+
+            self._dirty = True
+
+    def flush(self):
+        """
+        Force pending records to disk. Appending is not blocked while disk is being written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                current_map, retired_maps, dirty = self._map, self._retired_maps, self._dirty
+                self._retired_maps = []
+                self._dirty = False
+
+            for retired_map in retired_maps:
+                retired_map.flush()
+                retired_map.close()
+
+            if current_map is not None and dirty:
+                current_map.flush()
+
+    def close(self):
+        """
+        Flush pending records, stop background flush and shrink file to its actual content.
+        """
+        self._closed.set()
+        self._flusher.join()
+
+        self.flush()
+
+        with self._lock:
+            if self._map is None:
+                return
+
+            self._map.close()
+            self._map = None
+
+            self._file.truncate(JOURNAL_HEADER.size + self._count * JOURNAL_RECORD.size)
+            self._file.close()
+
+    def __flush_periodically(self, flush_interval):
+        while not self._closed.wait(flush_interval):
+            self.flush()
+
+    def __iter__(self):
+        return TransactionJournal.read(self._path)
+
+    @staticmethod
+    def read(path):
+        """
+        Stream records back from a journal file, one record in memory at a time.
+        :param str path: Journal file
+        :return: Generator of records, oldest first.
+        :rtype: collections.Iterable[telium.JournalRecord]
+        """
+        with open(path, 'rb') as file_object:
+            count = TransactionJournal._read_header(file_object)
+
+            for _ in range(count):
+                chunk = file_object.read(JOURNAL_RECORD.size)
+
+                if len(chunk) != JOURNAL_RECORD.size:
+                    raise JournalCorruptedException('Journal "{0}" is truncated.'.format(path))
+
+                timestamp, direction, length, data = JOURNAL_RECORD.unpack(chunk)
+
+                if length > JOURNAL_FRAME_SIZE:
+                    raise JournalCorruptedException('Journal "{0}" has a record longer than its frame slot.'
+                                                    .format(path))
+
+                yield JournalRecord(timestamp, direction, data[:length])
@@ -0,0 +1,143 @@
+"""
+LRC engine, the XOR of every byte after STX up to and including ETX.
+Bytes are XORed a whole machine word at a time instead of one by one, frames can be checked in bulk.
+"""
+from binascii import hexlify
+
+import six
+
+from telium.constant import *
+
+LRC_MAX_FOLD = 128  # Largest run of bytes folded with a precomputed mask, longer data is folded in several runs.
+
+# Precomputed masks keeping the n lower bytes of an integer, used when folding it in halves.
+_FOLD_MASKS = tuple((1 << (8 * n)) - 1 for n in range(LRC_MAX_FOLD + 1))
+
+
+def _as_bytes(data):
+    if isinstance(data, six.text_type):
+        return data.encode(TERMINAL_DATA_ENCODING)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return data
+    raise TypeError("Cannot compute LRC of type {0}. Expect string or bytes.".format(str(type(data))))
+
+
+def _to_int(data):
+    return int.from_bytes(data, 'little') if six.PY3 else int(hexlify(data) or b'0', 16)
+
+
+def _fold(data):
+    """
+    XOR of every byte of data, data being at most LRC_MAX_FOLD long.
+    Data is read as one integer then folded in halves down to a single word, then to a single byte.
+    """
+    value, width = _to_int(data), len(data)
+
+    while width > 8:
+        half = (width + 1) >> 1
+        value = (value >> (half << 3)) ^ (value & _FOLD_MASKS[half])
+        width = half
+
+    value ^= value >> 32
+    value ^= value >> 16
+    value ^= value >> 8
+
+    return value & 0xFF
+
+
+def lrc(data, initial=0):
+    """
+    Compute LRC of data.
+    :param bytes|bytearray|memoryview|str data: Data from which LRC checksum should be computed
+    :param int initial: LRC of preceding data, to continue a running checksum.
+    :return: 0x00 <= Result <= 0xFF
+    :rtype: int
+    """
+    data = _as_bytes(data)
+    data_len = len(data)
+
+    if data_len <= LRC_MAX_FOLD:
+        return initial ^ _fold(data) if data_len else initial
+
+    view = memoryview(data)
+
+    for start in range(0, data_len, LRC_MAX_FOLD):
+        initial ^= _fold(view[start:start + LRC_MAX_FOLD])
+
+    return initial
+
+
+def lrc_check(frame):
+    """
+    Verify LRC of a complete STX..ETX.LRC frame without copying it.
+    :param bytes|bytearray|memoryview|str frame: Framed data
+    :return: True if LRC was verified
+    :rtype: bool
+    """
+    frame = _as_bytes(frame)
+
+    if len(frame) < 2:
+        return False
+
+    # LRC of payload XOR the LRC byte itself is null when they match.
+    return lrc(memoryview(frame)[1:]) == 0
+
+
+class LrcAccumulator(object):
+    """
+    Running LRC, updated as bytes arrive from terminal.
+    """
+
+    __slots__ = ('_value',)
+
+    def __init__(self, initial=0):
+        self._value = initial
+
+    @property
+    def value(self):
+        """
+        :return: LRC of every byte given to update since creation or last reset.
+        :rtype: int
+        """
+        return self._value
+
+    def update(self, data):
+        """
+        :param bytes|bytearray|memoryview data: Next bytes
+        :return: Running LRC
+        :rtype: int
+        """
+        self._value = lrc(data, self._value)
+        return self._value
+
+    def reset(self):
+        self._value = 0
+
+
+def lrc_check_many(buffer, frame_size):
+    """
+    Verify LRC of N same sized frames laid out back to back in one buffer.
+    Vectorized with numpy when available, frame by frame otherwise.
+    :param bytes|bytearray|memoryview buffer: N framed sequences STX..ETX.LRC
+    :param int frame_size: Size of every frame including STX, ETX and LRC
+    :return: For each frame, True if its LRC was verified.
+    :rtype: numpy.ndarray|list[bool]
+    """
+    buffer_len = len(buffer)
+
+    if frame_size < 2 or buffer_len % frame_size != 0:
+        raise ValueError('Cannot split {0} octet(s) into frames of {1} octet(s).'.format(buffer_len, frame_size))
+
+    try:
+        # Imported here so that numpy is never loaded by processes that do not check frames in bulk.
+        import numpy
+    except ImportError:  # pragma: no cover
+        numpy = None
+
+    if numpy is not None:
+        frames = numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(-1, frame_size)
+        return numpy.bitwise_xor.reduce(frames[:, 1:], axis=1) == 0
+
+    view = memoryview(buffer)
+
+    return [lrc(view[start + 1:start + frame_size]) == 0 for start in range(0, buffer_len, frame_size)]
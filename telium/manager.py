@@ -1,11 +1,29 @@
+import os
 from glob import glob
+from select import select
+from threading import Thread, Lock
 
 import six
-from telium.hexdump import hexdump
+from concurrent.futures import Future
+from six.moves._thread import get_ident
 from serial import Serial, EIGHTBITS, PARITY_NONE, STOPBITS_ONE, PARITY_EVEN, SEVENBITS
 
 from telium.constant import *
-from telium.payment import TeliumResponse
+from telium.decoder import FrameDecoder
+from telium.encoder import encode_ask
+from telium.instrumentation import NULL_EXCHANGE, OPERATION_IS_OK, OPERATION_ASK, OPERATION_VERIFY, \
+    PHASE_HANDSHAKE, PHASE_WRITE, PHASE_WAIT, PHASE_READ, PHASE_EOT, _Exchange
+from telium.journal import JOURNAL_DIRECTION_OUT, JOURNAL_DIRECTION_IN
+from telium.payment import LrcChecksumException, SequenceDoesNotMatchLengthException
+from telium.tracing import ProtocolTracer, ByteRing, enable_stdout_trace
+
+_NAK = bytes(bytearray([CONTROL_NAMES.index('NAK')]))
+_DEVICE_TIMEOUT = object()  # Default of custom delays, read with instance timeout. None means wait indefinitely.
+
+try:
+    from time import monotonic
+except ImportError:  # pragma: no cover
+    from time import time as monotonic
 
 
 class SignalDoesNotExistException(KeyError):
@@ -32,6 +50,93 @@ class TerminalUnexpectedAnswerException(IOError):
     pass
 
 
+class TerminalBusyException(IOError):
+    pass
+
+
+class TerminalWaitCancelledException(IOError):
+    pass
+
+
+class LinkLock(object):
+    """
+    Lock of a serial link, reentrant for the thread owning it so that ask and verify can be called while holding it.
+    Ownership can be handed over to another thread, eg. the background reader of Telium.transact.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._owner = None
+        self._depth = 0
+
+    def acquire(self, blocking=True):
+        """
+        Acquire the link, immediately if current thread already own it.
+        :param bool blocking: Wait for the link if True, give up immediately otherwise.
+        :return: True if link is now held by current thread
+        :rtype: bool
+        """
+        if self._owner == get_ident():
+            self._depth += 1
+            return True
+
+        if not self._lock.acquire(blocking):
+            return False
+
+        self._owner, self._depth = get_ident(), 1
+        return True
+
+    def release(self):
+        """
+        Release the link once current thread has released it as many times as it acquired it.
+        :raise: RuntimeError If current thread does not own the link.
+        """
+        if self._owner != get_ident():
+            raise RuntimeError('Cannot release a link lock owned by another thread.')
+
+        self._depth -= 1
+
+        if self._depth == 0:
+            self._owner = None
+            self._lock.release()
+
+    def detach(self):
+        """
+        Keep the link held but owned by no thread until another one adopt it, see adopt.
+        """
+        if self._owner != get_ident() or self._depth != 1:
+            raise RuntimeError('Only a link lock acquired once by current thread can be detached.')
+
+        self._owner = None
+
+    def adopt(self):
+        """
+        Become owner of a detached link lock, current thread is then responsible for releasing it.
+        """
+        self._owner, self._depth = get_ident(), 1
+
+    def owned(self):
+        """
+        :return: True if link is held by current thread
+        :rtype: bool
+        """
+        return self._owner == get_ident()
+
+    def locked(self):
+        """
+        :return: True if link is held by any thread
+        :rtype: bool
+        """
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
 class Telium:
     def __init__(self,
                  path='/dev/ttyACM0',
@@ -41,7 +146,11 @@ class Telium:
                  stopbits=STOPBITS_ONE,
                  timeout=1,
                  open_on_create=True,
-                 debugging=False):
+                 debugging=False,
+                 journal=None,
+                 observer=None,
+                 tracer=None,
+                 retry_policy=None):
         """
         Create Telium device instance
         :param str path: str Path to serial emulated device
@@ -49,10 +158,28 @@ class Telium:
         :param int timeout: Maximum delai before hanging out.
         :param bool open_on_create: Define if device has to be opened on instance creation
         :param bool debugging: Enable print device <-> host com trace. (stdout)
+        :param telium.TransactionJournal journal: Record every payment frame sent and answer received if set.
+        :param telium.instrumentation.TeliumObserver observer: Notified of every protocol phase if set.
+        :param telium.tracing.ProtocolTracer tracer: Keep and log every byte exchanged if set, implied by debugging.
+        :param telium.RetryPolicy retry_policy: Retransmit frames refused with NAK and refuse corrupted answers if set.
         """
         self._path = path
         self._baud = baudrate
         self._debugging = debugging
+        self._journal = journal
+        self._observer = observer
+        self._tracer = tracer
+        self._ring = ByteRing()
+        self._retry_policy = retry_policy
+        self._retransmissions = 0
+        self._last_signal = b''
+        self._bytes_sent = 0
+        self._bytes_received = 0
+        self._transaction = None
+        self._in_transaction = False
+        self._answer_abandoned = False
+        self._abandoned_answer = None
+        self._link_lock = LinkLock()
         self._device_timeout = timeout
         self._device = None
 
@@ -68,33 +195,203 @@ class Telium:
         if not open_on_create:
             self._device.setPort(self._path)
 
+        if debugging:
+            enable_stdout_trace()
+
+            if self._tracer is None:
+                self._tracer = ProtocolTracer(self._path)
+
     @staticmethod
-    def get(baudrate=9600, timeout=1, open_on_create=True, debugging=False):
+    def get(baudrate=9600, timeout=1, open_on_create=True, debugging=False, probe=False):
         """
         Auto-create a new instance of Telium. The device path will be infered based on most commom location.
-        This won't be reliable if you have more than one emulated serial device plugged-in.
+        This won't be reliable if you have more than one emulated serial device plugged-in, unless probe is set.
         Won't work either on NT plateform.
         :param int baudrate: Baudrate.
         :param int timeout: Timeout for byte signal waiting.
         :param bool open_on_create: If device should be opened on instance creation.
         :param bool debugging: Set it to True if you want to trace comm. between device and host. (stdout)
+        :param bool probe: Bind to the first terminal that answer, see telium.discovery.discover.
+            Every candidate device is then opened and written to. Fallback on most commom location if none answer.
         :return: Fresh new Telium instance or None
         :rtype: telium.Telium
         """
+        if probe:
+            from telium.discovery import discover
+
+            terminals = discover(baudrates=(baudrate,))
+
+            if terminals:
+                return terminals[0].open(timeout=timeout, open_on_create=open_on_create, debugging=debugging)
+
         for path in TERMINAL_PROBABLES_PATH:
             probables = glob('%s*' % ''.join(filter(lambda c: not c.isdigit(), path)))
             if len(probables) == 1:
-                return Telium(probables[0], baudrate, timeout, open_on_create, debugging)
+                return Telium(probables[0], baudrate=baudrate, timeout=timeout, open_on_create=open_on_create,
+                              debugging=debugging)
         return None
 
     def __del__(self):
-        if self._device.is_open:
+        # Device is None if it could not be opened on creation.
+        if self._device is not None and self._device.is_open:
             self._device.close()
 
+    @property
+    def path(self):
+        """
+        Device path this instance is bound to
+        :rtype: str
+        """
+        return self._path
+
     @property
     def debugging(self):
         return self._debugging
 
+    @property
+    def tracer(self):
+        """
+        Protocol tracer, None unless debugging is enabled or a tracer was given.
+        :rtype: telium.tracing.ProtocolTracer
+        """
+        return self._tracer
+
+    @property
+    def retransmissions(self):
+        """
+        Number of frames sent again or refused with NAK since instance creation
+        :rtype: int
+        """
+        return self._retransmissions
+
+    def _can_retry(self, retry):
+        """
+        Decide whether a frame refused by terminal should be sent again.
+        :param int retry: Retransmissions already done for this frame
+        :return: True if last signal received is NAK and retry policy allow another attempt.
+        :rtype: bool
+        """
+        if self._retry_policy is None or retry >= self._retry_policy.retries or self._last_signal != _NAK:
+            return False
+
+        self._retransmissions += 1
+        return True
+
+    def _refuse_answer(self, retry):
+        """
+        Answer a corrupted frame with NAK so that terminal send it again, if retry policy allow it.
+        :param int retry: Retransmissions already requested for this answer
+        :return: True if NAK was sent
+        :rtype: bool
+        """
+        if self._retry_policy is None or retry >= self._retry_policy.retries:
+            return False
+
+        # Rest of corrupted frame is dropped, terminal send the whole frame again.
+        self._device.reset_input_buffer()
+        self._retransmissions += 1
+
+        return self._send_signal('NAK')
+
+    @property
+    def link_lock(self):
+        """
+        Lock held during a whole exchange so that two threads never interleave on the same link.
+        Reentrant, hold it to keep ask and verify of one transaction together: with device.link_lock: ...
+        Held by the background reader while a transaction started with transact is pending.
+        :rtype: telium.manager.LinkLock
+        """
+        return self._link_lock
+
+    @property
+    def in_transaction(self):
+        """
+        True from the moment terminal has accepted a payment with ask up to the end of verify.
+        Terminal is then waiting for its customer, nothing else should be sent to it, see telium.HealthMonitor.
+        :rtype: bool
+        """
+        return self._in_transaction
+
+    @property
+    def abandoned_answer(self):
+        """
+        Answer of the last transaction whose verify was cancelled, received at the beginning of the next exchange.
+        :rtype: telium.TeliumResponse|None
+        """
+        return self._abandoned_answer
+
+    def _collect_abandoned_answer(self):
+        """
+        Receive the answer of a transaction whose verify was cancelled, terminal won't accept anything else before.
+        Link lock must be held.
+        :return: True if link is free for a new exchange, False if terminal did not answer within instance timeout.
+        :rtype: bool
+        """
+        if not self._answer_abandoned:
+            return True
+
+        if not self._wait_signal('ENQ'):
+            return False
+
+        # Whatever happens next, this answer is over for terminal.
+        self._answer_abandoned = False
+        self._in_transaction = False
+
+        self._send_signal('ACK')
+        self._abandoned_answer = self._read_valid_answer()
+        self._send_signal('ACK')
+        self._wait_signal('EOT')
+
+        return True
+
+    @property
+    def ring(self):
+        """
+        Last bytes exchanged with terminal, always recorded. Dump it with ring.hexdump() or ring.binary().
+        :rtype: telium.tracing.ByteRing
+        """
+        return self._ring
+
+    def _with_records(self, exception):
+        """
+        Attach bytes that led up to exception as its records attribute, see telium.tracing.format_records.
+        :return: Same exception
+        """
+        exception.records = self._ring.records()
+        return exception
+
+    @property
+    def observer(self):
+        return self._observer
+
+    @observer.setter
+    def observer(self, observer):
+        self._observer = observer
+
+    @property
+    def bytes_sent(self):
+        """
+        Number of bytes written to terminal since instance creation
+        :rtype: int
+        """
+        return self._bytes_sent
+
+    @property
+    def bytes_received(self):
+        """
+        Number of bytes read from terminal since instance creation
+        :rtype: int
+        """
+        return self._bytes_received
+
+    def _instrument(self, operation):
+        """
+        Record phases of an exchange, does nothing if no observer is set.
+        :param str operation: OPERATION_* constant
+        :return: Context manager whose phase method end the current phase.
+        """
+        return _Exchange(self, self._observer, operation) if self._observer is not None else NULL_EXCHANGE
+
     @property
     def timeout(self):
         """
@@ -149,86 +446,291 @@ class Telium:
         """
         if signal not in CONTROL_NAMES:
             raise SignalDoesNotExistException("The ASCII '%s' code doesn't exist." % signal)
-        if self._debugging:
-            print('DEBUG :: try send_signal = ', signal)
         return self._send(chr(CONTROL_NAMES.index(signal))) == 1
 
-    def _wait_signal(self, signal):
+    def _read_within(self, size, timeout=_DEVICE_TIMEOUT):
+        """
+        Read up to size bytes, giving up after timeout seconds without changing device timeout.
+        :param int size: Number of bytes expected
+        :param float timeout: Custom delay in seconds, None to wait indefinitely, use instance timeout if not set
+        :return: Bytes read, could be shorter than requested size
+        :rtype: bytes
+        """
+        if timeout is _DEVICE_TIMEOUT or timeout == self._device_timeout:
+            return self._device.read(size)
+
+        try:
+            file_descriptor = self._device.fileno()
+        except (AttributeError, IOError, ValueError):
+            # No file descriptor to wait on (eg. NT), link lock is held so that no other thread see this timeout.
+            self._device.timeout = timeout
+
+            try:
+                return self._device.read(size)
+            finally:
+                self._device.timeout = self._device_timeout
+
+        deadline = monotonic() + timeout if timeout is not None else None
+        buffer = bytearray()
+
+        while len(buffer) < size:
+            in_waiting = self._device.in_waiting
+
+            if in_waiting:
+                buffer.extend(self._device.read(min(in_waiting, size - len(buffer))))
+                continue
+
+            remaining = deadline - monotonic() if deadline is not None else None
+
+            if remaining is not None and remaining <= 0:
+                break
+
+            if not select([file_descriptor], [], [], remaining)[0]:
+                break
+
+        return bytes(buffer)
+
+    def _wait_signal(self, signal, timeout=_DEVICE_TIMEOUT):
         """
         Read one byte from serial device and compare to expected.
         :param signal: str
+        :param float timeout: Custom delay in seconds, None to wait indefinitely, use instance timeout if not set
+        :return: True if received signal match
+        :rtype: bool
+        """
+        return self._check_signal(self._read_within(1, timeout), signal)
+
+    def _check_signal(self, one_byte_read, signal):
+        """
+        Record byte read while waiting for a signal and compare it to expected.
+        :param bytes one_byte_read: Byte read, empty if nothing came
+        :param str signal: Expected signal name
         :return: True if received signal match
         :rtype: bool
         """
-        one_byte_read = self._device.read(1)
         expected_char = CONTROL_NAMES.index(signal)
 
-        if self._debugging and len(one_byte_read) == 1:
-            print('DEBUG :: wait_signal_received = ', CONTROL_NAMES[one_byte_read[0] if six.PY3 else ord(one_byte_read[0])])
+        self._last_signal = one_byte_read
+        self._bytes_received += len(one_byte_read)
+        self._ring.append(JOURNAL_DIRECTION_IN, one_byte_read)
+
+        if self._tracer is not None:
+            self._tracer.received(one_byte_read)
 
         return one_byte_read == (expected_char.to_bytes(1, byteorder='big') if six.PY3 else chr(expected_char))
 
+    def _wait_answer_signal(self, waiting_timeout, cancellation=None, deadline=None, progress=None,
+                            poll_interval=DELAY_TERMINAL_ANSWER_POLL_INTERVAL):
+        """
+        Wait for terminal ENQ in short slices instead of one long read, so that it can be cancelled and followed.
+        :param float waiting_timeout: Delay in seconds before giving up, None to wait up to deadline
+        :param telium.CancellationToken cancellation: Give up as soon as it is cancelled
+        :param float deadline: Give up at this time.monotonic() timestamp if sooner than waiting_timeout
+        :param callable progress: Called after every slice with seconds waited so far and seconds remaining or None
+        :param float poll_interval: Slice in seconds
+        :return: True if terminal ENQ was received
+        :raise: TerminalWaitCancelledException If cancelled before terminal started to answer.
+        :rtype: bool
+        """
+        started = monotonic()
+        expires = started + waiting_timeout if waiting_timeout is not None else None
+
+        if deadline is not None:
+            expires = deadline if expires is None else min(expires, deadline)
+
+        try:
+            file_descriptors = [self._device.fileno()]
+
+            if cancellation is not None and os.name == 'posix':
+                file_descriptors.append(cancellation.fileno())
+        except (AttributeError, IOError, ValueError):
+            file_descriptors = None  # Nothing to select on (eg. NT), read slice by slice instead.
+
+        while True:
+            if self._device.in_waiting:
+                return self._check_signal(self._device.read(1), 'ENQ')
+
+            if cancellation is not None and cancellation.cancelled:
+                # Terminal did not start to answer yet, it will anyway. Answer is received by the next exchange.
+                self._answer_abandoned = True
+                raise self._with_records(TerminalWaitCancelledException(
+                    'Waiting for terminal answer on "{0}" has been cancelled.'.format(self._path)))
+
+            now = monotonic()
+            remaining = expires - now if expires is not None else None
+
+            if remaining is not None and remaining <= 0:
+                return self._check_signal(b'', 'ENQ')
+
+            time_slice = poll_interval if remaining is None else min(poll_interval, remaining)
+
+            if file_descriptors is not None:
+                select(file_descriptors, [], [], time_slice)
+            else:
+                one_byte_read = self._read_within(1, time_slice)
+
+                if one_byte_read:
+                    return self._check_signal(one_byte_read, 'ENQ')
+
+            if progress is not None:
+                now = monotonic()
+                progress(now - started, max(0.0, expires - now) if expires is not None else None)
+
     def _send(self, data):
         """
         Send data to terminal
-        :param str data: string representation to convert and send
+        :param str|bytes data: string representation to convert and send, or bytes already encoded
         :return: Lenght of data actually sent
         :rtype: int
         """
-        if not isinstance(data, str):
+        if isinstance(data, six.text_type):
+            data = data.encode(TERMINAL_DATA_ENCODING)
+        elif not isinstance(data, (bytes, bytearray)):
             raise DataFormatUnsupportedException("Type {0} cannont be send to device. "
-                                                 "Please use string when calling _send method.".format(str(type(data))))
-        return self._device.write(data.encode(TERMINAL_DATA_ENCODING))
+                                                 "Please use string or bytes when calling _send method."
+                                                 .format(str(type(data))))
+        self._bytes_sent += len(data)
+        self._ring.append(JOURNAL_DIRECTION_OUT, data)
+
+        if self._tracer is not None:
+            self._tracer.sent(data)
 
-    def _read_answer(self, expected_size=TERMINAL_ANSWER_COMPLETE_SIZE):
+        return self._device.write(data)
+
+    def _send_frame(self, frame):
+        """
+        Send a framed packet to terminal and record it into journal if any.
+        :param bytes frame: Framed packet STX..ETX.LRC
+        :return: Lenght of data actually sent
+        :rtype: int
+        """
+        sent = self._send(frame)
+
+        if self._journal is not None:
+            self._journal.append(JOURNAL_DIRECTION_OUT, frame)
+
+        return sent
+
+    def _read_answer(self, timeout=_DEVICE_TIMEOUT):
         """
-        Download raw answer and convert it to TeliumResponse
+        Download raw answer and convert it to TeliumResponse.
+        Return as soon as a complete frame is received whatever its size.
+        :param float timeout: Custom delay in seconds between two chunks, None to wait indefinitely,
+            use instance timeout if not set
         :return: TeliumResponse
-        :raise: TerminalUnexpectedAnswerException If data cannot be converted into telium.TeliumResponse
+        :raise: TerminalUnexpectedAnswerException If terminal stop sending before a complete frame is received.
+        :rtype: telium.TeliumResponse
+        """
+        decoder = FrameDecoder()
+
+        while True:
+            answers = self._feed_answer(decoder, self._read_within(self._device.in_waiting or 1, timeout))
+
+            if answers:
+                return answers[0]
+
+    def _read_valid_answer(self, timeout=_DEVICE_TIMEOUT):
+        """
+        Same as _read_answer, a corrupted answer is refused with NAK and read again if retry policy allow it.
+        :param float timeout: Custom delay in seconds between two chunks, None to wait indefinitely,
+            use instance timeout if not set
         :rtype: telium.TeliumResponse
         """
-        raw_data = self._device.read(size=expected_size)
+        retry = 0
+
+        while True:
+            try:
+                return self._read_answer(timeout)
+            except (LrcChecksumException, SequenceDoesNotMatchLengthException):
+                if not self._refuse_answer(retry):
+                    raise
+                retry += 1
+
+    def _feed_answer(self, decoder, raw_data):
+        """
+        Push a chunk of raw answer into decoder.
+        :param telium.FrameDecoder decoder: Decoder of the pending answer
+        :param bytes raw_data: Chunk as read from device
+        :return: Completed answers if any
+        :raise: TerminalUnexpectedAnswerException If chunk is empty, meaning that terminal stopped sending.
+        :rtype: list[telium.TeliumResponse]
+        """
         data_len = len(raw_data)
 
-        if self._debugging:
-            print('<---------------------------- Chunk from Terminal :: {0} byte(s).'.format(data_len))
-            hexdump(raw_data)
-            print('----------------------------> End of Chunk from Terminal')
+        self._bytes_received += data_len
+        self._ring.append(JOURNAL_DIRECTION_IN, raw_data)
 
-        if data_len != expected_size:
-            raise TerminalUnexpectedAnswerException('Raw read expect size = {0} '
-                                                    'but actual size = {1}.'.format(expected_size, data_len))
+        if self._tracer is not None:
+            self._tracer.received(raw_data)
 
-        if raw_data[0] != (CONTROL_NAMES.index('STX') if six.PY3 else chr(CONTROL_NAMES.index('STX'))):
-            raise TerminalUnexpectedAnswerException(
-                'The first byte of the answer from terminal should be STX.. Have %02x and except %02x (STX)' % (
-                    raw_data[0], CONTROL_NAMES.index('STX')))
-        if raw_data[-2] != (CONTROL_NAMES.index('ETX') if six.PY3 else chr(CONTROL_NAMES.index('ETX'))):
-            raise TerminalUnexpectedAnswerException(
-                'The byte before final of the answer from terminal should be ETX')
+        if data_len == 0:
+            raise self._with_records(TerminalUnexpectedAnswerException(
+                'Terminal stopped sending its answer. '
+                'Have {0} octet(s) of an unfinished frame.'.format(decoder.buffered)))
 
-        return TeliumResponse.decode(raw_data)
+        try:
+            answers = decoder.feed(raw_data)
+        except (LrcChecksumException, SequenceDoesNotMatchLengthException) as e:
+            # Rejected frame is recorded too, it is what terminal actually sent.
+            if self._journal is not None:
+                self._journal.append(JOURNAL_DIRECTION_IN, decoder.last_frame)
+
+            self._with_records(e)
+            raise
+
+        if answers and self._journal is not None:
+            self._journal.append(JOURNAL_DIRECTION_IN, decoder.last_frame)
+
+        return answers
+
+    @staticmethod
+    def _answer_size(telium_ask):
+        """
+        Determine the answer size the terminal will send back for a given payment request.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :return: Expected answer size in bytes
+        :raise: TerminalUnrecognizedConstantException If answer flag is unknown
+        :rtype: int
+        """
+        if telium_ask.answer_flag == TERMINAL_ANSWER_SET_FULLSIZED:
+            return TERMINAL_ANSWER_COMPLETE_SIZE
+        elif telium_ask.answer_flag == TERMINAL_ANSWER_SET_SMALLSIZED:
+            return TERMINAL_ANSWER_LIMITED_SIZE
+        raise TerminalUnrecognizedConstantException(
+            "Cannot determine expected answer size because answer flag is unknown.")
 
     def is_ok(self, raspberry_pi=False):
         """
         Should in theory return True if your device is ready to receive order. False otherwise.
-        I can only recommend you to not call this method every time.
+        I can only recommend you to not call this method every time, see telium.HealthMonitor for a cached state.
         :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
         :return: True if device appear to be OK, false otherwise.
         :rtype: bool
         """
-        if raspberry_pi:
-            self._device.timeout = 0.3
-            self._device.read(size=1)
-            self._device.timeout = self._device_timeout
+        with self._link_lock:
+            return self._is_ok(raspberry_pi)
 
-        # Send ENQ and wait for ACK
-        self._send_signal('ENQ')
+    def _is_ok(self, raspberry_pi):
+        """
+        Same as is_ok, link lock must be held.
+        """
+        if raspberry_pi:
+            self._read_within(1, 0.3)
 
-        if not self._wait_signal('ACK'):
+        if not self._collect_abandoned_answer():
             return False
 
-        return self._send_signal('EOT')
+        with self._instrument(OPERATION_IS_OK) as exchange:
+            # Send ENQ and wait for ACK
+            self._send_signal('ENQ')
+
+            if not self._wait_signal('ACK'):
+                exchange.phase(PHASE_HANDSHAKE, succeeded=False)
+                return False
+
+            exchange.phase(PHASE_HANDSHAKE)
+
+            return self._send_signal('EOT')
 
     def ask(self, telium_ask, raspberry_pi=False):
         """
@@ -238,78 +740,235 @@ class Telium:
         :return: True if device has accepted to begin a new transaction.
         :rtype: bool
         """
+        with self._link_lock:
+            return self._ask(telium_ask, raspberry_pi)
+
+    def try_ask(self, telium_ask, raspberry_pi=False):
+        """
+        Same as ask but give up immediately if another thread is using the link.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :return: None if link is busy, True if device has accepted to begin a new transaction.
+        :rtype: bool|None
+        """
+        if not self._link_lock.acquire(False):
+            return None
+
+        try:
+            return self._ask(telium_ask, raspberry_pi)
+        finally:
+            self._link_lock.release()
 
+    def _ask(self, telium_ask, raspberry_pi):
+        """
+        Same as ask, link lock must be held.
+        """
         if not self.is_open:
             raise TerminalSerialLinkClosedException("Your device isn\'t opened yet.")
 
         if raspberry_pi:
-            self._device.timeout = 0.3
-            self._device.read(size=1)
-            self._device.timeout = self._device_timeout
+            self._read_within(1, 0.3)
 
-        # Send ENQ and wait for ACK
-        self._send_signal('ENQ')
+        if not self._collect_abandoned_answer():
+            raise self._with_records(TerminalBusyException(
+                'Terminal on "{0}" is still processing a transaction whose verify was cancelled.'.format(self._path)))
 
-        if not self._wait_signal('ACK'):
-            raise TerminalInitializationFailedException(
-                "Payment terminal isn't ready to accept data from host. "
-                "Check if terminal is properly configured or not busy.")
+        with self._instrument(OPERATION_ASK) as exchange:
+            # Send ENQ and wait for ACK, again after a backoff if terminal answered NAK
+            retry = 0
+            self._send_signal('ENQ')
 
-        # Send transformed TeliumAsk packet to device
-        self._send(telium_ask.encode())
+            while not self._wait_signal('ACK'):
+                if not self._can_retry(retry):
+                    exchange.phase(PHASE_HANDSHAKE, succeeded=False)
+                    raise self._with_records(TerminalInitializationFailedException(
+                        "Payment terminal isn't ready to accept data from host. "
+                        "Check if terminal is properly configured or not busy."))
 
-        # Verify if device has received everything
-        if not self._wait_signal('ACK'):
-            return False
+                self._retry_policy.wait(retry)
+                retry += 1
+                self._send_signal('ENQ')
 
-        # End this communication
-        self._send_signal('EOT')
+            exchange.phase(PHASE_HANDSHAKE)
 
-        return True
+            # Send transformed TeliumAsk packet to device, the very same bytes are sent again on NAK
+            frame, retry = encode_ask(telium_ask), 0
+            self._send_frame(frame)
+
+            # Verify if device has received everything
+            while not self._wait_signal('ACK'):
+                if not self._can_retry(retry):
+                    exchange.phase(PHASE_WRITE, succeeded=False)
+                    return False
+
+                self._retry_policy.wait(retry)
+                retry += 1
+                self._send_frame(frame)
+
+            exchange.phase(PHASE_WRITE)
+
+            # End this communication, terminal now wait for its customer up to verify.
+            self._send_signal('EOT')
+            self._in_transaction = True
+
+            return True
 
-    def verify(self, telium_ask, waiting_timeout=DELAY_TERMINAL_ANSWER_TRANSACTION, raspberry_pi=False):
+    def verify(self, telium_ask, waiting_timeout=DELAY_TERMINAL_ANSWER_TRANSACTION, raspberry_pi=False,
+               cancellation=None, deadline=None, progress=None):
         """
         Wait for answer and convert it for you.
+        Waiting is done in short slices if any of cancellation, deadline or progress is set.
         :param telium.TeliumAsk telium_ask: Payment info
-        :param float waiting_timeout: Custom waiting delay in seconds before giving up on waiting ENQ signal.
+        :param float waiting_timeout: Custom waiting delay in seconds before giving up on waiting ENQ signal,
+            None to wait indefinitely.
         :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :param telium.CancellationToken cancellation: Stop waiting for terminal as soon as it is cancelled.
+        :param float deadline: Stop waiting for terminal at this time.monotonic() timestamp.
+        :param callable progress: Called while waiting with seconds waited so far and seconds remaining.
         :return: TeliumResponse, None or Exception
+        :raise: TerminalWaitCancelledException If cancelled before terminal started to answer, the answer is then
+            received by the next exchange, see abandoned_answer, or by calling verify again.
         :rtype: telium.TeliumResponse|None
         """
-
+        with self._link_lock:
+            try:
+                return self._verify(telium_ask, waiting_timeout, raspberry_pi, cancellation, deadline, progress)
+            finally:
+                # Terminal is still busy with a cancelled transaction until its answer is received.
+                self._in_transaction = self._answer_abandoned
+
+    def _verify(self, telium_ask, waiting_timeout, raspberry_pi, cancellation=None, deadline=None, progress=None):
+        """
+        Same as verify, link lock must be held.
+        """
         if not self.is_open:
             raise TerminalSerialLinkClosedException("Your device isn\'t opened yet.")
 
+        Telium._answer_size(telium_ask)  # Reject unknown answer flag before waiting for terminal.
+
         answer = None  # Initializing null variable.
+        self._answer_abandoned = False  # Waiting again after a cancellation.
 
-        # Set high timeout in order to wait for device to answer us.
-        self._device.timeout = waiting_timeout
+        # Every read of this exchange use the high waiting timeout, device timeout itself is left untouched.
+        with self._instrument(OPERATION_VERIFY) as exchange:
+            # We wait for terminal to answer us.
+            if cancellation is None and deadline is None and progress is None:
+                answering = self._wait_signal('ENQ', waiting_timeout)
+            else:
+                try:
+                    answering = self._wait_answer_signal(waiting_timeout, cancellation, deadline, progress)
+                except TerminalWaitCancelledException:
+                    exchange.phase(PHASE_WAIT, succeeded=False)
+                    raise
 
-        # We wait for terminal to answer us.
-        if self._wait_signal('ENQ'):
+            if answering:
+                exchange.phase(PHASE_WAIT)
 
-            self._send_signal('ACK')  # We're about to say that we're ready to accept data.
+                self._send_signal('ACK')  # We're about to say that we're ready to accept data.
 
-            if telium_ask.answer_flag == TERMINAL_ANSWER_SET_FULLSIZED:
-                answer = self._read_answer(TERMINAL_ANSWER_COMPLETE_SIZE)
-            elif telium_ask.answer_flag == TERMINAL_ANSWER_SET_SMALLSIZED:
-                answer = self._read_answer(TERMINAL_ANSWER_LIMITED_SIZE)
-            else:
-                raise TerminalUnrecognizedConstantException(
-                    "Cannot determine expected answer size because answer flag is unknown.")
+                answer = self._read_valid_answer(waiting_timeout)
 
-            self._send_signal('ACK')  # Notify terminal that we've received it all.
+                exchange.phase(PHASE_READ)
 
-            # The terminal should respond with EOT aka. End of Transmission.
-            if not self._wait_signal('EOT') and not raspberry_pi:
-                raise TerminalUnexpectedAnswerException(
-                    "Terminal should have ended the communication with 'EOT'. Something's obviously wrong.")
+                self._send_signal('ACK')  # Notify terminal that we've received it all.
 
-        # Restore device's timeout
-        self._device.timeout = self._device_timeout
+                # The terminal should respond with EOT aka. End of Transmission.
+                if not self._wait_signal('EOT', waiting_timeout):
+                    exchange.phase(PHASE_EOT, succeeded=False)
+
+                    if not raspberry_pi:
+                        raise self._with_records(TerminalUnexpectedAnswerException(
+                            "Terminal should have ended the communication with 'EOT'. Something's obviously wrong."))
+                else:
+                    exchange.phase(PHASE_EOT)
+            else:
+                exchange.phase(PHASE_WAIT, succeeded=False)
 
         return answer
 
+    @property
+    def pending_transaction(self):
+        """
+        Transaction started with transact whose answer is still awaited.
+        :rtype: concurrent.futures.Future|None
+        """
+        transaction = self._transaction
+        return transaction if transaction is not None and not transaction.done() else None
+
+    def transact(self, telium_ask, waiting_timeout=DELAY_TERMINAL_ANSWER_TRANSACTION, raspberry_pi=False,
+                 callback=None, cancellation=None, progress=None):
+        """
+        Initialize payment then return as soon as terminal has acknowledged it.
+        Terminal answer is awaited by a background reader, the host is free to do its own work meanwhile.
+        Link lock is held until the returned future is done, other exchanges on this instance wait for it.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :param float waiting_timeout: Custom waiting delay in seconds before giving up on waiting terminal answer.
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :param callable callback: Called with the future once done, from the background reader thread.
+        :param telium.CancellationToken cancellation: Future fail with TerminalWaitCancelledException once cancelled,
+            unless terminal already started to answer.
+        :param callable progress: Called from the background reader while waiting, see verify.
+        :return: Future resolved with TeliumResponse, or None if terminal refused the transaction or did not answer.
+        :raise: TerminalBusyException If a previous transaction is still awaiting its answer.
+        :rtype: concurrent.futures.Future
+        """
+        if self.pending_transaction is not None:
+            raise TerminalBusyException('Terminal on "{0}" is still processing previous transaction.'
+                                        .format(self._path))
+
+        if self._link_lock.owned():
+            raise TerminalBusyException('Link of "{0}" is held by current thread, '
+                                        'it cannot be handed over to a background reader.'.format(self._path))
+
+        future = Future()
+        future.set_running_or_notify_cancel()  # Already running on terminal side, cannot be cancelled anymore.
+
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        # Link stay locked from ask up to the end of verify, the background reader release it.
+        self._link_lock.acquire()
+
+        try:
+            accepted = self._ask(telium_ask, raspberry_pi)
+        except Exception:
+            self._link_lock.release()
+            raise
+
+        if not accepted:
+            self._link_lock.release()
+            future.set_result(None)
+            return future
+
+        self._transaction = future
+
+        # Hand the link over to the background reader, this thread must not reenter it meanwhile.
+        self._link_lock.detach()
+
+        def read_answer():
+            answer, error = None, None
+            self._link_lock.adopt()
+
+            try:
+                answer = self._verify(telium_ask, waiting_timeout, raspberry_pi, cancellation, progress=progress)
+            except Exception as e:
+                error = e
+            finally:
+                # Link is released before notifying so that callbacks can start the next transaction.
+                self._in_transaction = self._answer_abandoned
+                self._link_lock.release()
+
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(answer)
+
+        reader = Thread(target=read_answer, name='telium-transact-{0}'.format(self._path))
+        reader.daemon = True
+        reader.start()
+
+        return future
+
 
 class TeliumNativeSerial(Telium):
 
@@ -318,7 +977,11 @@ class TeliumNativeSerial(Telium):
                  baudrate=9600,
                  timeout=1,
                  open_on_create=True,
-                 debugging=False):
+                 debugging=False,
+                 journal=None,
+                 observer=None,
+                 tracer=None,
+                 retry_policy=None):
         super(TeliumNativeSerial, self).__init__(
             path,
             baudrate=baudrate,
@@ -327,4 +990,8 @@ class TeliumNativeSerial(Telium):
             stopbits=STOPBITS_ONE,
             timeout=timeout,
             open_on_create=open_on_create,
-            debugging=debugging)
+            debugging=debugging,
+            journal=journal,
+            observer=observer,
+            tracer=tracer,
+            retry_policy=retry_policy)
@@ -0,0 +1,206 @@
+"""
+Link parameters auto-negotiation. Supported combinations are probed once per device,
+the winning one is kept in a small JSON cache so that later starts open the port right away.
+"""
+import os
+from threading import Lock
+from time import time
+
+from telium.discovery import DiscoveredTerminal, LINK_PARAMETERS, DISCOVERY_PROBE_TIMEOUT, _probe, _probe_parity
+
+NEGOTIATION_BAUDRATES = (9600, 19200, 38400, 115200, 1200)  # Most likely first, 9600 is the constructor default.
+
+LINK_CACHE_VERSION = 1
+
+
+def default_cache_path():
+    """
+    :return: $XDG_CACHE_HOME/telium/links.json, ~/.cache/telium/links.json if not set.
+    :rtype: str
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'telium', 'links.json')
+
+
+def device_key(path):
+    """
+    Identify a device in a way that survive re-plugging: USB serial number if known, /dev/serial/by-id/ name otherwise,
+    then resolved device path as last resort.
+    :param str path: Device path
+    :rtype: str
+    """
+    device = os.path.realpath(path)
+
+    try:
+        # Imported here, listing ports is only needed by processes that negotiate.
+        from serial.tools.list_ports import comports
+
+        for port in comports():
+            if os.path.realpath(port.device) == device and port.serial_number:
+                return 'serial:{0}'.format(port.serial_number)
+    except Exception:
+        pass  # Port listing is best effort, some platforms or containers do not support it.
+
+    if path.startswith('/dev/serial/by-id/'):
+        return 'by-id:{0}'.format(os.path.basename(path))
+
+    by_id = '/dev/serial/by-id'
+
+    if os.path.isdir(by_id):
+        for name in sorted(os.listdir(by_id)):
+            if os.path.realpath(os.path.join(by_id, name)) == device:
+                return 'by-id:{0}'.format(name)
+
+    return 'path:{0}'.format(device)
+
+
+class LinkCache(object):
+    """
+    Winning link parameters by device key, stored as JSON. Written atomically, a corrupted file is treated as empty.
+    """
+
+    def __init__(self, path=None):
+        """
+        :param str path: Cache file, default_cache_path() if not set. Created on first store.
+        """
+        self._path = path if path is not None else default_cache_path()
+        self._lock = Lock()
+        self._entries = None
+
+    @property
+    def path(self):
+        return self._path
+
+    def _load(self):
+        if self._entries is not None:
+            return self._entries
+
+        from json import load
+
+        try:
+            with open(self._path, 'r') as cache_file:
+                content = load(cache_file)
+
+            entries = content.get('links', dict()) if content.get('version') == LINK_CACHE_VERSION else dict()
+        except (IOError, OSError, ValueError, AttributeError):
+            entries = dict()
+
+        self._entries = entries
+        return entries
+
+    def _store(self):
+        from json import dump
+
+        directory = os.path.dirname(self._path)
+
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        temporary_path = '{0}.{1}.tmp'.format(self._path, os.getpid())
+
+        with open(temporary_path, 'w') as cache_file:
+            dump({'version': LINK_CACHE_VERSION, 'links': self._entries}, cache_file, indent=2, sort_keys=True)
+
+        if hasattr(os, 'replace'):
+            os.replace(temporary_path, self._path)
+        else:  # pragma: no cover
+            os.rename(temporary_path, self._path)
+
+    def get(self, key):
+        """
+        :param str key: Device key, see device_key
+        :return: Cached link parameters (link, baudrate, bytesize, parity, stopbits) or None
+        :rtype: dict|None
+        """
+        with self._lock:
+            entry = self._load().get(key)
+            return dict(entry) if entry is not None else None
+
+    def put(self, key, terminal):
+        """
+        :param str key: Device key, see device_key
+        :param telium.DiscoveredTerminal terminal: Winning parameters
+        """
+        with self._lock:
+            self._load()[key] = {
+                'link': terminal.link,
+                'baudrate': terminal.baudrate,
+                'bytesize': terminal.bytesize,
+                'parity': terminal.parity,
+                'stopbits': terminal.stopbits,
+                'updated': time()
+            }
+            self._store()
+
+    def forget(self, key):
+        """
+        Drop cached parameters, eg. once they stopped working.
+        :param str key: Device key, see device_key
+        """
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._store()
+
+
+def negotiate(path, cache=None, baudrates=NEGOTIATION_BAUDRATES, link_parameters=LINK_PARAMETERS,
+              probe_timeout=DISCOVERY_PROBE_TIMEOUT, refresh=False, device_class=None):
+    """
+    Find link parameters of the terminal behind path, from cache if known, by probing every combination otherwise.
+    Only parameters that passed the parity probe of telium.discovery are cached, ENQ/ACK alone accept 8N1 and 7E1.
+    :param str path: Device path
+    :param telium.negotiation.LinkCache cache: Where winning parameters are kept, nothing is cached if not set.
+    :param tuple[int] baudrates: Baud rates to try, most likely first
+    :param tuple link_parameters: (name, bytesize, parity, stopbits) to try, most likely first
+    :param float probe_timeout: Seconds waited for ACK with one combination
+    :param bool refresh: Probe again even if parameters are cached
+    :param type device_class: Telium or a subclass used to probe, Telium if not set.
+    :return: Terminal parameters, latency is None if they came from cache. None if terminal never answered.
+    :rtype: telium.DiscoveredTerminal|None
+    """
+    device = os.path.realpath(path)
+    key = device_key(path) if cache is not None else None
+
+    if cache is not None and not refresh:
+        entry = cache.get(key)
+
+        if entry is not None:
+            return DiscoveredTerminal(path, device, entry['link'], entry['baudrate'], entry['bytesize'],
+                                      entry['parity'], entry['stopbits'], None)
+
+    terminal = _probe(path, device, baudrates, link_parameters, probe_timeout, device_class)
+
+    if terminal is not None and cache is not None:
+        cache.put(key, terminal)
+
+    return terminal
+
+
+def open_negotiated(path, cache=None, refresh=False, verify=False, **kwargs):
+    """
+    Open terminal behind path with negotiated link parameters, right away with cached ones if any.
+    Nothing is sent to terminal when parameters come from cache, unless verify is set.
+    :param str path: Device path
+    :param telium.negotiation.LinkCache cache: Where winning parameters are kept, nothing is cached if not set.
+    :param bool refresh: Negotiate again even if parameters are cached, eg. once a real exchange failed.
+    :param bool verify: Check cached parameters with the parity probe first. If they fail it, they are negotiated
+        again and replaced by new parameters that pass it. They are kept if none do, eg. terminal is busy.
+    :param kwargs: Extra arguments given to Telium, eg. timeout or journal
+    :return: Opened Telium instance, None if terminal did not answer negotiation.
+    :rtype: telium.Telium|None
+    """
+    terminal = negotiate(path, cache, refresh=refresh)
+
+    if terminal is None:
+        return None
+
+    telium = terminal.open(**kwargs)
+
+    if not verify or terminal.latency is not None or _probe_parity(telium):
+        return telium
+
+    # Terminal settings may have changed or another device took this path, a single failure is not enough to tell.
+    telium.close()
+
+    terminal = negotiate(path, cache, refresh=True)
+
+    return terminal.open(**kwargs) if terminal is not None else None
@@ -1,14 +1,26 @@
 import hashlib
-import json
 from abc import ABCMeta, abstractmethod
-from functools import reduce
-from operator import xor
+from collections import namedtuple
+from decimal import Decimal
 
 import six
-from payment_card_identifier import CardIdentifier
-from pycountry import currencies
 
+from telium.card import identify_card
 from telium.constant import *
+from telium.currency import alpha_to_numeric, numeric_to_alpha
+from telium.lrc import lrc, lrc_check
+
+_UNRESOLVED = object()
+
+
+def _card_type_dict(card_type, card_id_sha512):
+    return {
+        '_name': card_type.name,
+        '_regex': card_type.regex.pattern,
+        '_numbers': card_type.numbers,
+        '_masked_numbers': card_type.masked_numbers(),
+        '_sha512_numbers': card_id_sha512
+    } if card_type is not None else None
 
 
 class TeliumDataException(Exception):
@@ -33,18 +45,18 @@ class TeliumData(six.with_metaclass(ABCMeta, object)):
     Shouldn't be used as is. Use TeliumAsk or TeliumResponse.
     """
 
-    def __init__(self, pos_number, amount, payment_mode, currency_numeric, private):
+    def __init__(self, pos_number, amount, payment_mode, currency_numeric, private, amount_cents=None):
         """
         :param str pos_number: Checkout ID, min 1, max 99.
-        :param float amount: Payment amount, min 1.0, max 99999.99.
+        :param float|decimal.Decimal amount: Payment amount, min 1.0, max 99999.99. Ignored if amount_cents is set.
         :param str payment_mode: Type of payment support, please refers to provided constants.
         :param str currency_numeric: Type of currency ISO format, please use specific setter.
         :param str private: Terminal reserved. used to store authorization id if any.
+        :param int amount_cents: Payment amount in cents, min 100, max 9999999.
         """
         self._pos_number = pos_number
         self._payment_mode = payment_mode
         self._currency_numeric = currency_numeric
-        self._amount = amount
         self._private = private
 
         try:
@@ -52,23 +64,60 @@ class TeliumData(six.with_metaclass(ABCMeta, object)):
         except ValueError:
             self.currency_numeric = currency_numeric
 
-        if not TeliumData.is_amount_valid(self.amount):
+        if amount_cents is None:
+            amount_cents = TeliumData.amount_to_cents(amount)
+
+        if not TeliumData.is_amount_cents_valid(amount_cents):
             raise IllegalAmountException(
-                'Amount "{0}" is out of bound. Min {1} | Max {2}. {3} Decimals allowed.'.format(self.amount,
+                'Amount "{0}" is out of bound. Min {1} | Max {2}. {3} Decimals allowed.'.format(amount if amount is not None else amount_cents,
                                                                                                 TERMINAL_MINIMAL_AMOUNT_REQUESTABLE,
                                                                                                 TERMINAL_MAXIMAL_AMOUNT_REQUESTABLE,
                                                                                                 TERMINAL_DECIMALS_ALLOWED))
 
+        self._amount_cents = amount_cents
+
+    @staticmethod
+    def amount_to_cents(amount):
+        """
+        Convert an amount to integer cents.
+        :param float|decimal.Decimal amount: Amount
+        :return: Amount in cents, None if amount has more than two decimals or is out of bound.
+        :rtype: int|None
+        """
+        if isinstance(amount, Decimal):
+            cents = amount * 100
+            return int(cents) if cents.is_finite() and cents == cents.to_integral_value() else None
+
+        # Bounds are verified first so that NaN and infinity never reach round().
+        if not isinstance(amount, float) or \
+                not TERMINAL_MAXIMAL_AMOUNT_REQUESTABLE >= amount >= TERMINAL_MINIMAL_AMOUNT_REQUESTABLE:
+            return None
+
+        cents = int(round(amount * 100))
+
+        # Nearest cents should give back the very same float, otherwise amount has more than two decimals.
+        return cents if cents / 100.0 == amount else None
+
+    @staticmethod
+    def is_amount_cents_valid(amount_cents):
+        """
+        Check if provided amount in cents is allowed.
+        :param int amount_cents: Amount in cents
+        :return: True if provided amount is correct.
+        :rtype: bool
+        """
+        return isinstance(amount_cents, six.integer_types) and not isinstance(amount_cents, bool) \
+            and TERMINAL_MAXIMAL_AMOUNT_CENTS >= amount_cents >= TERMINAL_MINIMAL_AMOUNT_CENTS
+
     @staticmethod
     def is_amount_valid(amount):
         """
         Check if provided amount is allowed.
-        :param float amount: Amount
+        :param float|decimal.Decimal amount: Amount
         :return: True if provided amount is correct.
         :rtype: bool
         """
-        return isinstance(amount, float) and len(str(amount).split('.')[-1]) <= TERMINAL_DECIMALS_ALLOWED \
-               and TERMINAL_MAXIMAL_AMOUNT_REQUESTABLE >= amount >= TERMINAL_MINIMAL_AMOUNT_REQUESTABLE
+        return TeliumData.is_amount_cents_valid(TeliumData.amount_to_cents(amount))
 
     @property
     def pos_number(self):
@@ -94,10 +143,19 @@ class TeliumData(six.with_metaclass(ABCMeta, object)):
 
     @currency_numeric.setter
     def currency_numeric(self, currency):
-        currency = currencies.get(alpha_3=currency.upper())
-        if currency is None:
+        numeric = alpha_to_numeric(currency)
+        if numeric is None:
             raise KeyError('"{cur}" is not available in pyCountry currencies list.'.format(cur=currency))
-        self._currency_numeric = str(currency.numeric).zfill(3)
+        self._currency_numeric = numeric
+
+    @property
+    def currency_alpha(self):
+        """
+        ISO 4217 alpha-3 code of currency_numeric
+        :return: Currency code, eg. 'EUR', None if unknown or not accepted.
+        :rtype: str|None
+        """
+        return numeric_to_alpha(self._currency_numeric)
 
     @property
     def private(self):
@@ -115,21 +173,25 @@ class TeliumData(six.with_metaclass(ABCMeta, object)):
         :return: Amount
         :rtype: float
         """
-        return self._amount
+        return self._amount_cents / 100.0
+
+    @property
+    def amount_cents(self):
+        """
+        Payment amount in cents
+        :rtype: int
+        """
+        return self._amount_cents
 
     @staticmethod
     def lrc(data):
         """
         Calc. LRC from data. Checksum
-        :param bytes|str data: Data from which LRC checksum should be computed
+        :param bytes|bytearray|memoryview|str data: Data from which LRC checksum should be computed
         :return: 0x00 < Result < 0xFF
         :rtype: int
         """
-        if isinstance(data, str):
-            data = data.encode(TERMINAL_DATA_ENCODING)
-        elif not isinstance(data, bytes):
-            raise TypeError("Cannot compute LRC of type {0}. Expect string or bytes.".format(str(type(data))))
-        return reduce(xor, [c for c in data]) if six.PY3 else reduce(xor, [ord(c) for c in data])
+        return lrc(data)
 
     @staticmethod
     def lrc_check(data):
@@ -139,7 +201,7 @@ class TeliumData(six.with_metaclass(ABCMeta, object)):
         :return: True if LRC was verified
         :rtype: bool
         """
-        return TeliumData.lrc(data[1:-1]) == (data[-1] if six.PY3 else ord(data[-1]))
+        return lrc_check(data)
 
     @staticmethod
     def framing(packet):
@@ -164,8 +226,12 @@ class TeliumData(six.with_metaclass(ABCMeta, object)):
         """
         raise NotImplementedError
 
-    @property
-    def __dict__(self):
+    def to_dict(self):
+        """
+        Export instance fields into a new dict
+        :return: dict representation of instance
+        :rtype: dict
+        """
         return {
             '_pos_number': self.pos_number,
             '_payment_mode': self.payment_mode,
@@ -174,6 +240,10 @@ class TeliumData(six.with_metaclass(ABCMeta, object)):
             '_private': self.private
         }
 
+    @property
+    def __dict__(self):
+        return self.to_dict()
+
     @property
     def json(self):
         """
@@ -181,14 +251,20 @@ class TeliumData(six.with_metaclass(ABCMeta, object)):
         :return: JSON representation-like of instance
         :rtype: str
         """
-        return json.dumps(self, default=lambda o: o.__dict__,
-                          sort_keys=True, indent=4)
+        from json import dumps
+        return dumps(self.to_dict(), sort_keys=True, indent=4)
+
+    def freeze(self):
+        """
+        Create a compact and immutable copy of this instance
+        """
+        raise NotImplementedError
 
 
 class TeliumAsk(TeliumData):
     def __init__(self, pos_number, answer_flag, transaction_type, payment_mode, currency_numeric, delay, authorization,
-                 amount):
-        super(TeliumAsk, self).__init__(pos_number, amount, payment_mode, currency_numeric, ' ' * 10)
+                 amount, amount_cents=None):
+        super(TeliumAsk, self).__init__(pos_number, amount, payment_mode, currency_numeric, ' ' * 10, amount_cents)
         self._answer_flag = answer_flag
         self._transaction_type = transaction_type
         self._payment_mode = payment_mode
@@ -239,7 +315,7 @@ class TeliumAsk(TeliumData):
 
             str(self.pos_number) +  # 2 octets  0:3
 
-            ('%.0f' % (self.amount * 100)).zfill(8) +  # 8 octets  3:11
+            '%08d' % self.amount_cents +  # 8 octets  3:11
 
             self.answer_flag +  # 1 octet 11:12
 
@@ -292,13 +368,13 @@ class TeliumAsk(TeliumData):
             raw_message[13:16],  # currency_numeric
             raw_message[26:30],  # delay
             raw_message[30:34],  # authorization
-            float(raw_message[2:8] + '.' + raw_message[8:10])  # amount
+            None,
+            int(raw_message[2:10])  # amount in cents
         )
 
-    @property
-    def __dict__(self):
+    def to_dict(self):
 
-        new_dict = super(TeliumAsk, self).__dict__
+        new_dict = super(TeliumAsk, self).to_dict()
 
         new_dict.update({
             '_answer_flag': self.answer_flag,
@@ -310,6 +386,22 @@ class TeliumAsk(TeliumData):
 
         return new_dict
 
+    def freeze(self):
+        """
+        Create a compact and immutable copy of this instance
+        :rtype: telium.FrozenTeliumAsk
+        """
+        return FrozenTeliumAsk(
+            self.pos_number,
+            self.answer_flag,
+            self.transaction_type,
+            self.payment_mode,
+            self.currency_numeric,
+            self.delay,
+            self.authorization,
+            self.amount_cents
+        )
+
     @staticmethod
     def new_payment(
             amount,
@@ -318,17 +410,19 @@ class TeliumAsk(TeliumData):
             checkout_unique_id='1',
             wait_for_transaction_to_end=True,
             collect_payment_source_info=True,
-            force_bank_verification=False):
+            force_bank_verification=False,
+            amount_cents=None):
         """
         Create new TeliumAsk in order to prepare debit payment.
         Most commonly used.
-        :param float amount: Amount requested
+        :param float|decimal.Decimal amount: Amount requested, could be None if amount_cents is set.
         :param str payment_mode: Specify transaction type. (debit, credit or refund)
         :param str target_currency: Target currency, must be written in letters. (EUR, USD, etc..)
         :param str checkout_unique_id: Unique checkout identifer.
         :param bool wait_for_transaction_to_end: Set to True if you need valid transaction status otherwise, set it to False.
         :param bool collect_payment_source_info: If you want to retrieve specifics data about payment source identification.
         :param bool force_bank_verification: Set it to True if your business need to enforce payment verification.
+        :param int amount_cents: Amount requested in cents, eg. 1250 for 12.50.
         :return: Ready to use TeliumAsk instance
         :rtype: TeliumAsk
         """
@@ -344,17 +438,19 @@ class TeliumAsk(TeliumData):
             target_currency,
             TERMINAL_REQUEST_ANSWER_WAIT_FOR_TRANSACTION if wait_for_transaction_to_end else TERMINAL_REQUEST_ANSWER_INSTANT,
             TERMINAL_FORCE_AUTHORIZATION_DISABLE if not force_bank_verification else TERMINAL_FORCE_AUTHORIZATION_ENABLE,
-            amount
+            amount,
+            amount_cents
         )
 
 
 class TeliumResponse(TeliumData):
-    def __init__(self, pos_number, transaction_result, amount, payment_mode, repport, currency_numeric, private):
-        super(TeliumResponse, self).__init__(pos_number, amount, payment_mode, currency_numeric, private)
+    def __init__(self, pos_number, transaction_result, amount, payment_mode, repport, currency_numeric, private,
+                 amount_cents=None):
+        super(TeliumResponse, self).__init__(pos_number, amount, payment_mode, currency_numeric, private, amount_cents)
         self._transaction_result = transaction_result
         self._repport = repport if repport is not None else ''
-        self._card_type = CardIdentifier.from_numbers(self._repport.split(' ')[0]) \
-            if self._repport not in [None, ''] else None
+        self._card_type = _UNRESOLVED if self._repport != '' else None
+        self._card_id_sha512 = _UNRESOLVED
 
     @property
     def transaction_result(self):
@@ -389,10 +485,13 @@ class TeliumResponse(TeliumData):
     @property
     def card_type(self):
         """
-        Return if available payment card type
+        Return if available payment card type.
+        Identified on first access only, then kept.
         :return: Card type if available
         :rtype: payment_card_identifier.PaymentCard|None
         """
+        if self._card_type is _UNRESOLVED:
+            self._card_type = identify_card(self._repport.split(' ')[0])
         return self._card_type
 
     @property
@@ -403,16 +502,20 @@ class TeliumResponse(TeliumData):
         :return: Card numbers
         :rtype: str
         """
-        return self._card_type.numbers if self._card_type is not None else self._repport
+        return self.card_type.numbers if self.card_type is not None else self._repport
 
     @property
     def card_id_sha512(self):
         """
         Return payment source id hash (sha512)
+        Computed on first access only, then kept.
         :return: Hash repr of payment source id.
         :rtype: str
         """
-        return hashlib.sha512(self.card_id.encode('utf-8')).hexdigest() if self._card_type is not None else None
+        if self._card_id_sha512 is _UNRESOLVED:
+            self._card_id_sha512 = hashlib.sha512(self.card_id.encode('utf-8')).hexdigest() \
+                if self.card_type is not None else None
+        return self._card_id_sha512
 
     @property
     def transaction_id(self):
@@ -437,7 +540,7 @@ class TeliumResponse(TeliumData):
 
             str(self.transaction_result) +  # 1 octet
 
-            ('%.0f' % (self.amount * 100)).zfill(8) +  # 8 octets
+            '%08d' % self.amount_cents +  # 8 octets
 
             str(self.payment_mode) +  # 1 octet
 
@@ -484,36 +587,379 @@ class TeliumResponse(TeliumData):
                                                       .format(data_size, TERMINAL_ANSWER_COMPLETE_SIZE,
                                                               TERMINAL_ANSWER_LIMITED_SIZE))
 
-        pos_number, transaction_result, amount, payment_mode = raw_message[0:2], int(raw_message[2]), float(
-            raw_message[3:9] + '.' + raw_message[9:11]), raw_message[11]
+        pos_number, transaction_result, amount_cents, payment_mode = raw_message[0:2], int(raw_message[2]), int(
+            raw_message[3:11]), raw_message[11]
 
         return TeliumResponse(
             pos_number,
             transaction_result,
-            amount,
+            None,
             payment_mode,
             report,
             currency_numeric,
-            private
+            private,
+            amount_cents
         )
 
-    @property
-    def __dict__(self):
+    @staticmethod
+    def decode_view(data):
+        """
+        Create a lazy TeliumResponseView from raw bytes array without copying nor parsing it.
+        Only LRC and length are verified, every field is parsed when accessed.
+        :param bytes|bytearray|memoryview data: Raw bytes answer from terminal
+        :return: Read-only view over raw bytes sequence.
+        :rtype: telium.TeliumResponseView
+        """
+        return TeliumResponseView(data)
+
+    @staticmethod
+    def decode_many(iterable_of_bytes, lazy=True):
+        """
+        Decode many raw answers, eg. archived frames.
+        :param iterable_of_bytes: Raw bytes answers
+        :param bool lazy: Yield TeliumResponseView if True, TeliumResponse otherwise.
+        :return: Generator of decoded answers, in the same order.
+        :rtype: collections.Iterable[telium.TeliumResponseView|telium.TeliumResponse]
+        """
+        decode = TeliumResponseView if lazy else TeliumResponse.decode
+
+        for data in iterable_of_bytes:
+            yield decode(data)
 
-        new_dict = super(TeliumResponse, self).__dict__  # Copying parent __dict__
+    def freeze(self):
+        """
+        Create a compact and immutable copy of this instance
+        :rtype: telium.FrozenTeliumResponse
+        """
+        return FrozenTeliumResponse(
+            self.pos_number,
+            self.transaction_result,
+            self.amount_cents,
+            self.payment_mode,
+            self.repport,
+            self.currency_numeric,
+            self.private
+        )
+
+    def to_dict(self):
+
+        new_dict = super(TeliumResponse, self).to_dict()  # Copying parent dict
 
         new_dict.update({  # Merge the parent one with this new one
             'has_succeeded': self.has_succeeded,
             'transaction_id': self.transaction_id,
             '_transaction_result': self.transaction_result,
             '_repport': self.repport,
-            '_card_type': {
-                '_name': self.card_type.name,
-                '_regex': self.card_type.regex.pattern,
-                '_numbers': self.card_type.numbers,
-                '_masked_numbers': self.card_type.masked_numbers(),
-                '_sha512_numbers': self.card_id_sha512
-            } if self.card_type is not None else None
+            '_card_type': _card_type_dict(self.card_type, self.card_id_sha512)
         })
 
         return new_dict  # Return new dict
+
+
+class TeliumResponseView(object):
+    """
+    Read-only view over a raw answer from terminal.
+    Nothing is copied nor parsed on creation, each field is read from the underlying buffer when accessed.
+    Use TeliumResponse.decode_view or TeliumResponse.decode_many to create it.
+    """
+
+    __slots__ = ('_raw', '_is_complete')
+
+    def __init__(self, data):
+        """
+        :param bytes|bytearray|memoryview data: Raw bytes answer from terminal including STX..ETX.LRC
+        """
+        raw = memoryview(data)
+        data_size = len(raw)
+
+        if data_size not in (TERMINAL_ANSWER_COMPLETE_SIZE, TERMINAL_ANSWER_LIMITED_SIZE):
+            raise SequenceDoesNotMatchLengthException('Cannot decode raw sequence with length = {0}, '
+                                                      'should be {1} octet(s) or {2} octet(s) long.'
+                                                      .format(data_size, TERMINAL_ANSWER_COMPLETE_SIZE,
+                                                              TERMINAL_ANSWER_LIMITED_SIZE))
+
+        if TeliumData.lrc(raw[1:-1]) != six.indexbytes(raw, -1):
+            raise LrcChecksumException('Cannot decode data with erroned LRC check.')
+
+        self._raw = raw
+        self._is_complete = data_size == TERMINAL_ANSWER_COMPLETE_SIZE
+
+    def _text(self, start, stop):
+        return self._raw[start:stop].tobytes().decode(TERMINAL_DATA_ENCODING)
+
+    @property
+    def raw(self):
+        """
+        Underlying buffer
+        :rtype: memoryview
+        """
+        return self._raw
+
+    @property
+    def pos_number(self):
+        """
+        :rtype: str
+        """
+        return self._text(1, 3)
+
+    @property
+    def transaction_result(self):
+        """
+        :rtype: int
+        """
+        return six.indexbytes(self._raw, 3) - 48
+
+    @property
+    def has_succeeded(self):
+        """
+        Verify if payment has been succesfuly processed.
+        :rtype: bool
+        """
+        return self.transaction_result == TERMINAL_PAYMENT_SUCCESS
+
+    @property
+    def amount(self):
+        """
+        Payment amount
+        :rtype: float
+        """
+        return self.amount_cents / 100.0
+
+    @property
+    def amount_cents(self):
+        """
+        Payment amount in cents
+        :rtype: int
+        """
+        return int(self._raw[4:12].tobytes())
+
+    @property
+    def payment_mode(self):
+        """
+        :rtype: str
+        """
+        return self._text(12, 13)
+
+    @property
+    def repport(self):
+        """
+        Contain data like the card numbers for instance, empty if answer is limited.
+        :rtype: str
+        """
+        return self._text(13, 68) if self._is_complete else ''
+
+    @property
+    def currency_numeric(self):
+        """
+        :rtype: str
+        """
+        return self._text(68, 71) if self._is_complete else self._text(13, 16)
+
+    @property
+    def currency_alpha(self):
+        """
+        :rtype: str|None
+        """
+        return numeric_to_alpha(self.currency_numeric)
+
+    @property
+    def private(self):
+        """
+        :rtype: str
+        """
+        return self._text(71, 81) if self._is_complete else self._text(16, 26)
+
+    @property
+    def transaction_id(self):
+        """
+        Alias of self.private
+        :rtype: str
+        """
+        return self.private
+
+    @property
+    def card_type(self):
+        """
+        Identify payment card type, not kept between calls.
+        :rtype: payment_card_identifier.PaymentCard|None
+        """
+        return identify_card(self.repport.split(' ')[0]) if self._is_complete else None
+
+    def freeze(self):
+        """
+        Copy fields out of the underlying buffer into a compact and immutable instance.
+        :rtype: telium.FrozenTeliumResponse
+        """
+        return FrozenTeliumResponse(
+            self.pos_number,
+            self.transaction_result,
+            self.amount_cents,
+            self.payment_mode,
+            self.repport,
+            self.currency_numeric,
+            self.private
+        )
+
+    def to_response(self):
+        """
+        Materialize this view into a regular TeliumResponse.
+        :rtype: telium.TeliumResponse
+        """
+        return TeliumResponse(
+            self.pos_number,
+            self.transaction_result,
+            None,
+            self.payment_mode,
+            self.repport,
+            self.currency_numeric,
+            self.private,
+            self.amount_cents
+        )
+
+
+class FrozenTeliumAsk(namedtuple('FrozenTeliumAsk', ['pos_number', 'answer_flag', 'transaction_type', 'payment_mode',
+                                                     'currency_numeric', 'delay', 'authorization', 'amount_cents'])):
+    """
+    Compact and immutable TeliumAsk, without per instance __dict__.
+    Amount is kept in cents like the frame carry it. Use TeliumAsk.freeze to create it.
+    """
+
+    __slots__ = ()
+
+    @property
+    def private(self):
+        return ' ' * 10
+
+    @property
+    def amount(self):
+        return self.amount_cents / 100.0
+
+    @property
+    def currency_alpha(self):
+        return numeric_to_alpha(self.currency_numeric)
+
+    def thaw(self):
+        """
+        Create a regular TeliumAsk back from this instance.
+        :rtype: telium.TeliumAsk
+        """
+        return TeliumAsk(
+            self.pos_number,
+            self.answer_flag,
+            self.transaction_type,
+            self.payment_mode,
+            self.currency_numeric,
+            self.delay,
+            self.authorization,
+            None,
+            self.amount_cents
+        )
+
+    def encode(self):
+        """
+        Transform current object so it could be transfered to device (Protocol E)
+        :rtype: str
+        """
+        return self.thaw().encode()
+
+    def to_dict(self):
+        """
+        Export instance fields into a new dict, same keys as TeliumAsk.to_dict
+        :rtype: dict
+        """
+        return {
+            '_pos_number': self.pos_number,
+            '_payment_mode': self.payment_mode,
+            '_currency_numeric': self.currency_numeric,
+            '_amount': self.amount,
+            '_private': self.private,
+            '_answer_flag': self.answer_flag,
+            '_transaction_type': self.transaction_type,
+            '_delay': self.delay,
+            '_authorization': self.authorization
+        }
+
+
+class FrozenTeliumResponse(namedtuple('FrozenTeliumResponse', ['pos_number', 'transaction_result', 'amount_cents',
+                                                               'payment_mode', 'repport', 'currency_numeric',
+                                                               'private'])):
+    """
+    Compact and immutable TeliumResponse, without per instance __dict__.
+    Amount is kept in cents like the frame carry it.
+    Use TeliumResponse.freeze or TeliumResponseView.freeze to create it.
+    """
+
+    __slots__ = ()
+
+    @property
+    def has_succeeded(self):
+        return self.transaction_result == TERMINAL_PAYMENT_SUCCESS
+
+    @property
+    def transaction_id(self):
+        return self.private
+
+    @property
+    def amount(self):
+        return self.amount_cents / 100.0
+
+    @property
+    def currency_alpha(self):
+        return numeric_to_alpha(self.currency_numeric)
+
+    @property
+    def card_type(self):
+        """
+        Identify payment card type, not kept between calls.
+        :rtype: payment_card_identifier.PaymentCard|None
+        """
+        return identify_card(self.repport.split(' ')[0]) if self.repport != '' else None
+
+    @property
+    def card_id(self):
+        card_type = self.card_type
+        return card_type.numbers if card_type is not None else self.repport
+
+    @property
+    def card_id_sha512(self):
+        card_type = self.card_type
+        return hashlib.sha512(card_type.numbers.encode('utf-8')).hexdigest() if card_type is not None else None
+
+    def thaw(self):
+        """
+        Create a regular TeliumResponse back from this instance.
+        :rtype: telium.TeliumResponse
+        """
+        return TeliumResponse(
+            self.pos_number,
+            self.transaction_result,
+            None,
+            self.payment_mode,
+            self.repport,
+            self.currency_numeric,
+            self.private,
+            self.amount_cents
+        )
+
+    def to_dict(self):
+        """
+        Export instance fields into a new dict, same keys as TeliumResponse.to_dict
+        :rtype: dict
+        """
+        card_type = self.card_type
+
+        return {
+            '_pos_number': self.pos_number,
+            '_payment_mode': self.payment_mode,
+            '_currency_numeric': self.currency_numeric,
+            '_amount': self.amount,
+            '_private': self.private,
+            'has_succeeded': self.has_succeeded,
+            'transaction_id': self.transaction_id,
+            '_transaction_result': self.transaction_result,
+            '_repport': self.repport,
+            '_card_type': _card_type_dict(
+                card_type,
+                hashlib.sha512(card_type.numbers.encode('utf-8')).hexdigest() if card_type is not None else None
+            )
+        }
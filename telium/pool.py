@@ -0,0 +1,257 @@
+from threading import Thread, Lock
+
+from concurrent.futures import Future
+from six.moves.queue import Queue
+
+from telium.constant import *
+from telium.discovery import discover, DiscoveredTerminal, LINK_PARAMETERS
+from telium.manager import Telium, TeliumNativeSerial
+
+
+class TerminalPoolEmptyException(IOError):
+    pass
+
+
+class PoolTerminal(object):
+    """
+    One opened terminal held by a TerminalPool with its own request queue.
+    Requests are processed one after another so two transactions never interleave on the same link.
+    """
+
+    def __init__(self, device, pos_number=None):
+        """
+        :param telium.Telium device: Opened device
+        :param str pos_number: Checkout id bound to this terminal if any
+        """
+        self._device = device
+        self._pos_number = pos_number.zfill(2) if pos_number is not None else None
+        self._queue = Queue()
+        self._pending = 0
+        self._pending_lock = Lock()
+
+        self._worker = Thread(target=self.__run, name='telium-pool-{0}'.format(device.path))
+        self._worker.daemon = True
+        self._worker.start()
+
+    @property
+    def device(self):
+        """
+        :rtype: telium.Telium
+        """
+        return self._device
+
+    @property
+    def pos_number(self):
+        """
+        Checkout id bound to this terminal, None if terminal accept any checkout.
+        :rtype: str|None
+        """
+        return self._pos_number
+
+    @property
+    def pending(self):
+        """
+        Number of transactions queued or running on this terminal.
+        :rtype: int
+        """
+        return self._pending
+
+    @property
+    def is_idle(self):
+        """
+        :return: True if nothing is queued nor running on this terminal.
+        :rtype: bool
+        """
+        return self._pending == 0
+
+    def submit(self, telium_ask, waiting_timeout=DELAY_TERMINAL_ANSWER_TRANSACTION, raspberry_pi=False):
+        """
+        Queue a transaction on this terminal.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :param float waiting_timeout: Custom waiting delay in seconds before giving up on waiting terminal answer.
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :return: Future resolved with TeliumResponse or None if terminal refused the transaction.
+        :rtype: concurrent.futures.Future
+        """
+        future = Future()
+
+        with self._pending_lock:
+            self._pending += 1
+
+        self._queue.put((future, telium_ask, waiting_timeout, raspberry_pi))
+
+        return future
+
+    def stop(self):
+        """
+        Stop worker once every queued transaction has been processed.
+        """
+        self._queue.put(None)
+        self._worker.join()
+
+    def __run(self):
+        while True:
+            item = self._queue.get()
+
+            if item is None:
+                break
+
+            future, telium_ask, waiting_timeout, raspberry_pi = item
+            answer, error = None, None
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    if self._device.ask(telium_ask, raspberry_pi):
+                        answer = self._device.verify(telium_ask, waiting_timeout, raspberry_pi)
+                except Exception as e:
+                    error = e
+
+            # Terminal is released before notifying so that callers see it idle as soon as they get an answer.
+            with self._pending_lock:
+                self._pending -= 1
+
+            if not future.cancelled():
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(answer)
+
+
+class TerminalPool(object):
+    """
+    Keep one opened link per attached terminal and route transactions to them.
+    """
+
+    def __init__(self, paths=None, lanes=None, device_class=Telium, **device_kwargs):
+        """
+        :param list[str|telium.DiscoveredTerminal] paths: Devices path to open, or terminals found by
+            telium.discovery.discover that are opened with their own link parameters.
+            Discover every attached terminal that answer if not set.
+        :param dict lanes: Bind checkout id to device path, eg. {'1': '/dev/ttyACM0'}
+        :param type device_class: Telium or TeliumNativeSerial. Only 7E1 terminals are discovered with the latter.
+        :param device_kwargs: Extra arguments given to device_class on creation
+        """
+        lanes = lanes if lanes is not None else dict()
+
+        if paths is None:
+            paths = TerminalPool.discover(device_kwargs.get('baudrate', 9600), device_class)
+
+        discovered = dict((path.path, path) for path in paths if isinstance(path, DiscoveredTerminal))
+        paths = [path.path if isinstance(path, DiscoveredTerminal) else path for path in paths]
+
+        for path in lanes.values():
+            if path not in paths:
+                paths.append(path)
+
+        pos_numbers = dict((path, pos_number) for pos_number, path in lanes.items())
+
+        self._terminals = []
+
+        try:
+            for path in paths:
+                if path in discovered:
+                    device = TerminalPool._open_discovered(discovered[path], device_class, device_kwargs)
+                else:
+                    device = device_class(path, **device_kwargs)
+
+                self._terminals.append(PoolTerminal(device, pos_numbers.get(path)))
+        except Exception:
+            # Do not leak workers nor links opened before the one that failed.
+            self.close()
+            raise
+
+    @staticmethod
+    def discover(baudrate=9600, device_class=Telium):
+        """
+        List every terminal that answered the discovery probe, see telium.discovery.discover.
+        :param int baudrate: Baud rate to probe
+        :param type device_class: Telium or TeliumNativeSerial, only 7E1 terminals are looked for with the latter.
+        :return: Terminals sorted by path, with their link parameters
+        :rtype: list[telium.DiscoveredTerminal]
+        """
+        if issubclass(device_class, TeliumNativeSerial):
+            # TeliumNativeSerial cannot be given link parameters, it is always 7E1.
+            terminals = discover(baudrates=(baudrate,), link_parameters=(LINK_PARAMETERS[1],))
+        else:
+            terminals = discover(baudrates=(baudrate,), device_class=device_class)
+
+        return sorted(terminals, key=lambda terminal: terminal.path)
+
+    @staticmethod
+    def _open_discovered(terminal, device_class, device_kwargs):
+        """
+        Open a discovered terminal with its own link parameters.
+        :param telium.DiscoveredTerminal terminal: Terminal to open
+        :param type device_class: Telium or TeliumNativeSerial
+        :param dict device_kwargs: Extra arguments given to device_class, baudrate is the discovered one.
+        :rtype: telium.Telium
+        """
+        kwargs = dict((name, value) for name, value in device_kwargs.items() if name != 'baudrate')
+
+        if issubclass(device_class, TeliumNativeSerial):
+            return device_class(terminal.path, baudrate=terminal.baudrate, **kwargs)
+
+        return terminal.open(device_class, **kwargs)
+
+    @property
+    def terminals(self):
+        """
+        :rtype: list[PoolTerminal]
+        """
+        return list(self._terminals)
+
+    def __len__(self):
+        return len(self._terminals)
+
+    def route(self, telium_ask):
+        """
+        Pick terminal that should process given transaction.
+        Terminal bound to the checkout id first, then any idle terminal, then the least busy one.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :return: Chosen terminal
+        :rtype: PoolTerminal
+        """
+        if not self._terminals:
+            raise TerminalPoolEmptyException('There is no terminal available in this pool.')
+
+        for terminal in self._terminals:
+            if terminal.pos_number is not None and terminal.pos_number == telium_ask.pos_number:
+                return terminal
+
+        free_terminals = [terminal for terminal in self._terminals if terminal.pos_number is None]
+
+        for terminal in free_terminals:
+            if terminal.is_idle:
+                return terminal
+
+        return min(free_terminals or self._terminals, key=lambda t: t.pending)
+
+    def submit(self, telium_ask, waiting_timeout=DELAY_TERMINAL_ANSWER_TRANSACTION, raspberry_pi=False):
+        """
+        Queue transaction on the appropriate terminal without waiting for it.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :param float waiting_timeout: Custom waiting delay in seconds before giving up on waiting terminal answer.
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :return: Future resolved with TeliumResponse or None
+        :rtype: concurrent.futures.Future
+        """
+        return self.route(telium_ask).submit(telium_ask, waiting_timeout, raspberry_pi)
+
+    def transact(self, telium_ask, waiting_timeout=DELAY_TERMINAL_ANSWER_TRANSACTION, raspberry_pi=False):
+        """
+        Run a complete transaction (ask then verify) on the appropriate terminal.
+        :param telium.TeliumAsk telium_ask: Payment info
+        :param float waiting_timeout: Custom waiting delay in seconds before giving up on waiting terminal answer.
+        :param bool raspberry_pi: Set it to True if you'r running Raspberry PI
+        :return: TeliumResponse or None if terminal refused the transaction or did not answer.
+        :rtype: telium.TeliumResponse|None
+        """
+        return self.submit(telium_ask, waiting_timeout, raspberry_pi).result()
+
+    def close(self):
+        """
+        Wait for queued transactions then close every link.
+        """
+        for terminal in self._terminals:
+            terminal.stop()
+            terminal.device.close()
@@ -0,0 +1,49 @@
+"""
+Retransmission policy of the protocol engine. A frame refused with NAK is sent again after a short jittered backoff,
+an answer received with an erroned LRC is refused with NAK so that terminal send it again.
+"""
+import random
+from time import sleep
+
+RETRY_COUNT = 2  # Retransmissions of one frame, on top of its first transmission.
+RETRY_BACKOFF_BASE_MS = 10
+RETRY_BACKOFF_MAX_MS = 100
+
+
+class RetryPolicy(object):
+    """
+    Bound retransmissions of one frame and the delay before each of them.
+    Delay is drawn uniformly up to an exponentially growing ceiling, so that host and terminal do not collide again.
+    """
+
+    def __init__(self, retries=RETRY_COUNT, backoff_base_ms=RETRY_BACKOFF_BASE_MS,
+                 backoff_max_ms=RETRY_BACKOFF_MAX_MS, rng=None):
+        """
+        :param int retries: Retransmissions allowed for one frame, 0 to never retransmit
+        :param float backoff_base_ms: Ceiling of the first backoff in milliseconds, doubled on every retry
+        :param float backoff_max_ms: Highest ceiling in milliseconds
+        :param random.Random rng: Source of jitter
+        """
+        if retries < 0 or backoff_base_ms < 0 or backoff_max_ms < backoff_base_ms:
+            raise ValueError('Retries and backoff should be positive, maximal backoff cannot be lower than base.')
+
+        self._retries = retries
+        self._backoff_base_ms = backoff_base_ms
+        self._backoff_max_ms = backoff_max_ms
+        self._rng = rng if rng is not None else random.Random()
+
+    @property
+    def retries(self):
+        return self._retries
+
+    def backoff(self, retry):
+        """
+        :param int retry: Number of retransmissions already done for this frame
+        :return: Seconds to wait before next retransmission
+        :rtype: float
+        """
+        ceiling = min(self._backoff_max_ms, self._backoff_base_ms * (1 << min(retry, 16)))
+        return self._rng.uniform(0, ceiling) / 1e3
+
+    def wait(self, retry):
+        sleep(self.backoff(retry))
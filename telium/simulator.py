@@ -0,0 +1,419 @@
+"""
+Deterministic terminal simulator, emulate Telium Manager terminals over pseudo-terminals.
+Only available on POSIX platforms.
+"""
+import os
+import pty
+import select
+import tty
+from random import Random
+from threading import Thread, Event, Lock
+from time import sleep
+
+from telium.constant import *
+from telium.decoder import FrameDecoder
+from telium.payment import TeliumAsk, TeliumResponse, LrcChecksumException, SequenceDoesNotMatchLengthException
+
+SIMULATOR_FAULT_BAD_LRC = 'bad_lrc'  # Answer sent with an erroned LRC
+SIMULATOR_FAULT_MISSING_EOT = 'missing_eot'  # Answer never followed by EOT
+SIMULATOR_FAULT_NAK = 'nak'  # Payment request refused with NAK
+
+SIMULATOR_POLL_INTERVAL = 0.05
+SIMULATOR_SIGNAL_TIMEOUT = 2.0
+SIMULATOR_MAX_ATTEMPTS = 3  # Frame sent or received at most this number of times when NAK is involved
+
+_STX = bytes(bytearray([CONTROL_NAMES.index('STX')]))
+_ENQ = bytes(bytearray([CONTROL_NAMES.index('ENQ')]))
+_EOT = bytes(bytearray([CONTROL_NAMES.index('EOT')]))
+_ACK = bytes(bytearray([CONTROL_NAMES.index('ACK')]))
+_NAK = bytes(bytearray([CONTROL_NAMES.index('NAK')]))
+
+
+def constant_latency(seconds):
+    """
+    :return: Latency distribution always giving the same delay
+    """
+    return lambda rng: seconds
+
+
+def uniform_latency(low, high):
+    """
+    :return: Latency distribution uniformly spread between low and high seconds
+    """
+    return lambda rng: rng.uniform(low, high)
+
+
+def gaussian_latency(mu, sigma):
+    """
+    :return: Normal latency distribution, never negative
+    """
+    return lambda rng: max(0.0, rng.gauss(mu, sigma))
+
+
+def exponential_latency(mean):
+    """
+    :return: Exponential latency distribution of given mean in seconds
+    """
+    return lambda rng: rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+
+class SimulationProfile(object):
+    """
+    Describe how simulated terminals behave.
+    """
+
+    def __init__(self,
+                 latency=None,
+                 approval_ratio=1.0,
+                 decline_ratio=0.0,
+                 faults=None):
+        """
+        :param callable latency: Called with a random.Random, return seconds spent before answering. No delay if not set.
+        :param float approval_ratio: Part of transactions answered with TERMINAL_PAYMENT_SUCCESS
+        :param float decline_ratio: Part of transactions answered with TERMINAL_PAYMENT_REJECTED,
+            remaining part is answered with TERMINAL_PAYMENT_NOT_VERIFIED.
+        :param dict faults: Probability of every injected fault, eg. {SIMULATOR_FAULT_BAD_LRC: 0.01}
+        """
+        if approval_ratio < 0 or decline_ratio < 0 or approval_ratio + decline_ratio > 1.0:
+            raise ValueError('Approval and decline ratios should be positive and their sum should not exceed 1.')
+
+        self.latency = latency if latency is not None else constant_latency(0.0)
+        self.approval_ratio = approval_ratio
+        self.decline_ratio = decline_ratio
+        self.faults = dict(faults) if faults is not None else dict()
+
+    def transaction_result(self, rng):
+        draw = rng.random()
+
+        if draw < self.approval_ratio:
+            return TERMINAL_PAYMENT_SUCCESS
+        elif draw < self.approval_ratio + self.decline_ratio:
+            return TERMINAL_PAYMENT_REJECTED
+        return TERMINAL_PAYMENT_NOT_VERIFIED
+
+    def fault(self, rng, fault):
+        return rng.random() < self.faults.get(fault, 0.0)
+
+
+class SimulatedTerminal(object):
+    """
+    One terminal emulated behind a pseudo-terminal. Open path with Telium like a real device.
+    Handle transactions and is_ok probes one after another until stopped.
+    """
+
+    def __init__(self, profile=None, seed=None):
+        """
+        :param SimulationProfile profile: Terminal behaviour, always approve without delay if not set.
+        :param int seed: Seed of this terminal random generator, same seed give the same sequence of answers.
+        """
+        self._profile = profile if profile is not None else SimulationProfile()
+        self._rng = Random(seed)
+
+        self._master, self._slave = pty.openpty()
+        self._unread = b''  # Bytes read past the end of an exchange, they belong to the next one.
+        tty.setraw(self._slave)
+        self._path = os.ttyname(self._slave)
+
+        self._stopped = Event()
+        self._stats_lock = Lock()
+        self._stats = {
+            'transactions': 0,
+            'approved': 0,
+            'declined': 0,
+            'not_verified': 0,
+            'probes': 0,
+            'faults': 0
+        }
+
+        self._thread = Thread(target=self.__run, name='telium-simulator-{0}'.format(self._path))
+        self._thread.daemon = True
+
+    @property
+    def path(self):
+        """
+        Device path to give to Telium
+        :rtype: str
+        """
+        return self._path
+
+    @property
+    def stats(self):
+        """
+        Counters of what this terminal went through so far.
+        :rtype: dict
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, key):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+
+        if self._thread.is_alive():
+            self._thread.join()
+
+        for file_descriptor in (self._master, self._slave):
+            try:
+                os.close(file_descriptor)
+            except OSError:
+                pass
+
+    def _read(self, size, timeout=SIMULATOR_SIGNAL_TIMEOUT):
+        """
+        Read up to size bytes from host, give up on timeout or when simulator is stopped.
+        :rtype: bytes
+        """
+        if self._unread:
+            data, self._unread = self._unread[:size], self._unread[size:]
+            return data
+
+        waited = 0.0
+
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([self._master], [], [], SIMULATOR_POLL_INTERVAL)
+
+            if readable:
+                return os.read(self._master, size)
+
+            waited += SIMULATOR_POLL_INTERVAL
+
+            if timeout is not None and waited >= timeout:
+                break
+
+        return b''
+
+    def _wait_signal(self, signal, timeout=SIMULATOR_SIGNAL_TIMEOUT):
+        return self._read(1, timeout) == bytes(bytearray([CONTROL_NAMES.index(signal)]))
+
+    def _send_signal(self, signal):
+        os.write(self._master, bytes(bytearray([CONTROL_NAMES.index(signal)])))
+
+    def _read_ask(self):
+        """
+        Read host payment request, None if host ended communication with EOT instead.
+        :rtype: telium.TeliumAsk|None
+        """
+        decoder = FrameDecoder(TeliumAsk.decode, max_size=TERMINAL_ASK_REQUIRED_SIZE + 3)
+
+        while True:
+            chunk = self._read(TERMINAL_ASK_REQUIRED_SIZE + 3)
+
+            if not chunk:
+                return None
+
+            if not decoder.in_frame:
+                # Line noise is dropped up to the next frame or signal, like a real terminal would.
+                offset = 0
+
+                while offset < len(chunk) and chunk[offset:offset + 1] not in (_STX, _EOT, _ENQ):
+                    offset += 1
+
+                chunk = chunk[offset:]
+
+                if not chunk:
+                    continue
+
+            if not decoder.in_frame and chunk[:1] == _EOT:
+                self._count('probes')
+                self._unread = chunk[1:] + self._unread
+                return None
+
+            if not decoder.in_frame and chunk[:1] == _ENQ:
+                # Host gave up on previous attempt and start over
+                self._send_signal('ACK')
+                self._unread = chunk[1:] + self._unread
+                continue
+
+            asks = decoder.feed(chunk)
+
+            if asks:
+                return asks[0]
+
+    def _answer(self, telium_ask):
+        transaction_result = self._profile.transaction_result(self._rng)
+
+        self._count({
+            TERMINAL_PAYMENT_SUCCESS: 'approved',
+            TERMINAL_PAYMENT_REJECTED: 'declined',
+            TERMINAL_PAYMENT_NOT_VERIFIED: 'not_verified'
+        }[transaction_result])
+
+        if telium_ask.answer_flag == TERMINAL_ANSWER_SET_FULLSIZED:
+            repport = self._card_numbers().ljust(55)
+        else:
+            repport = None
+
+        return TeliumResponse(
+            telium_ask.pos_number,
+            transaction_result,
+            None,
+            telium_ask.payment_mode,
+            repport,
+            telium_ask.currency_numeric,
+            str(self._rng.randint(0, 9999999999)).zfill(10),
+            telium_ask.amount_cents
+        )
+
+    def _card_numbers(self):
+        """
+        Draw a VISA card numbers that pass Luhn checksum.
+        :rtype: str
+        """
+        digits = [4] + [self._rng.randint(0, 9) for _ in range(14)]
+        checksum = 0
+
+        for i, digit in enumerate(reversed(digits)):
+            if i % 2 == 0:
+                digit *= 2
+                digit = digit - 9 if digit > 9 else digit
+            checksum += digit
+
+        return ''.join(str(digit) for digit in digits) + str((10 - checksum % 10) % 10)
+
+    def _transaction(self):
+        """
+        Run one ENQ initiated exchange from host, either a payment or an is_ok probe.
+        Frames are received again or sent again when NAK is involved, like Protocol E expect.
+        """
+        self._send_signal('ACK')
+
+        telium_ask, nak_injected = None, False
+
+        for _ in range(SIMULATOR_MAX_ATTEMPTS):
+            try:
+                telium_ask = self._read_ask()
+            except (LrcChecksumException, SequenceDoesNotMatchLengthException):
+                self._send_signal('NAK')
+                continue
+
+            if telium_ask is None:
+                return
+
+            if not nak_injected and self._profile.fault(self._rng, SIMULATOR_FAULT_NAK):
+                nak_injected = True
+                self._count('faults')
+                self._send_signal('NAK')
+                telium_ask = None
+                continue
+
+            break
+
+        if telium_ask is None:
+            return
+
+        self._send_signal('ACK')
+
+        if not self._wait_signal('EOT'):
+            return
+
+        self._count('transactions')
+
+        frame = bytearray(self._answer(telium_ask).encode(), TERMINAL_DATA_ENCODING)
+
+        latency = self._profile.latency(self._rng)
+
+        if latency > 0:
+            sleep(latency)
+
+        self._send_signal('ENQ')
+
+        if not self._wait_signal('ACK'):
+            return
+
+        for attempt in range(SIMULATOR_MAX_ATTEMPTS):
+            if attempt == 0 and self._profile.fault(self._rng, SIMULATOR_FAULT_BAD_LRC):
+                self._count('faults')
+                os.write(self._master, bytes(frame[:-1] + bytearray([frame[-1] ^ 0xFF])))
+            else:
+                os.write(self._master, bytes(frame))
+
+            reply = self._read(1)
+
+            if reply == _ACK:
+                break
+            elif reply != _NAK:
+                return
+        else:
+            return
+
+        if self._profile.fault(self._rng, SIMULATOR_FAULT_MISSING_EOT):
+            self._count('faults')
+            return
+
+        self._send_signal('EOT')
+
+    def __run(self):
+        while not self._stopped.is_set():
+            try:
+                if self._wait_signal('ENQ', timeout=None):
+                    self._transaction()
+            except OSError:
+                # Pseudo-terminal has been closed
+                break
+
+
+class TerminalSimulator(object):
+    """
+    Emulate many terminals at once, each one behind its own pseudo-terminal.
+    """
+
+    def __init__(self, count=1, profile=None, seed=0):
+        """
+        :param int count: Number of terminals
+        :param SimulationProfile profile: Behaviour shared by every terminal
+        :param int seed: Terminal i is seeded with seed + i, so that a whole run can be replayed.
+        """
+        self._terminals = [
+            SimulatedTerminal(profile, seed + i if seed is not None else None) for i in range(count)
+        ]
+
+    @property
+    def terminals(self):
+        """
+        :rtype: list[SimulatedTerminal]
+        """
+        return list(self._terminals)
+
+    @property
+    def paths(self):
+        """
+        Device path of every simulated terminal, can be given to TerminalPool.
+        :rtype: list[str]
+        """
+        return [terminal.path for terminal in self._terminals]
+
+    @property
+    def stats(self):
+        """
+        Sum of every terminal counters.
+        :rtype: dict
+        """
+        total = dict()
+
+        for terminal in self._terminals:
+            for key, value in terminal.stats.items():
+                total[key] = total.get(key, 0) + value
+
+        return total
+
+    def start(self):
+        for terminal in self._terminals:
+            terminal.start()
+        return self
+
+    def stop(self):
+        for terminal in self._terminals:
+            terminal.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,274 @@
+"""
+Protocol tracing. Every signal and chunk exchanged with a terminal is kept in a small ring for post-mortem dumps
+and logged to the "telium.trace" logger at DEBUG level. Messages are only formatted if a handler emits them.
+ByteRing is the always-on counterpart, a preallocated ring of the last bytes exchanged.
+"""
+import logging
+import struct
+import sys
+from array import array
+from collections import deque, namedtuple
+from threading import Lock
+from time import time
+
+from telium.constant import CONTROL_NAMES
+from telium.hexdump import format_hexdump
+from telium.journal import JOURNAL_DIRECTION_OUT, JOURNAL_DIRECTION_IN
+
+TRACE_LOGGER_NAME = 'telium.trace'
+TRACE_RING_SIZE = 32  # Records kept in memory, a payment exchange is about ten records.
+
+BYTE_RING_CAPACITY = 4096  # Bytes kept by ByteRing, about forty payment exchanges.
+BYTE_RING_SEGMENTS = 1024  # Reads and writes kept by ByteRing, oldest are dropped first.
+
+BYTE_RING_RECORD = struct.Struct('<dBxH')  # timestamp, direction, length, then data in ByteRing binary dump
+
+_STDOUT_HANDLER_LOCK = Lock()
+_stdout_handler = None
+
+
+class TraceRecord(namedtuple('TraceRecord', ['timestamp', 'direction', 'data'])):
+    """
+    One write to or read from a terminal.
+    timestamp is a UNIX timestamp, direction is JOURNAL_DIRECTION_OUT or JOURNAL_DIRECTION_IN, data is raw bytes.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return '{0} {1} {2} byte(s){3}'.format(
+            '-->' if self.direction == JOURNAL_DIRECTION_OUT else '<--',
+            _describe(self.data),
+            len(self.data),
+            '' if len(self.data) <= 1 else '\n' + format_hexdump(self.data)
+        )
+
+
+def _describe(data):
+    if len(data) == 1:
+        code = bytearray(data)[0]
+        return CONTROL_NAMES[code] if code < len(CONTROL_NAMES) else 'Unknown'
+    return 'Chunk' if len(data) else 'Nothing'
+
+
+def enable_stdout_trace():
+    """
+    Print trace to stdout, what debugging=True did before tracing relied on logging.
+    Installed once whatever the number of Telium instances.
+    """
+    global _stdout_handler
+
+    with _STDOUT_HANDLER_LOCK:
+        if _stdout_handler is not None:
+            return
+
+        _stdout_handler = logging.StreamHandler(sys.stdout)
+        _stdout_handler.setFormatter(logging.Formatter('DEBUG :: %(message)s'))
+
+        logger = logging.getLogger(TRACE_LOGGER_NAME)
+        logger.addHandler(_stdout_handler)
+        logger.setLevel(logging.DEBUG)
+
+
+class ProtocolTracer(object):
+    """
+    Trace of one serial link. Keep the last records in memory and log them lazily.
+    """
+
+    def __init__(self, path, ring_size=TRACE_RING_SIZE, logger=None):
+        """
+        :param str path: Device path, prefix every log message
+        :param int ring_size: Number of records kept for dump
+        :param logging.Logger logger: Destination, "telium.trace" logger if not set
+        """
+        self._path = path
+        self._ring = deque(maxlen=ring_size)
+        self._logger = logger if logger is not None else logging.getLogger(TRACE_LOGGER_NAME)
+
+    def _record(self, direction, data):
+        record = TraceRecord(time(), direction, bytes(data))
+        self._ring.append(record)
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            # TraceRecord is rendered by str() only when a handler actually emit it.
+            self._logger.debug('%s %s', self._path, record)
+
+    def sent(self, data):
+        """
+        :param bytes data: Signal or frame written to terminal
+        """
+        self._record(JOURNAL_DIRECTION_OUT, data)
+
+    def received(self, data):
+        """
+        :param bytes data: Signal or chunk read from terminal, may be empty on timeout
+        """
+        self._record(JOURNAL_DIRECTION_IN, data)
+
+    @property
+    def records(self):
+        """
+        :return: Last records, oldest first
+        :rtype: list[telium.tracing.TraceRecord]
+        """
+        return list(self._ring)
+
+    def dump(self):
+        """
+        :return: Last records rendered as text, oldest first
+        :rtype: str
+        """
+        return '\n'.join('{0:.6f} {1} {2}'.format(record.timestamp, self._path, record) for record in self.records)
+
+    def clear(self):
+        self._ring.clear()
+
+
+class ByteRing(object):
+    """
+    Fixed-size ring of the last bytes exchanged with a terminal, with direction and timestamp of every read and write.
+    Storage is allocated once, appending copy bytes into it and fill one metadata slot, whatever the traffic.
+    """
+
+    def __init__(self, capacity=BYTE_RING_CAPACITY, segments=BYTE_RING_SEGMENTS):
+        """
+        :param int capacity: Bytes kept
+        :param int segments: Reads and writes kept
+        """
+        self._data = bytearray(capacity)
+        self._capacity = capacity
+
+        # One slot per read or write. Start is an absolute offset, bytes before written - capacity are lost.
+        self._timestamps = array('d', [0.0]) * segments
+        self._directions = array('B', [0]) * segments
+        self._starts = [0] * segments  # Plain integers, absolute offsets outgrow array('L') on some platforms.
+        self._lengths = array('L', [0]) * segments
+        self._segments = segments
+
+        self._written = 0
+        self._appended = 0
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def __len__(self):
+        """
+        :return: Number of bytes currently kept
+        :rtype: int
+        """
+        return min(self._written, self._capacity)
+
+    def append(self, direction, data):
+        """
+        :param int direction: JOURNAL_DIRECTION_OUT or JOURNAL_DIRECTION_IN
+        :param bytes|bytearray data: Bytes written or read, empty if a read timed out
+        """
+        data_len = len(data)
+        slot = self._appended % self._segments
+
+        self._timestamps[slot] = time()
+        self._directions[slot] = direction
+        self._starts[slot] = self._written
+        self._lengths[slot] = data_len
+
+        self._appended += 1
+
+        if data_len > self._capacity:
+            # Only the tail can be kept anyway.
+            data = memoryview(data)[data_len - self._capacity:]
+            self._written += data_len - self._capacity
+            data_len = self._capacity
+
+        position = self._written % self._capacity
+        head = min(data_len, self._capacity - position)
+
+        if head == data_len:
+            self._data[position:position + data_len] = data
+        else:
+            view = memoryview(data)
+            self._data[position:] = view[:head]
+            self._data[:data_len - head] = view[head:]
+
+        self._written += data_len
+
+    def _read(self, start, end):
+        position, length = start % self._capacity, end - start
+
+        if position + length <= self._capacity:
+            return bytes(self._data[position:position + length])
+
+        return bytes(self._data[position:] + self._data[:length - self._capacity + position])
+
+    def records(self):
+        """
+        Reads and writes still in the ring, the oldest one may be truncated.
+        :return: Oldest first
+        :rtype: list[telium.tracing.TraceRecord]
+        """
+        oldest = self._written - len(self)
+        records = []
+
+        for index in range(max(0, self._appended - self._segments), self._appended):
+            slot = index % self._segments
+            start, end = self._starts[slot], self._starts[slot] + self._lengths[slot]
+
+            if end < oldest or (end == oldest and self._lengths[slot]):
+                continue
+
+            records.append(TraceRecord(self._timestamps[slot], self._directions[slot], self._read(max(start, oldest),
+                                                                                                    end)))
+
+        return records
+
+    def hexdump(self):
+        """
+        :return: Records rendered as text with their hexdump, oldest first
+        :rtype: str
+        """
+        return format_records(self.records())
+
+    def binary(self):
+        """
+        :return: Records serialized for later analysis, see load_records
+        :rtype: bytes
+        """
+        return pack_records(self.records())
+
+    def clear(self):
+        self._written = self._appended = 0
+
+
+def format_records(records):
+    """
+    :param list[telium.tracing.TraceRecord] records: Records to render, eg. records of an exception raised by Telium
+    :return: Records rendered as text with their hexdump
+    :rtype: str
+    """
+    return '\n'.join('{0:.6f} {1}'.format(record.timestamp, record) for record in records)
+
+
+def pack_records(records):
+    """
+    :param list[telium.tracing.TraceRecord] records: Records to serialize
+    :rtype: bytes
+    """
+    return b''.join(BYTE_RING_RECORD.pack(record.timestamp, record.direction, len(record.data)) + record.data
+                    for record in records)
+
+
+def load_records(data):
+    """
+    Read back records serialized with pack_records or ByteRing.binary.
+    :param bytes data: Serialized records
+    :rtype: list[telium.tracing.TraceRecord]
+    """
+    records, offset = [], 0
+
+    while offset < len(data):
+        timestamp, direction, length = BYTE_RING_RECORD.unpack_from(data, offset)
+        offset += BYTE_RING_RECORD.size
+        records.append(TraceRecord(timestamp, direction, bytes(data[offset:offset + length])))
+        offset += length
+
+    return records
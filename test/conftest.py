@@ -0,0 +1,8 @@
+import six
+
+# Coroutine syntax does not even compile on Python 2, these modules are left out of collection there.
+collect_ignore = [
+    'test_aio.py',
+    'test_transact_aio.py',
+    'test_retry_aio.py',
+] if six.PY2 else []
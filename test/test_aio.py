@@ -0,0 +1,82 @@
+import asyncio
+from unittest import TestCase, main
+
+from telium import *
+from telium.simulator import TerminalSimulator, SimulationProfile, constant_latency
+from test.test_tpe import FakeTeliumDevice
+
+
+class TestAsyncTPE(TestCase):
+
+    def setUp(self):
+        self._fake_device = FakeTeliumDevice()
+        self._loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self._loop.close()
+
+    def test_demande_paiement_async(self):
+
+        self._fake_device.run_instance()
+
+        my_telium_instance = AsyncTelium(self._fake_device.s_name)
+
+        self.assertEqual(my_telium_instance.timeout, 1)
+
+        my_payment = TeliumAsk.new_payment(12.5, target_currency='EUR')
+
+        async def transaction():
+            self.assertTrue(await my_telium_instance.ask(my_payment))
+            return await my_telium_instance.verify(my_payment)
+
+        my_answer = self._loop.run_until_complete(transaction())
+
+        self.assertIsNotNone(my_answer)
+        self.assertEqual(my_answer.transaction_result, 0)
+        self.assertEqual(my_answer.amount, 12.5)
+        self.assertEqual(my_answer.currency_numeric, TERMINAL_NUMERIC_CURRENCY_EUR)
+
+        self.assertTrue(my_telium_instance.close())
+
+    def test_initialization_failed_async(self):
+        my_telium_instance = AsyncTelium(self._fake_device.s_name, timeout=0.2)
+
+        with self.assertRaises(TerminalInitializationFailedException):
+            self._loop.run_until_complete(my_telium_instance.ask(TeliumAsk.new_payment(12.5)))
+
+        self.assertFalse(self._loop.run_until_complete(my_telium_instance.is_ok()))
+
+    def test_verify_cancel(self):
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(0.5))) as my_simulator:
+            my_telium_instance = AsyncTelium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            async def cancel_verify():
+                self.assertTrue(await my_telium_instance.ask(my_payment))
+
+                pending = asyncio.ensure_future(my_telium_instance.verify(my_payment, waiting_timeout=10))
+                await asyncio.sleep(0.1)
+                pending.cancel()
+
+                with self.assertRaises(asyncio.CancelledError):
+                    await pending
+
+                # Link must be usable again right after cancellation, terminal still owe us the cancelled answer.
+                self.assertFalse(my_telium_instance.lock.locked())
+                self.assertTrue(my_telium_instance.in_transaction)
+
+                my_next_payment = TeliumAsk.new_payment(20.0)
+
+                self.assertTrue(await my_telium_instance.ask(my_next_payment))
+                self.assertEqual(my_telium_instance.abandoned_answer.amount, 12.5)
+                self.assertEqual((await my_telium_instance.verify(my_next_payment, waiting_timeout=5)).amount, 20.0)
+                self.assertFalse(my_telium_instance.in_transaction)
+                self.assertTrue(await my_telium_instance.is_ok())
+
+            self._loop.run_until_complete(asyncio.wait_for(cancel_verify(), 10))
+
+            my_telium_instance.close()
+
+
+if __name__ == '__main__':
+    main()
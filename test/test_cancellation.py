@@ -0,0 +1,104 @@
+from threading import Timer
+from unittest import TestCase, main
+
+from telium import *
+from telium.simulator import TerminalSimulator, SimulationProfile, constant_latency
+
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+
+
+class TestCancellation(TestCase):
+
+    def test_cancel_wait(self):
+        my_token, reports = CancellationToken(), []
+
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(1.0))) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            Timer(0.35, my_token.cancel).start()
+            started = monotonic()
+
+            with self.assertRaises(TerminalWaitCancelledException):
+                my_telium_instance.verify(my_payment, waiting_timeout=10, cancellation=my_token,
+                                          progress=lambda waited, remaining: reports.append((waited, remaining)))
+
+            # Woken up by the token itself, not by the end of a slice.
+            self.assertLess(monotonic() - started, 0.35 + DELAY_TERMINAL_ANSWER_POLL_INTERVAL)
+            self.assertEqual(my_telium_instance.bytes_received, 2)
+
+            my_telium_instance.close()
+
+        self.assertGreaterEqual(len(reports), 3)
+        self.assertTrue(all(remaining <= 10 for _, remaining in reports))
+        self.assertTrue(all(a[0] <= b[0] for a, b in zip(reports, reports[1:])))
+
+    def test_ask_after_cancel(self):
+        my_token = CancellationToken()
+
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(0.5))) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            Timer(0.1, my_token.cancel).start()
+
+            with self.assertRaises(TerminalWaitCancelledException):
+                my_telium_instance.verify(my_payment, waiting_timeout=10, cancellation=my_token)
+
+            # Terminal still owe us the cancelled answer, it is received before the next payment start.
+            self.assertTrue(my_telium_instance.in_transaction)
+
+            my_next_payment = TeliumAsk.new_payment(20.0)
+
+            self.assertTrue(my_telium_instance.ask(my_next_payment))
+            self.assertEqual(my_telium_instance.abandoned_answer.amount, 12.5)
+            self.assertEqual(my_telium_instance.verify(my_next_payment, waiting_timeout=5).amount, 20.0)
+            self.assertFalse(my_telium_instance.in_transaction)
+            self.assertTrue(my_telium_instance.is_ok())
+
+            my_telium_instance.close()
+
+        my_token.close()
+
+    def test_deadline(self):
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(1.0))) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            started = monotonic()
+
+            self.assertIsNone(my_telium_instance.verify(my_payment, deadline=started + 0.3))
+            self.assertLess(monotonic() - started, 0.8)
+
+            my_telium_instance.close()
+
+    def test_sliced_verify_answer(self):
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(0.3))) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+            my_token = CancellationToken()
+
+            my_future = my_telium_instance.transact(my_payment, waiting_timeout=5, cancellation=my_token)
+
+            self.assertEqual(my_future.result(timeout=5).amount_cents, 1250)
+
+            # Too late, nothing to cancel anymore.
+            my_token.cancel()
+            my_token.close()
+
+            self.assertTrue(my_telium_instance.is_ok())
+
+            my_telium_instance.close()
+
+
+if __name__ == '__main__':
+    main()
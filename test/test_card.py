@@ -0,0 +1,72 @@
+from unittest import TestCase, main
+
+from faker import Faker
+from payment_card_identifier import CardIdentifier, VISA, MasterCard
+
+from telium import *
+from telium.card import CardBrandCache, CARD_BRAND_CACHE
+
+
+class TestCardBrandCache(TestCase):
+
+    def setUp(self):
+        self._fake = Faker()
+
+    def test_identify_same_as_card_identifier(self):
+        my_cache = CardBrandCache()
+
+        for card_type in ['visa16', 'mastercard', 'amex', 'discover', 'jcb16']:
+            numbers = self._fake.credit_card_number(card_type=card_type)
+            expected = CardIdentifier.from_numbers(numbers)
+            identified = my_cache.identify(numbers)
+
+            self.assertEqual(type(identified), type(expected))
+
+        self.assertIsNone(my_cache.identify('0' * 55))
+        self.assertIsNone(my_cache.identify('4111111111111112'))  # Luhn checksum does not match
+
+    def test_cache_bounded_lru(self):
+        my_cache = CardBrandCache(maxsize=2)
+
+        self.assertIsInstance(my_cache.identify('4111111111111111'), VISA)
+        self.assertIsInstance(my_cache.identify('4111111111111111'), VISA)
+        self.assertEqual((my_cache.hits, my_cache.misses), (1, 1))
+
+        my_cache.identify('5500000000000004')
+        my_cache.identify('4111111111111111')
+        my_cache.identify('340000000000009')
+
+        self.assertEqual(len(my_cache), 2)
+        self.assertIsInstance(my_cache.identify('4111111111111111'), VISA)
+        self.assertEqual(my_cache.hits, 3)
+
+        my_cache.clear()
+        self.assertEqual(len(my_cache), 0)
+
+    def test_response_card_type_lazy(self):
+        my_answer = TeliumResponse(
+            '1',
+            TERMINAL_PAYMENT_SUCCESS,
+            12.5,
+            TERMINAL_MODE_PAYMENT_DEBIT,
+            '5500000000000004' + ' ' * 39,
+            TERMINAL_NUMERIC_CURRENCY_EUR,
+            '0' * 10
+        )
+
+        lookups = CARD_BRAND_CACHE.misses + CARD_BRAND_CACHE.hits
+
+        self.assertTrue(my_answer.has_succeeded)
+        self.assertEqual(CARD_BRAND_CACHE.misses + CARD_BRAND_CACHE.hits, lookups)
+
+        self.assertIsInstance(my_answer.card_type, MasterCard)
+        self.assertIs(my_answer.card_id_sha512, my_answer.card_id_sha512)
+        self.assertEqual(CARD_BRAND_CACHE.misses + CARD_BRAND_CACHE.hits, lookups + 1)
+
+        my_view = TeliumResponse.decode_view(my_answer.encode().encode(TERMINAL_DATA_ENCODING))
+
+        self.assertIsInstance(my_view.card_type, MasterCard)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+from unittest import TestCase, main, skipIf
+
+from telium import *
+from telium.columnar import decode_columns, numpy
+
+
+@skipIf(numpy is None, 'numpy is required for columnar decoding')
+class TestColumnarDecoder(TestCase):
+
+    def setUp(self):
+        self._answers = [
+            TeliumResponse(str(i + 1), TERMINAL_PAYMENT_SUCCESS if i % 2 else TERMINAL_PAYMENT_REJECTED,
+                           round(1.0 + i * 1000.01, 2), TERMINAL_MODE_PAYMENT_DEBIT, '0' * 55,
+                           TERMINAL_NUMERIC_CURRENCY_EUR, str(i).zfill(10))
+            for i in range(50)
+        ]
+
+    def test_decode_columns(self):
+        my_buffer = b''.join(my_answer.encode().encode(TERMINAL_DATA_ENCODING) for my_answer in self._answers)
+
+        my_columns = decode_columns(my_buffer)
+
+        self.assertEqual(len(my_columns), 50)
+        self.assertFalse(my_columns.bad.any())
+        self.assertEqual(my_columns.pos_number.tolist(), [i + 1 for i in range(50)])
+        self.assertEqual(my_columns.transaction_result.tolist(), [my_answer.transaction_result for my_answer in self._answers])
+        self.assertEqual(my_columns.amount_cents.tolist(), [int(round(my_answer.amount * 100)) for my_answer in self._answers])
+        self.assertEqual(my_columns.payment_mode.tolist(), [b'0'] * 50)
+        self.assertEqual(my_columns.currency_numeric.tolist(), [978] * 50)
+        self.assertEqual(my_columns.private[7], b'0000000007')
+
+    def test_decode_columns_limited_with_bad_lrc(self):
+        my_frames = [
+            bytearray(TeliumResponse('1', TERMINAL_PAYMENT_SUCCESS, 12.5, TERMINAL_MODE_PAYMENT_DEBIT, None,
+                                     TERMINAL_NUMERIC_CURRENCY_USD, '0' * 10).encode(), TERMINAL_DATA_ENCODING)
+            for _ in range(3)
+        ]
+
+        my_frames[1][-1] ^= 0xFF
+
+        my_columns = decode_columns(b''.join(my_frames), TERMINAL_ANSWER_LIMITED_SIZE)
+
+        self.assertEqual(my_columns.bad.tolist(), [False, True, False])
+        self.assertEqual(my_columns.currency_numeric.tolist(), [840] * 3)
+        self.assertEqual(my_columns.amount_cents.tolist(), [1250] * 3)
+
+        with self.assertRaises(SequenceDoesNotMatchLengthException):
+            decode_columns(b''.join(my_frames)[:-1], TERMINAL_ANSWER_LIMITED_SIZE)
+
+        with self.assertRaises(SequenceDoesNotMatchLengthException):
+            decode_columns(b''.join(my_frames), 30)
+
+
+if __name__ == '__main__':
+    main()
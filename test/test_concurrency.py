@@ -0,0 +1,103 @@
+from threading import Thread
+from unittest import TestCase, main
+
+from telium import *
+from telium.simulator import TerminalSimulator, SimulationProfile, constant_latency
+
+
+class TestConcurrency(TestCase):
+
+    def test_shared_instance(self):
+        answers, errors = [], []
+
+        def worker(my_telium_instance, amount):
+            try:
+                for _ in range(5):
+                    my_payment = TeliumAsk.new_payment(amount)
+
+                    with my_telium_instance.link_lock:
+                        # Whole transaction is kept together, link lock is reentrant for its owner.
+                        self.assertTrue(my_telium_instance.ask(my_payment))
+                        answers.append((amount, my_telium_instance.verify(my_payment, 2).amount))
+
+                    self.assertTrue(my_telium_instance.is_ok())
+            except Exception as e:
+                errors.append(e)
+
+        with TerminalSimulator(1) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+
+            workers = [Thread(target=worker, args=(my_telium_instance, amount)) for amount in (10.0, 20.0, 30.0)]
+
+            for my_worker in workers:
+                my_worker.start()
+            for my_worker in workers:
+                my_worker.join()
+
+            my_telium_instance.close()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(answers), 15)
+        self.assertTrue(all(amount == answer_amount for amount, answer_amount in answers))
+
+    def test_verify_leave_device_timeout(self):
+        with TerminalSimulator(1) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], timeout=0.5)
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+            self.assertIsNotNone(my_telium_instance.verify(my_payment, waiting_timeout=3))
+
+            # Nothing to wait for, custom timeout is honoured without touching device.
+            self.assertIsNone(my_telium_instance.verify(my_payment, waiting_timeout=0.2))
+            self.assertEqual(my_telium_instance.timeout, 0.5)
+
+            my_telium_instance.close()
+
+    def test_verify_wait_indefinitely(self):
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(0.8))) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], timeout=0.2)
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            # Answer come long after device timeout, None waiting timeout keep waiting for it.
+            my_answer = my_telium_instance.verify(my_payment, waiting_timeout=None)
+
+            self.assertIsNotNone(my_answer)
+            self.assertEqual(my_answer.amount, 12.5)
+
+            my_telium_instance.close()
+
+    def test_try_ask(self):
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(0.3))) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            my_future = my_telium_instance.transact(my_payment, waiting_timeout=5)
+
+            # Background reader own the link until the answer is in.
+            self.assertIsNone(my_telium_instance.try_ask(my_payment))
+
+            self.assertIsNotNone(my_future.result(timeout=5))
+            self.assertTrue(my_telium_instance.try_ask(my_payment))
+            self.assertIsNotNone(my_telium_instance.verify(my_payment, waiting_timeout=5))
+
+            my_telium_instance.close()
+
+    def test_transact_while_holding_link(self):
+        with TerminalSimulator(1) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            with my_telium_instance.link_lock:
+                with self.assertRaises(TerminalBusyException):
+                    my_telium_instance.transact(my_payment)
+
+            self.assertFalse(my_telium_instance.link_lock.locked())
+
+            my_telium_instance.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+import subprocess
+import sys
+from unittest import TestCase, main, skipUnless
+
+from pycountry import currencies
+
+from telium import *
+from telium.currency import ISO4217_NUMERIC, CurrencyResolver, alpha_to_numeric, numeric_to_alpha
+
+
+class TestCurrency(TestCase):
+
+    def test_builtin_table_match_pycountry(self):
+        for alpha_3, numeric in ISO4217_NUMERIC.items():
+            self.assertEqual(str(currencies.get(alpha_3=alpha_3).numeric).zfill(3), numeric)
+
+    def test_alpha_to_numeric(self):
+        self.assertEqual(alpha_to_numeric('eur'), '978')
+        self.assertEqual(alpha_to_numeric('USD'), '840')
+        self.assertIsNone(alpha_to_numeric('ZZZ'))
+
+    def test_resolver_both_directions(self):
+        my_resolver = CurrencyResolver(table={'EUR': '978'})
+
+        self.assertEqual(my_resolver.numeric('eur'), '978')
+        self.assertEqual(my_resolver.alpha('978'), 'EUR')
+        self.assertEqual(len(my_resolver), 1)
+
+        # Missing from table, looked up once then memoized both ways.
+        self.assertEqual(my_resolver.alpha(840), 'USD')
+        self.assertEqual(my_resolver.numeric('USD'), '840')
+        self.assertEqual(len(my_resolver), 2)
+
+        self.assertIsNone(my_resolver.numeric('ZZZ'))
+        self.assertIsNone(my_resolver.alpha('000'))
+
+        my_resolver.prewarm(['JPY', 'GBP'])
+        self.assertEqual(len(my_resolver), 4)
+
+        with self.assertRaises(KeyError):
+            my_resolver.prewarm(['EURO'])
+
+        self.assertEqual(len(CurrencyResolver(table={}).prewarm()), len(list(currencies)))
+
+    def test_resolver_restrict(self):
+        my_resolver = CurrencyResolver().restrict(['eur', 'USD'])
+
+        self.assertEqual(my_resolver.accepted, frozenset(['EUR', 'USD']))
+        self.assertEqual(my_resolver.numeric('EUR'), '978')
+        self.assertIsNone(my_resolver.numeric('GBP'))
+        self.assertIsNone(my_resolver.alpha('826'))
+
+        my_resolver.restrict()
+
+        self.assertEqual(my_resolver.numeric('GBP'), '826')
+
+        with self.assertRaises(KeyError):
+            my_resolver.restrict(['EUR', 'EURO'])
+
+    def test_currency_alpha(self):
+        my_payment = TeliumAsk.new_payment(12.5, target_currency='eur')
+        my_answer = TeliumResponse('1', TERMINAL_PAYMENT_SUCCESS, 12.5, TERMINAL_MODE_PAYMENT_DEBIT, None,
+                                   TERMINAL_NUMERIC_CURRENCY_USD, '0' * 10)
+
+        self.assertEqual(my_payment.currency_alpha, 'EUR')
+        self.assertEqual(my_payment.freeze().currency_alpha, 'EUR')
+        self.assertEqual(my_answer.currency_alpha, 'USD')
+        self.assertEqual(my_answer.freeze().currency_alpha, 'USD')
+        self.assertEqual(TeliumResponse.decode_view(my_answer.encode().encode(TERMINAL_DATA_ENCODING)).currency_alpha,
+                         'USD')
+        self.assertEqual(numeric_to_alpha(TERMINAL_NUMERIC_CURRENCY_EUR), 'EUR')
+
+    @skipUnless(sys.version_info >= (3, 7), 'AsyncTelium is imported eagerly before Python 3.7')
+    def test_import_telium_stay_light(self):
+        loaded = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys, telium; telium.TeliumAsk.new_payment(12.5, target_currency="EUR"); '
+            'print(sorted(m for m in ("pycountry", "numpy", "asyncio", "payment_card_identifier", "http.server")'
+            ' if m in sys.modules))'
+        ], universal_newlines=True)
+
+        self.assertEqual(loaded.strip(), '[]')
+
+
+if __name__ == '__main__':
+    main()
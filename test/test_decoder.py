@@ -0,0 +1,81 @@
+from unittest import TestCase, main
+
+from telium import *
+from telium.decoder import FrameDecoder
+
+
+class TestFrameDecoder(TestCase):
+
+    def setUp(self):
+        self._full_answer = TeliumResponse(
+            '1',
+            TERMINAL_PAYMENT_SUCCESS,
+            12.5,
+            TERMINAL_MODE_PAYMENT_DEBIT,
+            '0' * 55,
+            TERMINAL_NUMERIC_CURRENCY_EUR,
+            '0' * 10
+        ).encode().encode(TERMINAL_DATA_ENCODING)
+
+        self._small_answer = TeliumResponse(
+            '2',
+            TERMINAL_PAYMENT_REJECTED,
+            91.1,
+            TERMINAL_MODE_PAYMENT_DEBIT,
+            None,
+            TERMINAL_NUMERIC_CURRENCY_USD,
+            '0' * 10
+        ).encode().encode(TERMINAL_DATA_ENCODING)
+
+    def test_decode_split_chunks(self):
+        my_decoder = FrameDecoder()
+
+        for i in range(len(self._full_answer) - 1):
+            self.assertEqual(my_decoder.feed(self._full_answer[i:i + 1]), [])
+
+        self.assertTrue(my_decoder.in_frame)
+        self.assertEqual(my_decoder.buffered, len(self._full_answer) - 1)
+
+        my_answers = my_decoder.feed(self._full_answer[-1:])
+
+        self.assertEqual(len(my_answers), 1)
+        self.assertEqual(my_answers[0].amount, 12.5)
+        self.assertFalse(my_decoder.in_frame)
+
+    def test_decode_many_frames_with_garbage(self):
+        my_decoder = FrameDecoder()
+
+        my_answers = my_decoder.feed(b'\x06\x04' + self._small_answer + b'\x00' + self._full_answer)
+
+        self.assertEqual([my_answer.pos_number for my_answer in my_answers], ['02', '01'])
+        self.assertEqual(my_answers[0].transaction_result, TERMINAL_PAYMENT_REJECTED)
+
+    def test_decode_erroned_lrc(self):
+        my_decoder = FrameDecoder()
+
+        with self.assertRaises(LrcChecksumException):
+            my_decoder.feed(self._small_answer[:-1] + b'\xff')
+
+        self.assertFalse(my_decoder.in_frame)
+        self.assertEqual(len(my_decoder.feed(self._small_answer)), 1)
+
+    def test_decode_oversized_frame(self):
+        my_decoder = FrameDecoder(max_size=TERMINAL_ANSWER_LIMITED_SIZE)
+
+        with self.assertRaises(SequenceDoesNotMatchLengthException):
+            my_decoder.feed(self._full_answer)
+
+        # What was received of the rejected frame is kept for the journal.
+        self.assertTrue(self._full_answer.startswith(my_decoder.last_frame))
+        self.assertEqual(len(my_decoder.feed(self._small_answer)), 1)
+
+    def test_decode_ask(self):
+        my_payment = TeliumAsk.new_payment(55.1)
+
+        my_asks = FrameDecoder(TeliumAsk.decode).feed(my_payment.encode().encode(TERMINAL_DATA_ENCODING))
+
+        self.assertEqual(my_asks[0].amount, 55.1)
+
+
+if __name__ == '__main__':
+    main()
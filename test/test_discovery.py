@@ -0,0 +1,156 @@
+import os
+import pty
+import shutil
+import tempfile
+import threading
+from select import select
+from time import sleep
+from unittest import TestCase, main
+
+from serial import EIGHTBITS, PARITY_NONE
+
+from telium import *
+from telium.discovery import candidate_paths, LINK_8N1, LINK_7E1
+from telium.simulator import TerminalSimulator
+
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+
+
+def cross_link(data, sender_parity, receiver_parity):
+    """
+    Bytes as received on a real line whose ends may disagree on parity, 8N1 and 7E1 frames are both 10 bits long.
+    A byte with an odd number of set bits carry a parity bit, read as bit 7 by an 8N1 receiver. A 7E1 receiver whose
+    sender did not set it read NUL instead.
+    """
+    if sender_parity == receiver_parity:
+        return data
+
+    return bytes(bytearray(
+        (byte | 0x80 if sender_parity else 0x00) if bin(byte).count('1') % 2 else byte for byte in bytearray(data)
+    ))
+
+
+class ParityLine(object):
+    """
+    Serial device garbling bytes like a real line would, pseudo-terminals ignore parity altogether.
+    """
+
+    def __init__(self, device, host_parity, terminal_parity):
+        self.__dict__.update(_device=device, _host_parity=host_parity, _terminal_parity=terminal_parity)
+
+    def write(self, data):
+        return self._device.write(cross_link(data, self._host_parity, self._terminal_parity))
+
+    def read(self, size=1):
+        return cross_link(self._device.read(size), self._terminal_parity, self._host_parity)
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._device, name, value)
+
+
+class ParityAwareTelium(Telium):
+    """
+    Telium whose link garble bytes if its parity differ from the one of the terminal, 8N1 unless listed below.
+    Pseudo-terminal itself is always opened 8N1, requested parameters are only emulated.
+    """
+
+    terminals_7e1 = set()
+
+    def __init__(self, path, bytesize=EIGHTBITS, parity=PARITY_NONE, **kwargs):
+        Telium.__init__(self, path, **kwargs)
+
+        self._device = ParityLine(self._device, parity != PARITY_NONE, path in ParityAwareTelium.terminals_7e1)
+
+
+class TestDiscovery(TestCase):
+
+    def setUp(self):
+        self._master, self._slave = pty.openpty()
+        self._silent_path = os.ttyname(self._slave)
+
+    def tearDown(self):
+        os.close(self._master)
+        os.close(self._slave)
+
+    def test_candidate_paths(self):
+        directory = tempfile.mkdtemp()
+
+        try:
+            os.mkdir(os.path.join(directory, 'by-id'))
+
+            for name in ('ttyACM0', 'ttyACM1', 'ttyUSB0'):
+                open(os.path.join(directory, name), 'w').close()
+
+            os.symlink(os.path.join(directory, 'ttyACM1'), os.path.join(directory, 'by-id', 'usb-Ingenico_iCT250'))
+
+            candidates = candidate_paths((os.path.join(directory, 'by-id', '*'),
+                                          os.path.join(directory, 'ttyACM*'),
+                                          os.path.join(directory, 'ttyUSB*')))
+        finally:
+            shutil.rmtree(directory)
+
+        # Stable path is kept over the device it resolve to.
+        self.assertEqual([os.path.relpath(path, directory) for path, _ in candidates],
+                         ['by-id/usb-Ingenico_iCT250', 'ttyACM0', 'ttyUSB0'])
+
+    def test_discover(self):
+        with TerminalSimulator(2) as my_simulator:
+            started = monotonic()
+
+            terminals = discover(my_simulator.paths + [self._silent_path, '/dev/nowhere'], deadline=1.5,
+                                 probe_timeout=0.2)
+
+            elapsed = monotonic() - started
+
+            self.assertEqual(sorted(terminal.path for terminal in terminals), sorted(my_simulator.paths))
+            self.assertTrue(all(terminal.link == LINK_8N1 for terminal in terminals))
+            self.assertTrue(terminals[0].latency <= terminals[1].latency)
+
+            my_telium_instance = terminals[0].open()
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+            self.assertIsNotNone(my_telium_instance.verify(my_payment, waiting_timeout=2))
+
+            my_telium_instance.close()
+
+        # Silent device probed with both link parameters at the same time as the others.
+        self.assertLess(elapsed, 1.0)
+
+    def test_discover_parity(self):
+        with TerminalSimulator(2) as my_simulator:
+            ParityAwareTelium.terminals_7e1 = {my_simulator.paths[1]}
+
+            terminals = discover(my_simulator.paths, deadline=1.5, probe_timeout=0.2, device_class=ParityAwareTelium)
+
+        # ENQ and ACK go through whatever the parity, only the parity probe tell both links apart.
+        self.assertEqual(sorted((terminal.path, terminal.link) for terminal in terminals),
+                         [(my_simulator.paths[0], LINK_8N1), (my_simulator.paths[1], LINK_7E1)])
+
+    def test_deadline(self):
+        started = monotonic()
+
+        self.assertEqual(discover([self._silent_path], deadline=0.3, probe_timeout=2.0), [])
+        self.assertLess(monotonic() - started, 1.0)
+
+    def test_deadline_stop_probes(self):
+        # Same device given twice is probed once.
+        self.assertEqual(discover([self._silent_path, self._silent_path], deadline=0.3, probe_timeout=2.0), [])
+
+        self.assertFalse([thread for thread in threading.enumerate() if thread.name.startswith('telium-discovery-')])
+
+        # Probe gave up while waiting for ACK, next link parameters were never tried.
+        sleep(0.3)
+
+        self.assertTrue(select([self._master], [], [], 0)[0])
+        self.assertEqual(os.read(self._master, 64), b'\x05')
+
+
+if __name__ == '__main__':
+    main()
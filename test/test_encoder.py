@@ -0,0 +1,50 @@
+from unittest import TestCase, main
+
+from telium import *
+from telium.encoder import AskEncoder, encode_ask
+from telium.payment import TeliumData, IllegalAmountException
+
+
+class TestAskEncoder(TestCase):
+
+    def test_encode_same_as_telium_ask(self):
+        for amount, pos_number in [(1.0, '1'), (12.5, '1'), (0.1 + 0.2 + 55.0, '7'), (99999.99, '99')]:
+            for collect_payment_source_info in (True, False):
+                my_payment = TeliumAsk.new_payment(amount, 'credit', 'EUR', pos_number,
+                                                   collect_payment_source_info=collect_payment_source_info)
+
+                self.assertEqual(encode_ask(my_payment), my_payment.encode().encode(TERMINAL_DATA_ENCODING))
+
+    def test_encoder_reuse(self):
+        my_encoder = AskEncoder.from_ask(TeliumAsk.new_payment(1.0, target_currency='EUR'))
+
+        my_frame = my_encoder.encode(42.42, '3')
+        my_payment = TeliumAsk.decode(my_frame)
+
+        self.assertIsInstance(my_frame, bytes)
+        self.assertEqual(my_payment.amount, 42.42)
+        self.assertEqual(my_payment.pos_number, '03')
+        self.assertEqual(my_payment.currency_numeric, TERMINAL_NUMERIC_CURRENCY_EUR)
+        self.assertTrue(TeliumData.lrc_check(my_encoder.encode(10.0, '12')))
+
+        with self.assertRaises(SequenceDoesNotMatchLengthException):
+            my_encoder.encode(12.5, '123')
+
+        with self.assertRaises(SequenceDoesNotMatchLengthException):
+            AskEncoder(TERMINAL_ANSWER_SET_FULLSIZED, '0', '1', '978', 'A010', 'B01')
+
+    def test_encode_cents_illegal_amount(self):
+        my_encoder = AskEncoder.from_ask(TeliumAsk.new_payment(1.0, target_currency='EUR'))
+
+        self.assertEqual(TeliumAsk.decode(my_encoder.encode_cents(1299)).amount_cents, 1299)
+
+        for amount_cents in (-5, 12.99, 1299.0, TERMINAL_MAXIMAL_AMOUNT_CENTS + 1, True):
+            with self.assertRaises(IllegalAmountException):
+                my_encoder.encode_cents(amount_cents)
+
+        with self.assertRaises(IllegalAmountException):
+            my_encoder.encode(-5.0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+from time import sleep
+from unittest import TestCase, main
+
+from telium import *
+from telium.simulator import TerminalSimulator, SimulationProfile, constant_latency
+
+
+class TestHealth(TestCase):
+
+    def test_cached_readiness(self):
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(0.3))) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            path = my_telium_instance.path
+
+            my_monitor = HealthMonitor([my_telium_instance], interval=0.05)
+
+            self.assertFalse(my_monitor.is_ready(path))
+            self.assertIsNone(my_monitor.health(path).last_seen)
+
+            with my_monitor:
+                sleep(0.2)
+
+                self.assertTrue(my_monitor.is_ready(path))
+                self.assertTrue(my_monitor.is_ready(path, max_age=5))
+                self.assertEqual(my_monitor.ready_paths, [path])
+
+                # Probes are skipped while the transaction own the link.
+                my_future = my_telium_instance.transact(TeliumAsk.new_payment(12.5), waiting_timeout=5)
+                probes = my_simulator.stats['probes']
+
+                self.assertFalse(my_monitor.probe(my_telium_instance))
+
+                self.assertIsNotNone(my_future.result(timeout=5))
+                self.assertEqual(my_simulator.stats['probes'], probes)
+
+                sleep(0.2)
+
+                self.assertGreater(my_simulator.stats['probes'], probes)
+
+            last_seen = my_monitor.health(path).last_seen
+
+            my_telium_instance.close()
+
+            self.assertTrue(my_monitor.probe(my_telium_instance))
+
+        self.assertFalse(my_monitor.is_ready(path))
+        self.assertEqual(my_monitor.health(path).last_seen, last_seen)
+        self.assertEqual(my_monitor.health(path).failures, 1)
+        self.assertFalse(my_monitor.is_ready('/dev/nowhere'))
+
+    def test_no_probe_between_ask_and_verify(self):
+        with TerminalSimulator(1) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            with HealthMonitor([my_telium_instance], interval=0.05):
+                sleep(0.2)
+
+                self.assertTrue(my_telium_instance.ask(my_payment))
+                self.assertTrue(my_telium_instance.in_transaction)
+
+                probes = my_simulator.stats['probes']
+
+                # Link is free while customer type its PIN, monitor must leave terminal alone anyway.
+                sleep(0.3)
+
+                self.assertEqual(my_simulator.stats['probes'], probes)
+
+                my_answer = my_telium_instance.verify(my_payment, waiting_timeout=5)
+
+                self.assertIsNotNone(my_answer)
+                self.assertEqual(my_answer.amount, 12.5)
+                self.assertFalse(my_telium_instance.in_transaction)
+
+                sleep(0.2)
+
+                self.assertGreater(my_simulator.stats['probes'], probes)
+
+            my_telium_instance.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+from unittest import TestCase, main
+
+from six.moves.urllib.request import urlopen
+
+from telium import *
+from telium.instrumentation import HistogramCollector, PrometheusExporter, TeliumObserver, PHASE_HANDSHAKE, \
+    PHASE_WRITE, PHASE_WAIT, PHASE_READ, PHASE_EOT, PHASE_TOTAL, OUTCOME_OK, OUTCOME_FAILED, OUTCOME_ERROR
+from telium.simulator import TerminalSimulator, SimulationProfile, SIMULATOR_FAULT_BAD_LRC
+
+
+class RecordingObserver(TeliumObserver):
+
+    def __init__(self):
+        self.events = []
+
+    def on_phase(self, event):
+        self.events.append(event)
+
+
+class TestInstrumentation(TestCase):
+
+    def test_phases_recorded(self):
+        my_observer = RecordingObserver()
+
+        with TerminalSimulator(1) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], observer=my_observer)
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+            self.assertIsNotNone(my_telium_instance.verify(my_payment, waiting_timeout=2))
+
+            my_telium_instance.close()
+
+        self.assertEqual(
+            [(event.operation, event.phase, event.outcome, event.sent, event.received) for event in my_observer.events],
+            [
+                ('ask', PHASE_HANDSHAKE, OUTCOME_OK, 1, 1),
+                ('ask', PHASE_WRITE, OUTCOME_OK, TERMINAL_ASK_REQUIRED_SIZE + 3, 1),
+                ('ask', PHASE_TOTAL, OUTCOME_OK, TERMINAL_ASK_REQUIRED_SIZE + 5, 2),
+                ('verify', PHASE_WAIT, OUTCOME_OK, 0, 1),
+                ('verify', PHASE_READ, OUTCOME_OK, 1, TERMINAL_ANSWER_COMPLETE_SIZE),
+                ('verify', PHASE_EOT, OUTCOME_OK, 1, 1),
+                ('verify', PHASE_TOTAL, OUTCOME_OK, 2, TERMINAL_ANSWER_COMPLETE_SIZE + 2),
+            ]
+        )
+
+        self.assertTrue(all(event.duration >= 0 for event in my_observer.events))
+        self.assertEqual(my_observer.events[2].started, my_observer.events[0].started)
+
+    def test_histogram_and_prometheus(self):
+        my_collector = HistogramCollector()
+
+        # Both simulators live at the same time so that their pseudo-terminals get distinct paths.
+        with TerminalSimulator(1) as my_simulator, \
+                TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_BAD_LRC: 1.0})) as my_faulty_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], observer=my_collector)
+
+            for _ in range(10):
+                my_payment = TeliumAsk.new_payment(12.5)
+
+                self.assertTrue(my_telium_instance.ask(my_payment))
+                self.assertIsNotNone(my_telium_instance.verify(my_payment, waiting_timeout=2))
+
+            my_telium_instance.close()
+
+            my_telium_instance = Telium(my_faulty_simulator.paths[0], observer=my_collector)
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            with self.assertRaises(LrcChecksumException):
+                my_telium_instance.verify(my_payment, waiting_timeout=2)
+
+            my_telium_instance.close()
+
+        my_snapshot = my_collector.snapshot()
+        path, faulty_path = my_simulator.paths[0], my_faulty_simulator.paths[0]
+
+        self.assertEqual(sum(my_snapshot[(path, 'ask', PHASE_TOTAL, OUTCOME_OK)][0]), 10)
+        self.assertEqual(sum(my_snapshot[(faulty_path, 'verify', PHASE_TOTAL, OUTCOME_ERROR)][0]), 1)
+        self.assertNotIn((path, 'verify', PHASE_TOTAL, OUTCOME_FAILED), my_snapshot)
+
+        my_exporter = PrometheusExporter(my_collector).serve(port=0)
+
+        try:
+            my_metrics = urlopen('http://127.0.0.1:{0}/metrics'.format(my_exporter.port)).read().decode('utf-8')
+        finally:
+            my_exporter.close()
+
+        self.assertIn('# TYPE telium_phase_duration_seconds histogram', my_metrics)
+        self.assertIn('telium_phase_duration_seconds_count{{device="{0}",operation="ask",phase="total",'
+                      'outcome="ok"}} 10'.format(path), my_metrics)
+        self.assertIn('le="+Inf"', my_metrics)
+        self.assertIn('telium_phase_bytes_sent_total{{device="{0}",operation="ask",phase="write",'
+                      'outcome="ok"}} 370'.format(path), my_metrics)
+
+        metrics_path = os.path.join(tempfile.mkdtemp(), 'telium.prom')
+        my_exporter.write(metrics_path)
+
+        with open(metrics_path) as metrics_file:
+            self.assertEqual(metrics_file.read(), my_exporter.render())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+from unittest import TestCase, main
+
+import os
+import shutil
+import tempfile
+
+from telium import *
+from telium.simulator import TerminalSimulator, SimulationProfile, SIMULATOR_FAULT_BAD_LRC
+from test.test_tpe import FakeTeliumDevice
+
+
+class TestTransactionJournal(TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._path = os.path.join(self._directory, 'telium.journal')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def test_journal_append_and_read(self):
+        my_journal = TransactionJournal(self._path, flush_interval=0.01)
+
+        for i in range(5000):
+            my_journal.append(JOURNAL_DIRECTION_OUT if i % 2 else JOURNAL_DIRECTION_IN, b'\x02' + str(i).encode() + b'\x03', 1000.0 + i)
+
+        self.assertEqual(len(my_journal), 5000)
+
+        my_records = list(my_journal)
+
+        self.assertEqual(len(my_records), 5000)
+        self.assertEqual(my_records[4999], JournalRecord(5999.0, JOURNAL_DIRECTION_OUT, b'\x024999\x03'))
+
+        my_journal.close()
+
+        # Reopen and keep appending
+        my_journal = TransactionJournal(self._path)
+        my_journal.append(JOURNAL_DIRECTION_IN, b'\x02last\x03')
+        my_journal.close()
+
+        my_records = TransactionJournal.read(self._path)
+
+        self.assertEqual(next(my_records).data, b'\x020\x03')
+        self.assertEqual(list(my_records)[-1].data, b'\x02last\x03')
+
+        with self.assertRaises(ValueError):
+            my_journal.append(JOURNAL_DIRECTION_IN, b'\x02closed\x03')
+
+    def test_journal_oversized_frame(self):
+        my_journal = TransactionJournal(self._path)
+
+        my_journal.append(JOURNAL_DIRECTION_IN, b'\x02' + b'0' * (JOURNAL_FRAME_SIZE - 2) + b'\x03')
+
+        with self.assertRaises(ValueError):
+            my_journal.append(JOURNAL_DIRECTION_IN, b'\x02' + b'0' * (JOURNAL_FRAME_SIZE - 1) + b'\x03')
+
+        self.assertEqual(len(my_journal), 1)
+
+        my_journal.close()
+
+        self.assertEqual([len(my_record.data) for my_record in TransactionJournal.read(self._path)],
+                         [JOURNAL_FRAME_SIZE])
+
+    def test_journal_not_supported(self):
+        with open(self._path, 'wb') as file_object:
+            file_object.write(b'\x00' * 32)
+
+        with self.assertRaises(JournalCorruptedException):
+            TransactionJournal(self._path)
+
+    def test_journal_transaction(self):
+        my_fake_device = FakeTeliumDevice()
+        my_fake_device.run_instance()
+
+        my_journal = TransactionJournal(self._path)
+        my_telium_instance = Telium(my_fake_device.s_name, journal=my_journal)
+
+        my_payment = TeliumAsk.new_payment(12.5, target_currency='EUR')
+
+        self.assertTrue(my_telium_instance.ask(my_payment))
+        my_answer = my_telium_instance.verify(my_payment)
+
+        my_telium_instance.close()
+        my_journal.close()
+
+        my_ask_record, my_answer_record = TransactionJournal.read(self._path)
+
+        self.assertEqual(my_ask_record.direction, JOURNAL_DIRECTION_OUT)
+        self.assertEqual(my_ask_record.data, my_payment.encode().encode(TERMINAL_DATA_ENCODING))
+        self.assertEqual(my_answer_record.direction, JOURNAL_DIRECTION_IN)
+        self.assertEqual(TeliumResponse.decode(my_answer_record.data).to_dict(), my_answer.to_dict())
+
+    def test_journal_rejected_answer(self):
+        my_journal = TransactionJournal(self._path)
+
+        with TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_BAD_LRC: 1.0})) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], journal=my_journal, retry_policy=RetryPolicy())
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+            my_answer = my_telium_instance.verify(my_payment, waiting_timeout=2)
+
+            my_telium_instance.close()
+
+        my_journal.close()
+
+        my_ask_record, my_rejected_record, my_answer_record = TransactionJournal.read(self._path)
+
+        # Corrupted answer refused with NAK is kept along with the one sent again.
+        self.assertEqual(my_rejected_record.direction, JOURNAL_DIRECTION_IN)
+        self.assertEqual(my_rejected_record.data[:-1], my_answer_record.data[:-1])
+        self.assertNotEqual(my_rejected_record.data[-1:], my_answer_record.data[-1:])
+        self.assertEqual(TeliumResponse.decode(my_answer_record.data).to_dict(), my_answer.to_dict())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+from functools import reduce
+from operator import xor
+from os import urandom
+from unittest import TestCase, main
+
+from telium import *
+from telium.lrc import lrc, lrc_check, lrc_check_many, LrcAccumulator, LRC_MAX_FOLD
+
+
+class TestLrc(TestCase):
+
+    def test_lrc_same_as_byte_by_byte(self):
+        for data_len in list(range(0, 40)) + [81, LRC_MAX_FOLD, LRC_MAX_FOLD + 1, 1000]:
+            data = bytearray(urandom(data_len))
+
+            self.assertEqual(lrc(data), reduce(xor, data, 0))
+            self.assertEqual(lrc(memoryview(data)), reduce(xor, data, 0))
+
+        self.assertEqual(lrc('012'), 0x33)
+
+        with self.assertRaises(TypeError):
+            lrc(1234)
+
+    def test_lrc_incremental(self):
+        data = urandom(200)
+        my_accumulator = LrcAccumulator()
+
+        for start in range(0, 200, 7):
+            my_accumulator.update(data[start:start + 7])
+
+        self.assertEqual(my_accumulator.value, lrc(data))
+        self.assertEqual(lrc(data[50:], lrc(data[:50])), lrc(data))
+
+        my_accumulator.reset()
+        self.assertEqual(my_accumulator.value, 0)
+
+    def test_lrc_check_many(self):
+        my_answer = TeliumResponse('1', TERMINAL_PAYMENT_SUCCESS, 12.5, TERMINAL_MODE_PAYMENT_DEBIT, None,
+                                   TERMINAL_NUMERIC_CURRENCY_EUR, '0' * 10)
+        frame = bytearray(my_answer.encode().encode(TERMINAL_DATA_ENCODING))
+        corrupted = frame[:-1] + bytearray([frame[-1] ^ 0x01])
+
+        self.assertTrue(lrc_check(frame))
+        self.assertFalse(lrc_check(corrupted))
+
+        self.assertEqual(list(lrc_check_many(bytes(frame + corrupted + frame), len(frame))), [True, False, True])
+
+        with self.assertRaises(ValueError):
+            lrc_check_many(bytes(frame[:-1]), len(frame))
+
+
+if __name__ == '__main__':
+    main()
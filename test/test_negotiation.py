@@ -0,0 +1,101 @@
+import json
+import os
+import pty
+import shutil
+import tempfile
+from unittest import TestCase, main
+
+from telium import *
+from telium.discovery import LINK_8N1, LINK_7E1
+from telium.negotiation import device_key
+from telium.simulator import TerminalSimulator
+from test.test_discovery import ParityAwareTelium
+
+
+class TestNegotiation(TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._cache_path = os.path.join(self._directory, 'telium', 'links.json')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def test_negotiate_then_cached(self):
+        with TerminalSimulator(1) as my_simulator:
+            path = my_simulator.paths[0]
+
+            my_terminal = negotiate(path, LinkCache(self._cache_path), probe_timeout=0.2)
+
+            self.assertEqual((my_terminal.link, my_terminal.baudrate), (LINK_8N1, 9600))
+            self.assertIsNotNone(my_terminal.latency)
+
+            probes = my_simulator.stats['probes']
+
+            # A later start read the cache file, terminal is not probed again.
+            my_cached_terminal = negotiate(path, LinkCache(self._cache_path))
+
+            self.assertEqual(my_simulator.stats['probes'], probes)
+            self.assertIsNone(my_cached_terminal.latency)
+            self.assertEqual(my_cached_terminal[:7], my_terminal[:7])
+
+            my_telium_instance = open_negotiated(path, LinkCache(self._cache_path))
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+            self.assertIsNotNone(my_telium_instance.verify(my_payment, waiting_timeout=2))
+
+            my_telium_instance.close()
+
+        with open(self._cache_path) as cache_file:
+            content = json.load(cache_file)
+
+        self.assertEqual(list(content['links']), [device_key(path)])
+        self.assertEqual(device_key(path), 'path:{0}'.format(os.path.realpath(path)))
+
+    def test_negotiate_parity(self):
+        with TerminalSimulator(1) as my_simulator:
+            path = my_simulator.paths[0]
+            ParityAwareTelium.terminals_7e1 = {path}
+
+            # ENQ/ACK answer with 8N1 too, only parameters that pass the parity probe are cached.
+            my_terminal = negotiate(path, LinkCache(self._cache_path), baudrates=(9600,), probe_timeout=0.2,
+                                    device_class=ParityAwareTelium)
+
+        self.assertEqual(my_terminal.link, LINK_7E1)
+        self.assertEqual(LinkCache(self._cache_path).get(device_key(path))['link'], LINK_7E1)
+
+    def test_silent_entry_kept(self):
+        master, slave = pty.openpty()
+        path = os.ttyname(slave)
+
+        try:
+            my_cache = LinkCache(self._cache_path)
+            my_cache.put(device_key(path), DiscoveredTerminal(path, path, LINK_8N1, 9600, 8, 'N', 1, 0.01))
+
+            self.assertEqual(LinkCache(self._cache_path).get(device_key(path))['link'], LINK_8N1)
+
+            # Cached parameters are trusted, port is opened without writing anything to terminal.
+            my_telium_instance = open_negotiated(path, my_cache, timeout=0.05)
+
+            self.assertEqual(my_telium_instance.bytes_sent, 0)
+            my_telium_instance.close()
+
+            # Nobody answer behind this pseudo-terminal for now, it may only be busy or switched off.
+            self.assertIsNone(open_negotiated(path, my_cache, verify=True, timeout=0.05))
+            self.assertEqual(LinkCache(self._cache_path).get(device_key(path))['link'], LINK_8N1)
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    def test_corrupted_cache(self):
+        os.makedirs(os.path.dirname(self._cache_path))
+
+        with open(self._cache_path, 'w') as cache_file:
+            cache_file.write('{not json')
+
+        self.assertIsNone(LinkCache(self._cache_path).get('path:/dev/ttyACM0'))
+
+
+if __name__ == '__main__':
+    main()
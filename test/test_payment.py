@@ -1,5 +1,6 @@
+from decimal import Decimal
 from unittest import TestCase, main
-from telium.payment import TeliumData
+from telium.payment import TeliumData, IllegalAmountException
 from telium import *
 
 
@@ -173,6 +174,128 @@ class TestTPE(TestCase):
         self.assertEqual(my_payment_restored.delay, my_payment.delay, 'delay is not equal from original to decoded')
         self.assertEqual(my_payment_restored.currency_numeric, my_payment.currency_numeric, 'currency_numeric is not equal from original to decoded')
 
+    def test_telium_answer_decode_view(self):
+
+        my_answers = [
+            TeliumResponse(
+                '1',
+                TERMINAL_PAYMENT_SUCCESS,
+                12.5,
+                TERMINAL_MODE_PAYMENT_DEBIT,
+                '4' * 16 + ' ' * 39,
+                TERMINAL_NUMERIC_CURRENCY_EUR,
+                '0123456789'
+            ),
+            TeliumResponse(
+                '12',
+                TERMINAL_PAYMENT_REJECTED,
+                99999.99,
+                TERMINAL_MODE_PAYMENT_CREDIT,
+                None,
+                TERMINAL_NUMERIC_CURRENCY_USD,
+                '0' * 10
+            )
+        ]
+
+        my_raw_answers = [bytearray(my_answer.encode(), TERMINAL_DATA_ENCODING) for my_answer in my_answers]
+
+        for my_answer, my_view in zip(my_answers, TeliumResponse.decode_many(my_raw_answers)):
+            self.assertIsInstance(my_view, TeliumResponseView)
+            self.assertEqual(my_view.pos_number, my_answer.pos_number)
+            self.assertEqual(my_view.transaction_result, my_answer.transaction_result)
+            self.assertEqual(my_view.has_succeeded, my_answer.has_succeeded)
+            self.assertEqual(my_view.amount, my_answer.amount)
+            self.assertEqual(my_view.payment_mode, my_answer.payment_mode)
+            self.assertEqual(my_view.repport, my_answer.repport)
+            self.assertEqual(my_view.currency_numeric, my_answer.currency_numeric)
+            self.assertEqual(my_view.transaction_id, my_answer.transaction_id)
+            self.assertEqual(my_view.to_response().__dict__, my_answer.__dict__)
+
+        self.assertEqual(
+            [my_answer.amount for my_answer in TeliumResponse.decode_many(my_raw_answers, lazy=False)],
+            [12.5, 99999.99]
+        )
+
+        with self.assertRaises(LrcChecksumException):
+            TeliumResponse.decode_view(my_raw_answers[0][:-1] + b'\x00')
+
+        with self.assertRaises(SequenceDoesNotMatchLengthException):
+            TeliumResponse.decode_view(my_raw_answers[0][:-2])
+
+
+    def test_telium_freeze(self):
+
+        my_payment = TeliumAsk.new_payment(55.1, target_currency='EUR')
+        my_frozen_payment = my_payment.freeze()
+
+        self.assertIsInstance(my_frozen_payment, FrozenTeliumAsk)
+        self.assertFalse(hasattr(my_frozen_payment, '__dict__'))
+        self.assertEqual(my_frozen_payment.to_dict(), my_payment.to_dict())
+        self.assertEqual(my_frozen_payment.encode(), my_payment.encode())
+
+        with self.assertRaises(AttributeError):
+            my_frozen_payment.amount = 10.0
+
+        # Amount is stored in cents, exactly as encoded in the frame.
+        self.assertEqual(my_frozen_payment._fields[-1], 'amount_cents')
+        self.assertEqual(my_frozen_payment.amount_cents, 5510)
+        self.assertEqual(my_frozen_payment.amount, 55.1)
+        self.assertEqual(my_frozen_payment.thaw().amount_cents, 5510)
+
+        my_answer = TeliumResponse(
+            '1',
+            TERMINAL_PAYMENT_SUCCESS,
+            12.5,
+            TERMINAL_MODE_PAYMENT_DEBIT,
+            '4111111111111111' + ' ' * 39,
+            TERMINAL_NUMERIC_CURRENCY_EUR,
+            '0' * 10
+        )
+
+        my_frozen_answer = my_answer.freeze()
+
+        self.assertIsInstance(my_frozen_answer, FrozenTeliumResponse)
+        self.assertEqual(my_frozen_answer.to_dict(), my_answer.to_dict())
+        self.assertEqual(my_frozen_answer.to_dict(), my_answer.__dict__)
+        self.assertEqual(my_frozen_answer.card_id_sha512, my_answer.card_id_sha512)
+        self.assertEqual(my_frozen_answer.thaw().to_dict(), my_answer.to_dict())
+        self.assertEqual(
+            TeliumResponse.decode_view(bytes(my_answer.encode(), TERMINAL_DATA_ENCODING) if six.PY3 else bytes(my_answer.encode())).freeze(),
+            my_frozen_answer
+        )
+
+    def test_telium_amount_cents(self):
+
+        my_payment = TeliumAsk.new_payment(None, target_currency='EUR', amount_cents=1250)
+
+        self.assertEqual(my_payment.amount, 12.5)
+        self.assertEqual(my_payment.amount_cents, 1250)
+        self.assertEqual(my_payment.encode(), TeliumAsk.new_payment(12.5, target_currency='EUR').encode())
+        self.assertEqual(TeliumAsk.decode(my_payment.encode().encode(TERMINAL_DATA_ENCODING)).amount_cents, 1250)
+
+        self.assertEqual(TeliumAsk.new_payment(Decimal('0.29') + Decimal('1.00')).amount_cents, 129)
+        self.assertEqual(TeliumAsk.new_payment(1.29).amount_cents, 129)
+        self.assertEqual(TeliumAsk.new_payment(99999.99).amount_cents, 9999999)
+
+        for amount in [1.299, 0.99, 100000.0, float('nan'), float('inf'), Decimal('1.001'), 10, '10.0']:
+            self.assertFalse(TeliumData.is_amount_valid(amount))
+
+            with self.assertRaises(IllegalAmountException):
+                TeliumAsk.new_payment(amount)
+
+        for amount_cents in [99, 10000000, 100.0, True]:
+            with self.assertRaises(IllegalAmountException):
+                TeliumAsk.new_payment(None, amount_cents=amount_cents)
+
+        my_answer = TeliumResponse('1', TERMINAL_PAYMENT_SUCCESS, None, TERMINAL_MODE_PAYMENT_DEBIT, None,
+                                   TERMINAL_NUMERIC_CURRENCY_EUR, '0' * 10, amount_cents=9999999)
+        my_raw_answer = my_answer.encode().encode(TERMINAL_DATA_ENCODING)
+
+        self.assertEqual(TeliumResponse.decode(my_raw_answer).amount_cents, 9999999)
+        self.assertEqual(TeliumResponse.decode(my_raw_answer).amount, 99999.99)
+        self.assertEqual(TeliumResponse.decode_view(my_raw_answer).amount_cents, 9999999)
+        self.assertEqual(my_answer.freeze().amount_cents, 9999999)
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+from threading import enumerate as enumerate_threads
+from unittest import TestCase, main
+
+from telium import *
+from telium.discovery import LINK_8N1, LINK_7E1
+from telium.simulator import TerminalSimulator
+from test.test_discovery import ParityAwareTelium
+from test.test_tpe import FakeTeliumDevice
+
+
+class TestTerminalPool(TestCase):
+
+    def setUp(self):
+        self._fake_devices = [FakeTeliumDevice(), FakeTeliumDevice()]
+
+    def test_pool_route_by_pos_number(self):
+
+        my_pool = TerminalPool(
+            paths=[self._fake_devices[0].s_name],
+            lanes={'2': self._fake_devices[1].s_name}
+        )
+
+        self.assertEqual(len(my_pool), 2)
+
+        my_payment = TeliumAsk.new_payment(12.5, checkout_unique_id='2')
+
+        self.assertEqual(my_pool.route(my_payment).device.path, self._fake_devices[1].s_name)
+        self.assertEqual(my_pool.route(TeliumAsk.new_payment(12.5)).device.path, self._fake_devices[0].s_name)
+
+        my_pool.close()
+
+    def test_pool_transact(self):
+
+        for fake_device in self._fake_devices:
+            fake_device.run_instance()
+
+        my_pool = TerminalPool(paths=[fake_device.s_name for fake_device in self._fake_devices])
+
+        my_futures = [
+            my_pool.submit(TeliumAsk.new_payment(12.5, target_currency='EUR')),
+            my_pool.submit(TeliumAsk.new_payment(91.1, target_currency='EUR'))
+        ]
+
+        # Each fake device handle a single transaction, both must have been spread across idle terminals
+        my_answers = [my_future.result(timeout=10) for my_future in my_futures]
+
+        self.assertEqual([my_answer.amount for my_answer in my_answers], [12.5, 91.1])
+        self.assertTrue(all(terminal.is_idle for terminal in my_pool.terminals))
+
+        my_pool.close()
+
+    def test_pool_failed_open_cleanup(self):
+        opened = []
+
+        class RecordingTelium(Telium):
+
+            def __init__(self, path, **kwargs):
+                Telium.__init__(self, path, **kwargs)
+                opened.append(self)
+
+        with self.assertRaises(IOError):
+            TerminalPool(paths=[self._fake_devices[0].s_name, '/dev/nowhere'], device_class=RecordingTelium)
+
+        # First link was opened then closed again, its worker is gone.
+        self.assertEqual(len(opened), 1)
+        self.assertFalse(opened[0].is_open)
+        self.assertNotIn('telium-pool-{0}'.format(self._fake_devices[0].s_name),
+                         [thread.name for thread in enumerate_threads()])
+
+    def test_pool_discovered_link(self):
+        with TerminalSimulator(2) as my_simulator:
+            ParityAwareTelium.terminals_7e1 = {my_simulator.paths[1]}
+
+            my_terminals = discover(my_simulator.paths, deadline=1.5, probe_timeout=0.2,
+                                    device_class=ParityAwareTelium)
+            my_pool = TerminalPool(paths=my_terminals, lanes={'2': my_simulator.paths[1]},
+                                   device_class=ParityAwareTelium, timeout=0.5)
+
+            self.assertEqual(sorted(terminal.link for terminal in my_terminals), [LINK_7E1, LINK_8N1])
+
+            # 7E1 terminal is opened with its own framing, an 8N1 link would get no answer from it.
+            my_answer = my_pool.transact(TeliumAsk.new_payment(12.5, checkout_unique_id='2'), waiting_timeout=2)
+
+            self.assertEqual(my_pool.route(TeliumAsk.new_payment(12.5, checkout_unique_id='2')).device.path,
+                             my_simulator.paths[1])
+            self.assertEqual(my_answer.amount_cents, 1250)
+
+            my_pool.close()
+
+    def test_pool_empty(self):
+
+        with self.assertRaises(TerminalPoolEmptyException):
+            TerminalPool(paths=[]).transact(TeliumAsk.new_payment(12.5))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import random
+from unittest import TestCase, main
+
+from telium import *
+from telium.payment import LrcChecksumException
+from telium.simulator import TerminalSimulator, SimulationProfile, SIMULATOR_FAULT_BAD_LRC, SIMULATOR_FAULT_NAK
+
+
+class TestRetry(TestCase):
+
+    def test_backoff_bounds(self):
+        my_policy = RetryPolicy(retries=5, backoff_base_ms=10, backoff_max_ms=50, rng=random.Random(0))
+
+        for retry, ceiling in enumerate((0.01, 0.02, 0.04, 0.05, 0.05, 0.05)):
+            delays = [my_policy.backoff(retry) for _ in range(200)]
+
+            self.assertTrue(all(0 <= delay <= ceiling for delay in delays))
+            self.assertGreater(max(delays), ceiling / 2)
+
+        with self.assertRaises(ValueError):
+            RetryPolicy(backoff_base_ms=100, backoff_max_ms=10)
+
+    def test_nak_resend_same_frame(self):
+        with TerminalSimulator(2, SimulationProfile(faults={SIMULATOR_FAULT_NAK: 1.0})) as my_simulator:
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            my_telium_instance = Telium(my_simulator.paths[0])
+
+            self.assertFalse(my_telium_instance.ask(my_payment))
+
+            my_telium_instance.close()
+
+            my_telium_instance = Telium(my_simulator.paths[1], retry_policy=RetryPolicy())
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+            self.assertEqual(my_telium_instance.retransmissions, 1)
+            self.assertEqual(my_telium_instance.verify(my_payment, waiting_timeout=2).amount_cents, 1250)
+
+            frames = [record.data for record in my_telium_instance.ring.records() if len(record.data) > 1]
+
+            my_telium_instance.close()
+
+        # Request sent twice byte for byte, then the answer.
+        self.assertEqual(frames[0], frames[1])
+        self.assertEqual(len(frames), 3)
+
+    def test_bad_lrc_nak_then_reread(self):
+        with TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_BAD_LRC: 1.0})) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], retry_policy=RetryPolicy(retries=1))
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            my_answer = my_telium_instance.verify(my_payment, waiting_timeout=2)
+
+            self.assertEqual(my_answer.amount_cents, 1250)
+            self.assertEqual(my_telium_instance.retransmissions, 1)
+            self.assertTrue(my_telium_instance.is_ok())
+
+            my_telium_instance.close()
+
+    def test_retries_exhausted(self):
+        with TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_BAD_LRC: 1.0})) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], retry_policy=RetryPolicy(retries=0))
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            with self.assertRaises(LrcChecksumException):
+                my_telium_instance.verify(my_payment, waiting_timeout=2)
+
+            my_telium_instance.close()
+
+
+if __name__ == '__main__':
+    main()
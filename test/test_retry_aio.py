@@ -0,0 +1,33 @@
+import asyncio
+from unittest import TestCase, main
+
+from telium import *
+from telium.simulator import TerminalSimulator, SimulationProfile, SIMULATOR_FAULT_BAD_LRC, SIMULATOR_FAULT_NAK
+
+
+class TestRetryAsync(TestCase):
+
+    def test_retry_async(self):
+        my_loop = asyncio.new_event_loop()
+        my_profile = SimulationProfile(faults={SIMULATOR_FAULT_NAK: 1.0, SIMULATOR_FAULT_BAD_LRC: 1.0})
+
+        with TerminalSimulator(1, my_profile) as my_simulator:
+            my_telium_instance = AsyncTelium(my_simulator.paths[0], retry_policy=RetryPolicy())
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            async def transaction():
+                self.assertTrue(await my_telium_instance.ask(my_payment))
+                return await my_telium_instance.verify(my_payment, waiting_timeout=2)
+
+            my_answer = my_loop.run_until_complete(transaction())
+
+            my_telium_instance.close()
+
+        my_loop.close()
+
+        self.assertEqual(my_answer.amount_cents, 1250)
+        self.assertEqual(my_telium_instance.retransmissions, 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+from unittest import TestCase, main
+
+from telium import *
+from telium.simulator import TerminalSimulator, SimulationProfile, uniform_latency, SIMULATOR_FAULT_NAK, \
+    SIMULATOR_FAULT_BAD_LRC, SIMULATOR_FAULT_MISSING_EOT
+
+
+class TestTerminalSimulator(TestCase):
+
+    def _transact(self, profile, count, seed=0):
+        results = []
+
+        with TerminalSimulator(1, profile, seed) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], timeout=0.5)
+
+            for i in range(count):
+                my_payment = TeliumAsk.new_payment(10.0 + i, target_currency='EUR',
+                                                   collect_payment_source_info=i % 2 == 0)
+
+                self.assertTrue(my_telium_instance.ask(my_payment))
+                results.append(my_telium_instance.verify(my_payment, waiting_timeout=2))
+
+            self.assertTrue(my_telium_instance.is_ok())
+
+            my_telium_instance.close()
+
+        # Terminal threads are joined once the simulator is stopped, every counter is settled.
+        return results, my_simulator.stats
+
+    def test_simulator_outcomes_deterministic(self):
+        my_profile = SimulationProfile(latency=uniform_latency(0.0, 0.002), approval_ratio=0.5, decline_ratio=0.3)
+
+        my_answers, my_stats = self._transact(my_profile, 20)
+        my_replayed_answers, _ = self._transact(my_profile, 20)
+
+        self.assertEqual([my_answer.to_dict() for my_answer in my_answers],
+                         [my_answer.to_dict() for my_answer in my_replayed_answers])
+
+        self.assertEqual(my_stats['transactions'], 20)
+        self.assertEqual(my_stats['approved'] + my_stats['declined'] + my_stats['not_verified'], 20)
+        self.assertEqual(my_stats['probes'], 1)
+        self.assertEqual(my_answers[0].card_type.name, 'VISA')
+        self.assertEqual(my_answers[1].repport, '')
+        self.assertEqual([my_answer.amount for my_answer in my_answers], [10.0 + i for i in range(20)])
+        self.assertEqual([my_answer.amount_cents for my_answer in my_answers], [1000 + 100 * i for i in range(20)])
+
+    def test_simulator_many_terminals(self):
+        with TerminalSimulator(4) as my_simulator:
+            my_pool = TerminalPool(my_simulator.paths)
+
+            my_futures = [my_pool.submit(TeliumAsk.new_payment(12.5)) for _ in range(40)]
+
+            self.assertTrue(all(my_future.result(timeout=10).has_succeeded for my_future in my_futures))
+
+            my_pool.close()
+
+            self.assertEqual(my_simulator.stats['approved'], 40)
+            self.assertTrue(all(terminal.stats['transactions'] > 0 for terminal in my_simulator.terminals))
+
+    def test_simulator_faults(self):
+        with TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_NAK: 1.0})) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            self.assertFalse(my_telium_instance.ask(TeliumAsk.new_payment(12.5)))
+            my_telium_instance.close()
+
+        with TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_BAD_LRC: 1.0})) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            with self.assertRaises(LrcChecksumException):
+                my_telium_instance.verify(my_payment)
+
+            my_telium_instance.close()
+
+        with TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_MISSING_EOT: 1.0})) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0], timeout=0.2)
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            with self.assertRaises(TerminalUnexpectedAnswerException):
+                my_telium_instance.verify(my_payment, waiting_timeout=1)
+
+            my_telium_instance.close()
+
+        self.assertEqual(my_simulator.stats['faults'], 1)
+
+
+if __name__ == '__main__':
+    main()
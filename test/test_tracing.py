@@ -0,0 +1,172 @@
+import logging
+from unittest import TestCase, main
+
+from telium import *
+from telium.hexdump import format_hexdump
+from telium.journal import JOURNAL_DIRECTION_OUT, JOURNAL_DIRECTION_IN
+from telium.payment import LrcChecksumException
+from telium.simulator import TerminalSimulator, SimulationProfile, SIMULATOR_FAULT_BAD_LRC
+from telium.tracing import TRACE_LOGGER_NAME, format_records, load_records
+
+
+class CountingRecord(object):
+
+    def __init__(self):
+        self.renders = 0
+
+    def __str__(self):
+        self.renders += 1
+        return 'rendered'
+
+
+class CollectingHandler(logging.Handler):
+
+    def __init__(self):
+        super(CollectingHandler, self).__init__(logging.DEBUG)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestTracing(TestCase):
+
+    def test_format_hexdump(self):
+        self.assertEqual(
+            format_hexdump(b'\x02ABC\x03'),
+            '00000000:  {0:<48}  |.ABC.|'.format('02 41 42 43 03')
+        )
+
+        self.assertEqual(len(format_hexdump(b'0' * 40).splitlines()), 3)
+        self.assertEqual(format_hexdump(u'A\xe9', sep='#')[-4:], '|A#|')
+
+    def test_ring_keeps_last_records(self):
+        my_tracer = ProtocolTracer('/dev/null', ring_size=3, logger=logging.getLogger('telium.trace.test.ring'))
+
+        for i in range(5):
+            my_tracer.sent(bytes(bytearray([i])))
+
+        my_tracer.received(b'')
+
+        self.assertEqual([record.data for record in my_tracer.records], [b'\x03', b'\x04', b''])
+        self.assertEqual(my_tracer.records[-1].direction, JOURNAL_DIRECTION_IN)
+        self.assertEqual(my_tracer.records[0].direction, JOURNAL_DIRECTION_OUT)
+        self.assertEqual(len(my_tracer.dump().splitlines()), 3)
+        self.assertIn('<-- Nothing 0 byte(s)', my_tracer.dump())
+
+        my_tracer.clear()
+
+        self.assertEqual(my_tracer.records, [])
+
+    def test_lazy_formatting(self):
+        my_logger = logging.getLogger('telium.trace.test.lazy')
+        my_handler = CollectingHandler()
+        my_record = CountingRecord()
+
+        my_logger.addHandler(my_handler)
+        my_logger.propagate = False
+
+        my_logger.setLevel(logging.INFO)
+        my_logger.debug('%s', my_record)
+
+        self.assertEqual(my_record.renders, 0)
+
+        my_logger.setLevel(logging.DEBUG)
+        ProtocolTracer('/dev/null', logger=my_logger).sent(b'\x05')
+
+        self.assertEqual(my_handler.messages, ['/dev/null --> ENQ 1 byte(s)'])
+
+        my_logger.removeHandler(my_handler)
+
+    def test_exchange_traced(self):
+        my_handler = CollectingHandler()
+        my_logger = logging.getLogger(TRACE_LOGGER_NAME)
+        my_logger.addHandler(my_handler)
+        previous_level = my_logger.level
+        my_logger.setLevel(logging.DEBUG)
+
+        try:
+            with TerminalSimulator(1) as my_simulator:
+                my_tracer = ProtocolTracer(my_simulator.paths[0])
+                my_telium_instance = Telium(my_simulator.paths[0], tracer=my_tracer)
+                my_payment = TeliumAsk.new_payment(12.5)
+
+                self.assertTrue(my_telium_instance.ask(my_payment))
+                self.assertIsNotNone(my_telium_instance.verify(my_payment, waiting_timeout=2))
+
+                my_telium_instance.close()
+        finally:
+            my_logger.removeHandler(my_handler)
+            my_logger.setLevel(previous_level)
+
+        self.assertIs(my_telium_instance.tracer, my_tracer)
+
+        sent = b''.join(record.data for record in my_tracer.records if record.direction == JOURNAL_DIRECTION_OUT)
+        received = b''.join(record.data for record in my_tracer.records if record.direction == JOURNAL_DIRECTION_IN)
+
+        self.assertEqual(len(sent), my_telium_instance.bytes_sent)
+        self.assertEqual(len(received), my_telium_instance.bytes_received)
+        self.assertEqual(len(my_handler.messages), len(my_tracer.records))
+        self.assertIn('--> ENQ 1 byte(s)', my_handler.messages[0])
+
+    def test_no_tracer_unless_debugging(self):
+        with TerminalSimulator(1) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+
+            self.assertIsNone(my_telium_instance.tracer)
+
+            my_telium_instance.close()
+
+    def test_byte_ring_wraps(self):
+        my_ring = ByteRing(capacity=8, segments=3)
+
+        my_ring.append(JOURNAL_DIRECTION_OUT, b'\x05')
+        my_ring.append(JOURNAL_DIRECTION_IN, b'\x06')
+
+        self.assertEqual([(record.direction, record.data) for record in my_ring.records()],
+                         [(JOURNAL_DIRECTION_OUT, b'\x05'), (JOURNAL_DIRECTION_IN, b'\x06')])
+
+        my_ring.append(JOURNAL_DIRECTION_OUT, b'ABCDEF')
+        my_ring.append(JOURNAL_DIRECTION_IN, b'GHI')
+
+        # Oldest segment is dropped, next one lost its first bytes to the new ones.
+        self.assertEqual([record.data for record in my_ring.records()], [b'BCDEF', b'GHI'])
+        self.assertEqual(len(my_ring), 8)
+
+        my_ring.append(JOURNAL_DIRECTION_IN, b'0123456789')
+
+        self.assertEqual([record.data for record in my_ring.records()], [b'23456789'])
+
+        my_ring.append(JOURNAL_DIRECTION_IN, b'')
+
+        self.assertEqual([record.data for record in my_ring.records()], [b'23456789', b''])
+        self.assertEqual(load_records(my_ring.binary()), my_ring.records())
+        self.assertEqual(my_ring.hexdump(), format_records(my_ring.records()))
+
+        my_ring.clear()
+
+        self.assertEqual(my_ring.records(), [])
+
+    def test_exception_records(self):
+        with TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_BAD_LRC: 1.0})) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            self.assertTrue(my_telium_instance.ask(my_payment))
+
+            with self.assertRaises(LrcChecksumException) as context:
+                my_telium_instance.verify(my_payment, waiting_timeout=2)
+
+            my_telium_instance.close()
+
+        records = context.exception.records
+
+        self.assertEqual(sum(len(record.data) for record in records),
+                         my_telium_instance.bytes_sent + my_telium_instance.bytes_received)
+        self.assertEqual(records[0].data, b'\x05')
+        self.assertIn('<-- Chunk', format_records(records))
+        self.assertEqual(my_telium_instance.ring.records(), records)
+
+
+if __name__ == '__main__':
+    main()
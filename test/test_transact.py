@@ -0,0 +1,57 @@
+from threading import Event
+from unittest import TestCase, main
+
+from telium import *
+from telium.payment import LrcChecksumException
+from telium.simulator import TerminalSimulator, SimulationProfile, SIMULATOR_FAULT_BAD_LRC, constant_latency
+
+
+class TestTransact(TestCase):
+
+    def test_transact_overlaps_wait(self):
+        done, seen = Event(), []
+
+        def on_done(future):
+            seen.append(future.result())
+            done.set()
+
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(0.3))) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+            my_payment = TeliumAsk.new_payment(12.5)
+
+            my_future = my_telium_instance.transact(my_payment, waiting_timeout=5, callback=on_done)
+
+            # Terminal is still "waiting for customer", host keep control meanwhile.
+            self.assertFalse(my_future.done())
+            self.assertIs(my_telium_instance.pending_transaction, my_future)
+
+            with self.assertRaises(TerminalBusyException):
+                my_telium_instance.transact(my_payment)
+
+            my_answer = my_future.result(timeout=5)
+
+            self.assertTrue(done.wait(5))
+            self.assertIsNone(my_telium_instance.pending_transaction)
+
+            # Link is free again once the answer is in.
+            self.assertIsNotNone(my_telium_instance.transact(my_payment, waiting_timeout=5).result(timeout=5))
+
+            my_telium_instance.close()
+
+        self.assertEqual(my_answer.transaction_result, TERMINAL_PAYMENT_SUCCESS)
+        self.assertEqual(my_answer.amount_cents, 1250)
+        self.assertEqual(seen, [my_answer])
+
+    def test_transact_error(self):
+        with TerminalSimulator(1, SimulationProfile(faults={SIMULATOR_FAULT_BAD_LRC: 1.0})) as my_simulator:
+            my_telium_instance = Telium(my_simulator.paths[0])
+
+            my_future = my_telium_instance.transact(TeliumAsk.new_payment(12.5), waiting_timeout=2)
+
+            self.assertIsInstance(my_future.exception(timeout=5), LrcChecksumException)
+
+            my_telium_instance.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import asyncio
+from unittest import TestCase, main
+
+from telium import *
+from telium.simulator import TerminalSimulator, SimulationProfile, constant_latency
+
+
+class TestTransactAsync(TestCase):
+
+    def test_transact_async(self):
+        my_loop = asyncio.new_event_loop()
+
+        with TerminalSimulator(1, SimulationProfile(latency=constant_latency(0.2))) as my_simulator:
+            my_telium_instance = AsyncTelium(my_simulator.paths[0])
+
+            async def transaction():
+                my_task = await my_telium_instance.transact(TeliumAsk.new_payment(12.5), waiting_timeout=5)
+
+                self.assertFalse(my_task.done())
+
+                with self.assertRaises(TerminalBusyException):
+                    await my_telium_instance.transact(TeliumAsk.new_payment(12.5))
+
+                return await my_task
+
+            my_answer = my_loop.run_until_complete(transaction())
+
+            my_telium_instance.close()
+
+        my_loop.close()
+
+        self.assertEqual(my_answer.transaction_result, TERMINAL_PAYMENT_SUCCESS)
+
+
+if __name__ == '__main__':
+    main()